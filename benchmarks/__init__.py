@@ -0,0 +1,6 @@
+"""
+파서 성능 벤치마크 패키지
+합성 DART 문서로 파서 처리량(MB/s)과 최대 메모리를 측정하고 기준값과 비교합니다.
+
+    python -m benchmarks.bench_parsers
+"""
@@ -0,0 +1,439 @@
+"""
+파서 벤치마크
+합성 DART 문서(benchmarks.corpus)로 parse()와 각 extract_* 함수의 처리량(MB/s)과 최대 메모리(RSS)를 측정
+
+문서 종류/크기마다 새 프로세스에서 측정하여 최대 RSS가 다른 측정의 영향을 받지 않도록 하고,
+기준값 파일과 비교하여 처리량이 기준보다 threshold 이상 낮거나 파싱 중 RSS 증가량이 threshold 이상 높으면 실패(종료 코드 1)
+
+    python -m benchmarks.bench_parsers                      # 측정 후 기준값과 비교
+    python -m benchmarks.bench_parsers --save-baseline      # 측정 결과를 기준값으로 저장
+    python -m benchmarks.bench_parsers --profile earnings --size 1M --size 10M --repeat 5
+    python -m benchmarks.bench_parsers --self-check         # 기준값 비교가 빠른 문서의 성능 저하를 잡아내는지만 확인
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import math
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional
+
+# 패키지 밖(python benchmarks/bench_parsers.py)에서 실행해도 저장소 모듈을 import할 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import metrics
+from benchmarks.corpus import DEFAULT_SEED, DEFAULT_SIZES, PROFILES, corpus_path
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baselines.json')
+CORPUS_DIR = os.getenv('DART_BENCH_CORPUS_DIR', os.path.join('.dart_state', 'bench_corpus'))
+
+# 기준 대비 허용 성능 저하 비율 (0.25: 처리량 25% 감소 또는 최대 RSS 25% 증가까지 허용)
+DEFAULT_THRESHOLD = float(os.getenv('DART_BENCH_THRESHOLD', '0.25'))
+DEFAULT_REPEAT = 7
+# 측정 1건의 제한 시간 (초)
+CASE_TIMEOUT = 900
+# 반복 1회의 최소 측정 시간 (초)
+# parse()가 이보다 빠른 문서는 반복 1회에 여러 번 파싱하여 이 시간을 넘기고,
+# 반복 1회 안의 누적 시간이 이보다 짧은 함수는 스케줄링/타이머 잡음이 커서 처리량을 비교하지 않음
+MIN_COMPARE_SECONDS = 0.1
+
+MB = 1024 ** 2
+SIZE_UNITS = {'K': 1024, 'M': MB, 'G': 1024 ** 3}
+
+
+def parse_size(text: str) -> int:
+    """크기 문자열을 바이트로 변환 (예: 100K, 1M, 50M, 4096)"""
+    text = text.strip().upper().rstrip('B')
+    if text and text[-1] in SIZE_UNITS:
+        return int(float(text[:-1]) * SIZE_UNITS[text[-1]])
+    return int(text)
+
+
+def format_size(size: int) -> str:
+    """바이트를 크기 문자열로 변환 (기준값 파일의 키로 사용)"""
+    for suffix, unit in (('G', 1024 ** 3), ('M', MB), ('K', 1024)):
+        if size >= unit and size % unit == 0:
+            return f"{size // unit}{suffix}"
+    return str(size)
+
+
+def _peak_rss_mb() -> float:
+    """
+    현재 프로세스의 최대 RSS (MB)
+
+    ru_maxrss는 fork 시 부모 프로세스(문서를 생성한 측정 실행기)의 값을 이어받으므로,
+    exec 후 새로 시작하는 /proc/self/status의 VmHWM을 우선 사용
+    """
+    try:
+        with open('/proc/self/status', 'r') as f:
+            for line in f:
+                if line.startswith('VmHWM:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    # Linux의 ru_maxrss 단위는 KB
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def measure(module_name: str, path: str, repeat: int) -> Dict:
+    """
+    현재 프로세스에서 문서 1개를 repeat번 파싱하여 측정 (측정용 하위 프로세스에서 실행)
+
+    첫 파싱(예열) 시간으로 반복 1회가 MIN_COMPARE_SECONDS 이상 걸리도록 반복 1회의 파싱 횟수(loops)를 정하고,
+    parse()는 반복별 파싱 1회 평균 시간의 중앙값을, extract_* 함수는 파서가 기록하는
+    dart_extract_seconds 지표에서 반복별 호출당 평균 시간의 중앙값을 사용
+    (가장 빠른 값은 한 번의 운 좋은 실행에 좌우되어 기준값이 흔들림)
+    """
+    module = importlib.import_module(module_name)
+    with open(path, 'rb') as f:
+        content = f.read()
+    size_mb = len(content) / MB
+
+    # 첫 실행 전 RSS (인터프리터 + 모듈 + 문서 바이트)
+    rss_before = _peak_rss_mb()
+    metrics.drain()
+
+    # 파서의 진행/오류 출력은 측정 결과(JSON 출력)와 섞이지 않도록 버림
+    with contextlib.redirect_stdout(io.StringIO()):
+        start = time.perf_counter()
+        parsed = module.parse(content)
+        warmup = time.perf_counter() - start
+    metrics.drain()
+    loops = max(1, math.ceil(MIN_COMPARE_SECONDS / warmup)) if warmup else 1
+
+    timings = []
+    # 함수 이름 → 반복별 (호출당 평균 시간, 파싱 1회당 호출 수)
+    function_runs: Dict[str, List] = {}
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            for _ in range(loops):
+                parsed = module.parse(content)
+            timings.append((time.perf_counter() - start) / loops)
+
+        for histogram in metrics.drain()['histograms']:
+            if histogram['name'] != 'dart_extract_seconds' or not histogram['count']:
+                continue
+            function_runs.setdefault(histogram['labels']['function'], []).append(
+                (histogram['sum'] / histogram['count'], histogram['count'] // loops)
+            )
+
+    functions = {}
+    for name, runs in function_runs.items():
+        seconds = statistics.median(run[0] for run in runs)
+        functions[name] = {
+            'seconds': round(seconds, 6),
+            'calls': max(run[1] for run in runs),
+            'mb_s': round(size_mb / seconds, 2) if seconds else None
+        }
+
+    median = statistics.median(timings)
+    peak_rss = _peak_rss_mb()
+    return {
+        'bytes': len(content),
+        'parsed': parsed is not None,
+        'parse_seconds': round(median, 6),
+        'parse_mb_s': round(size_mb / median, 2) if median else None,
+        'loops': loops,
+        'peak_rss_mb': round(peak_rss, 1),
+        'rss_growth_mb': round(peak_rss - rss_before, 1),
+        'functions': functions
+    }
+
+
+def run_case(profile: str, size: int, repeat: int, corpus_dir: str = CORPUS_DIR, seed: int = DEFAULT_SEED) -> Optional[Dict]:
+    """문서 종류/크기 1건을 새 프로세스에서 측정 (실패 시 None)"""
+    module_name = PROFILES[profile][0]
+    path = os.path.abspath(corpus_path(corpus_dir, profile, size, seed))
+
+    command = [sys.executable, '-m', 'benchmarks.bench_parsers', '--measure', module_name, path, '--repeat', str(repeat)]
+    try:
+        completed = subprocess.run(command, cwd=ROOT_DIR, capture_output=True, text=True, timeout=CASE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        print(f"  ✗ {profile}/{format_size(size)}: 제한 시간({CASE_TIMEOUT}초) 초과")
+        return None
+
+    if completed.returncode != 0:
+        print(f"  ✗ {profile}/{format_size(size)}: 측정 프로세스 오류\n{completed.stderr.strip()}")
+        return None
+
+    try:
+        return json.loads(completed.stdout.strip().splitlines()[-1])
+    except (IndexError, json.JSONDecodeError) as e:
+        print(f"  ✗ {profile}/{format_size(size)}: 측정 결과 읽기 오류: {e}")
+        return None
+
+
+def compare(results: Dict[str, Dict], baseline: Dict[str, Dict], threshold: float) -> List[str]:
+    """
+    기준값과 비교하여 성능 저하 목록 반환
+
+    처리량(parse()와 extract_* 함수)이 기준의 (1 - threshold)배보다 낮거나
+    최대 RSS 증가량이 기준의 (1 + threshold)배보다 높으면 성능 저하로 판단
+    (이번 측정의 반복 1회 안에서 누적 시간이 MIN_COMPARE_SECONDS보다 짧은 함수는 비교하지 않음,
+    parse()는 반복 1회가 그 이상 걸리도록 여러 번 파싱하므로 빠른 문서도 항상 비교)
+    """
+    regressions = []
+
+    for case, result in results.items():
+        base = baseline.get(case)
+        if not base:
+            continue
+
+        # (이름, 측정 처리량, 기준 처리량, 이번 측정의 반복 1회 누적 시간 (None이면 항상 비교))
+        # 기준값의 시간은 쓰지 않음 (기준이 빨랐던 문서일수록 느려졌을 때 비교에서 빠지면 안 됨)
+        loops = result.get('loops', 1)
+        throughputs = [('parse', result.get('parse_mb_s'), base.get('parse_mb_s'), None)]
+        for name, measured in result.get('functions', {}).items():
+            base_function = base.get('functions', {}).get(name)
+            if base_function:
+                throughputs.append((
+                    name,
+                    measured['mb_s'],
+                    base_function['mb_s'],
+                    measured['seconds'] * measured.get('calls', 1) * loops
+                ))
+
+        for name, measured, expected, seconds in throughputs:
+            if not measured or not expected or (seconds is not None and seconds < MIN_COMPARE_SECONDS):
+                continue
+            if measured < expected * (1 - threshold):
+                regressions.append(
+                    f"{case} {name}: {measured:.1f} MB/s (기준 {expected:.1f} MB/s, {measured / expected - 1:+.0%})"
+                )
+
+        # 인터프리터/모듈 메모리는 제외하고 파싱 중 증가량으로 비교 (작은 문서의 잡음 방지를 위해 최소 16MB 허용)
+        measured_rss, expected_rss = result.get('rss_growth_mb'), base.get('rss_growth_mb')
+        if measured_rss is not None and expected_rss is not None:
+            if measured_rss > max(expected_rss * (1 + threshold), expected_rss + 16):
+                regressions.append(f"{case} 메모리: +{measured_rss:.1f} MB (기준 +{expected_rss:.1f} MB)")
+
+    return regressions
+
+
+def self_check(threshold: float = DEFAULT_THRESHOLD) -> List[str]:
+    """
+    compare()가 빠른 문서의 성능 저하를 잡아내는지 확인 (문제 목록 반환, 비어 있으면 통과)
+
+    MIN_COMPARE_SECONDS보다 빠른 기준값에 2배 느려진 측정값을 만들어 비교하여 성능 저하로 보고되는지,
+    같은 측정값은 보고되지 않는지 확인
+    """
+    base = {
+        'parse_seconds': 0.016,
+        'parse_mb_s': 6.25,
+        'loops': 7,
+        'rss_growth_mb': 2.0,
+        'functions': {'extract_table_financial_data': {'seconds': 0.015, 'calls': 1, 'mb_s': 6.67}}
+    }
+    slower = {
+        'parse_seconds': 0.032,
+        'parse_mb_s': 3.12,
+        'loops': 4,
+        'rss_growth_mb': 2.0,
+        'functions': {'extract_table_financial_data': {'seconds': 0.03, 'calls': 1, 'mb_s': 3.33}}
+    }
+
+    problems = []
+    regressions = compare({'self_check/100K': slower}, {'self_check/100K': base}, threshold)
+    for name in ('parse', 'extract_table_financial_data'):
+        if not any(regression.startswith(f"self_check/100K {name}:") for regression in regressions):
+            problems.append(f"{name} 2배 성능 저하를 보고하지 않음")
+    if compare({'self_check/100K': base}, {'self_check/100K': base}, threshold):
+        problems.append("기준값과 같은 측정값을 성능 저하로 보고함")
+    return problems
+
+
+def load_baseline(path: str) -> Dict[str, Dict]:
+    if not os.path.exists(path):
+        return {}
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f).get('cases', {})
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"기준값 파일 읽기 오류: {e}")
+        return {}
+
+
+def save_baseline(path: str, results: Dict[str, Dict]) -> None:
+    """측정 결과를 기준값으로 저장 (기존 파일의 다른 문서 종류/크기 기준값은 유지)"""
+    cases = load_baseline(path)
+    cases.update(results)
+
+    data = {
+        'machine': {
+            'platform': platform.platform(),
+            'python': platform.python_version(),
+            'cpu_count': os.cpu_count()
+        },
+        'cases': dict(sorted(cases.items()))
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write('\n')
+
+
+def print_result(case: str, result: Dict) -> None:
+    print(
+        f"  {case:<24} {result['bytes'] / MB:8.2f} MB  parse {result['parse_seconds'] * 1000:9.1f} ms"
+        f"  {result['parse_mb_s'] or 0:8.1f} MB/s  최대 RSS {result['peak_rss_mb']:7.1f} MB (+{result['rss_growth_mb']:.1f})"
+        + ("" if result['parsed'] else "  [파싱 결과 없음]")
+    )
+    for name, function in sorted(result['functions'].items(), key=lambda item: -item[1]['seconds']):
+        print(f"      {name:<36} {function['seconds'] * 1000:9.2f} ms  {function['mb_s'] or 0:10.1f} MB/s")
+
+
+def main(
+    profiles: List[str],
+    sizes: List[int],
+    repeat: int = DEFAULT_REPEAT,
+    baseline_path: str = BASELINE_PATH,
+    threshold: float = DEFAULT_THRESHOLD,
+    update_baseline: bool = False,
+    output_path: Optional[str] = None,
+    corpus_dir: str = CORPUS_DIR
+) -> int:
+    """
+    벤치마크 실행
+
+    Returns:
+        종료 코드 (0: 통과, 1: 성능 저하 또는 측정 실패)
+    """
+    print(f"파서 벤치마크 (반복 {repeat}회, 문서 보관 위치: {corpus_dir})")
+
+    results = {}
+    failed = False
+    for profile in profiles:
+        print(f"\n[{profile}] {PROFILES[profile][1]}")
+        for size in sizes:
+            case = f"{profile}/{format_size(size)}"
+            result = run_case(profile, size, repeat, corpus_dir)
+            if result is None:
+                failed = True
+                continue
+            results[case] = result
+            print_result(case, result)
+
+    if output_path:
+        with open(output_path, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    if update_baseline:
+        save_baseline(baseline_path, results)
+        print(f"\n기준값 저장: {baseline_path} ({len(results)}건)")
+        return 1 if failed else 0
+
+    baseline = load_baseline(baseline_path)
+    if not baseline:
+        print(f"\n기준값 파일이 없습니다: {baseline_path} (--save-baseline으로 생성)")
+        return 1 if failed else 0
+
+    problems = self_check(threshold)
+    if problems:
+        print(f"\n✗ 비교 자체 점검 실패: {', '.join(problems)}")
+        return 1
+
+    regressions = compare(results, baseline, threshold)
+    if regressions:
+        print(f"\n✗ 성능 저하 {len(regressions)}건 (허용 {threshold:.0%}):")
+        for regression in regressions:
+            print(f"  - {regression}")
+        return 1
+
+    compared = sum(1 for case in results if case in baseline)
+    print(f"\n✓ 기준값 대비 성능 저하 없음 ({compared}건 비교, 허용 {threshold:.0%})")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="파서 벤치마크 (합성 DART 문서)")
+    arg_parser.add_argument(
+        "--profile",
+        dest="profiles",
+        action="append",
+        choices=list(PROFILES),
+        help="측정할 문서 종류 (여러 번 지정 가능, 기본값: 전체)"
+    )
+    arg_parser.add_argument(
+        "--size",
+        dest="sizes",
+        action="append",
+        type=parse_size,
+        help=f"문서 크기 (예: 100K, 1M, 50M, 여러 번 지정 가능, 기본값: {', '.join(format_size(size) for size in DEFAULT_SIZES)})"
+    )
+    arg_parser.add_argument(
+        "--repeat",
+        type=int,
+        default=DEFAULT_REPEAT,
+        help=f"문서당 반복 파싱 횟수 (기본값: {DEFAULT_REPEAT})"
+    )
+    arg_parser.add_argument(
+        "--baseline",
+        default=BASELINE_PATH,
+        help="기준값 파일 경로 (기본값: benchmarks/baselines.json)"
+    )
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f"허용 성능 저하 비율 (기본값: {DEFAULT_THRESHOLD}, 환경 변수 DART_BENCH_THRESHOLD)"
+    )
+    arg_parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="비교하지 않고 측정 결과를 기준값 파일에 저장"
+    )
+    arg_parser.add_argument(
+        "--output",
+        help="측정 결과 JSON 저장 경로"
+    )
+    arg_parser.add_argument(
+        "--corpus-dir",
+        default=CORPUS_DIR,
+        help=f"생성한 합성 문서 보관 디렉토리 (기본값: {CORPUS_DIR})"
+    )
+    arg_parser.add_argument(
+        "--self-check",
+        action="store_true",
+        help="측정하지 않고 기준값 비교가 빠른 문서의 2배 성능 저하를 잡아내는지만 확인"
+    )
+    arg_parser.add_argument(
+        "--measure",
+        nargs=2,
+        metavar=("MODULE", "PATH"),
+        help=argparse.SUPPRESS
+    )
+    args = arg_parser.parse_args()
+
+    if args.self_check:
+        problems = self_check(args.threshold)
+        for problem in problems:
+            print(f"✗ {problem}")
+        if not problems:
+            print("✓ 비교 자체 점검 통과 (빠른 문서의 2배 성능 저하 보고)")
+        sys.exit(1 if problems else 0)
+
+    if args.measure:
+        # 측정용 하위 프로세스: 결과를 JSON 한 줄로 출력
+        print(json.dumps(measure(args.measure[0], args.measure[1], args.repeat)))
+        sys.exit(0)
+
+    sys.exit(main(
+        profiles=args.profiles or list(PROFILES),
+        sizes=args.sizes or list(DEFAULT_SIZES),
+        repeat=args.repeat,
+        baseline_path=args.baseline,
+        threshold=args.threshold,
+        update_baseline=args.save_baseline,
+        output_path=args.output,
+        corpus_dir=args.corpus_dir
+    ))
@@ -0,0 +1,217 @@
+"""
+벤치마크용 합성 DART 공시 문서 생성 모듈
+DART 원문과 같은 DOCUMENT/SECTION/TABLE/TD 마크업으로 지정한 크기의 실적/유상증자 문서를 생성
+(네트워크 없이 실행, 같은 시드면 같은 문서)
+"""
+
+import os
+import random
+from typing import Callable, Dict, List, Optional, Tuple
+
+# 문서 종류 → (파서 모듈, 설명)
+PROFILES: Dict[str, Tuple[str, str]] = {
+    'earnings': ('parsers.parser_earnings', '요약재무정보/손익계산서가 문서 앞쪽에 있는 분기보고서'),
+    'earnings_late': ('parsers.parser_earnings', '손익계산서가 재무상태표/주석 표 뒤에 있는 분기보고서 (문서 전체 스캔)'),
+    'earnings_text': ('parsers.parser_earnings', '손익 표가 없는 분기보고서 (원문 정규식 검색)'),
+    'rights_issue': ('parsers.parser_rights_issue', '유상증자결정 주요사항보고서 (전체 표 색인)'),
+}
+
+DEFAULT_SIZES = (100 * 1024, 1024 ** 2, 10 * 1024 ** 2, 50 * 1024 ** 2)
+DEFAULT_SEED = 20240101
+
+# 채움 표/문단에 쓰는 계정과목 (손익 항목명과 겹치지 않도록 재무상태표/현금흐름표 계정만 사용)
+FILLER_ACCOUNTS = [
+    '유동자산', '현금및현금성자산', '단기금융상품', '매출채권', '미수금', '선급비용', '재고자산',
+    '비유동자산', '유형자산', '무형자산', '사용권자산', '이연법인세자산', '자산총계',
+    '유동부채', '매입채무', '단기차입금', '미지급금', '선수금', '예수금', '유동성장기부채',
+    '비유동부채', '사채', '장기차입금', '장기미지급금', '순확정급여부채', '부채총계',
+    '자본금', '주식발행초과금', '이익잉여금', '기타자본항목', '비지배지분', '자본총계',
+    '영업활동현금흐름', '투자활동현금흐름', '재무활동현금흐름', '감가상각비', '무형자산상각비',
+]
+FILLER_SENTENCES = [
+    '당사는 보고기간 종료일 현재 종속기업에 대한 지배력을 보유하고 있습니다.',
+    '연결재무제표는 한국채택국제회계기준에 따라 작성되었습니다.',
+    '회사는 금융상품의 공정가치를 측정하기 위하여 관측가능한 시장 정보를 사용합니다.',
+    '리스부채는 리스개시일 현재 지급되지 않은 리스료의 현재가치로 측정합니다.',
+    '회사의 경영진은 재무위험관리 정책을 주기적으로 검토하고 있습니다.',
+    '보고기간 중 손상차손으로 인식한 금액은 다음과 같습니다.',
+]
+
+
+def _amount(rng: random.Random, digits: int = 9) -> str:
+    """천단위 콤마 금액 (일부는 음수 표기)"""
+    value = rng.randrange(10 ** (digits - 3), 10 ** digits)
+    text = f"{value:,}"
+    roll = rng.random()
+    if roll < 0.05:
+        return f"({text})"
+    if roll < 0.08:
+        return f"△{text}"
+    return text
+
+
+def _table(rows: List[List[Optional[str]]], header: List[str], unit: str = '백만원') -> str:
+    """DART 표 마크업 (단위 문구 + TABLE/TR/TH/TD, 행 이름이 None이면 위 행 이름 셀에 병합)"""
+    parts = [f'<P>(단위 : {unit})</P>', '<TABLE BORDER="1" WIDTH="600"><THEAD><TR>']
+    parts.extend(f'<TH ALIGN="CENTER">{cell}</TH>' for cell in header)
+    parts.append('</TR></THEAD><TBODY>')
+    for number, row in enumerate(rows):
+        parts.append('<TR>')
+        if row[0] is not None:
+            # 행 이름이 None인 다음 행들은 이 행 이름 셀에 병합
+            span = 1
+            while number + span < len(rows) and rows[number + span][0] is None:
+                span += 1
+            rowspan = f' ROWSPAN="{span}"' if span > 1 else ''
+            parts.append(f'<TD ALIGN="LEFT"{rowspan}>{row[0]}</TD>')
+        parts.extend(f'<TE ALIGN="RIGHT">{cell}</TE>' for cell in row[1:])
+        parts.append('</TR>')
+    parts.append('</TBODY></TABLE>')
+    return ''.join(parts)
+
+
+def _filler_table(rng: random.Random, rows: int = 24) -> str:
+    accounts = rng.sample(FILLER_ACCOUNTS, min(rows, len(FILLER_ACCOUNTS)))
+    body = [[account, _amount(rng), _amount(rng)] for account in accounts]
+    return _table(body, ['과목', '제 56 기 1분기말', '제 55 기말'])
+
+
+def _filler_section(rng: random.Random, number: int, tables: int) -> str:
+    parts = [f'<SECTION-2><TITLE ATOC="Y">{number}. 재무제표 주석</TITLE>']
+    for _ in range(tables):
+        parts.append('<P>' + ' '.join(rng.choices(FILLER_SENTENCES, k=4)) + '</P>')
+        parts.append(_filler_table(rng))
+    parts.append('</SECTION-2>')
+    return ''.join(parts)
+
+
+def _income_statement(rng: random.Random) -> str:
+    rows = [
+        ['매출액', _amount(rng, 8), _amount(rng, 8), _amount(rng, 8), _amount(rng, 8)],
+        ['매출원가', _amount(rng, 7), _amount(rng, 7), _amount(rng, 7), _amount(rng, 7)],
+        ['매출총이익', _amount(rng, 7), _amount(rng, 7), _amount(rng, 7), _amount(rng, 7)],
+        ['영업이익', _amount(rng, 7), _amount(rng, 7), _amount(rng, 7), _amount(rng, 7)],
+        ['법인세비용차감전순이익', _amount(rng, 7), _amount(rng, 7), _amount(rng, 7), _amount(rng, 7)],
+        ['당기순이익', _amount(rng, 7), _amount(rng, 7), _amount(rng, 7), _amount(rng, 7)],
+    ]
+    header = ['과목', '제 56 기 1분기 3개월', '제 56 기 1분기 누적', '제 55 기 1분기 3개월', '제 55 기 1분기 누적']
+    return (
+        '<SECTION-2><TITLE ATOC="Y">2. 연결손익계산서</TITLE>'
+        + _table(rows, header)
+        + '</SECTION-2>'
+    )
+
+
+def _document(title: str, company: str, head: str, blocks: Callable[[int], str], tail: str, size: int) -> str:
+    """앞부분 + 채움 블록 반복 + 뒷부분으로 size 바이트(UTF-8)가 넘을 때까지 문서 생성"""
+    opening = (
+        '<?xml version="1.0" encoding="utf-8"?>'
+        f'<DOCUMENT><DOCUMENT-NAME ACODE="11013">{title}</DOCUMENT-NAME>'
+        f'<COMPANY-NAME AREGCIK="00126380">{company}</COMPANY-NAME><BODY>'
+    )
+    closing = '</BODY></DOCUMENT>'
+
+    parts = [opening, head]
+    total = sum(len(part.encode('utf-8')) for part in (opening, head, tail, closing))
+    number = 1
+    while total < size:
+        block = blocks(number)
+        parts.append(block)
+        total += len(block.encode('utf-8'))
+        number += 1
+    parts.extend([tail, closing])
+    return ''.join(parts)
+
+
+def earnings_document(size: int, layout: str = 'front', tables_per_section: int = 4, seed: int = DEFAULT_SEED) -> str:
+    """
+    분기보고서 문서 생성
+
+    Args:
+        size: 목표 크기 (바이트, UTF-8 기준 최소 크기)
+        layout: 'front'(손익 표가 앞쪽), 'late'(손익 표가 맨 뒤), 'text'(손익 표 없이 본문 문장만)
+        tables_per_section: 채움 섹션 하나에 들어가는 표 수
+        seed: 난수 시드
+    """
+    rng = random.Random(seed)
+    head = (
+        '<SECTION-1><TITLE ATOC="Y">I. 회사의 개요</TITLE>'
+        '<P>삼성전자주식회사 2024년 1분기 분기보고서</P>'
+        '<P>제 56 기 1분기 (2024.01.01 부터 2024.03.31 까지)</P>'
+        '</SECTION-1>'
+    )
+    tail = ''
+
+    if layout == 'front':
+        head += _income_statement(rng)
+    elif layout == 'late':
+        tail = _income_statement(rng)
+    elif layout == 'text':
+        head += (
+            f'<P>당분기 연결 기준 매출액은 {_amount(rng, 8)}백만원, 영업이익은 {_amount(rng, 7)}백만원, '
+            f'당기순이익은 {_amount(rng, 7)}백만원을 기록하였습니다.</P>'
+        )
+    else:
+        raise ValueError(f"알 수 없는 layout: {layout}")
+
+    return _document(
+        '분기보고서', '삼성전자', head,
+        lambda number: _filler_section(rng, number, tables_per_section),
+        tail, size
+    )
+
+
+def rights_issue_document(size: int, seed: int = DEFAULT_SEED) -> str:
+    """유상증자결정 주요사항보고서 생성 (결정 표 뒤에 첨부 표가 반복)"""
+    rng = random.Random(seed)
+    decision_rows = [
+        ['1. 신주의 종류와 수', '보통주식 (주)', '12,000,000'],
+        [None, '기타주식 (주)', '-'],
+        ['2. 1주당 액면가액 (원)', '500', ''],
+        ['3. 증자전 발행주식총수 (주)', '보통주식 (주)', '85,000,000'],
+        ['4. 자금조달의 목적', '시설자금 (원)', '30,000,000,000'],
+        [None, '운영자금 (원)', '12,000,000,000'],
+        [None, '채무상환자금 (원)', '8,000,000,000'],
+        ['5. 증자방식', '주주배정후 실권주 일반공모', ''],
+        ['6. 신주 발행가액', '보통주식 (원)', '4,170'],
+        ['7. 신주배정기준일', '2024년 03월 15일', ''],
+        ['8. 신주의 상장 예정일', '2024년 05월 10일', ''],
+    ]
+    head = (
+        '<SECTION-1><TITLE ATOC="Y">유상증자 결정</TITLE>'
+        '<P>주요사항보고서(유상증자결정)</P><P>회사명 : 주식회사 에이비씨바이오</P>'
+        + _table(decision_rows, ['구분', '내용', '금액'], unit='원')
+        + '</SECTION-1>'
+    )
+    return _document(
+        '주요사항보고서(유상증자결정)', '에이비씨바이오', head,
+        lambda number: _filler_section(rng, number, 2),
+        '', size
+    )
+
+
+def generate(profile: str, size: int, seed: int = DEFAULT_SEED) -> bytes:
+    """문서 종류와 크기로 문서 바이트 생성"""
+    if profile == 'earnings':
+        text = earnings_document(size, 'front', seed=seed)
+    elif profile == 'earnings_late':
+        text = earnings_document(size, 'late', seed=seed)
+    elif profile == 'earnings_text':
+        text = earnings_document(size, 'text', seed=seed)
+    elif profile == 'rights_issue':
+        text = rights_issue_document(size, seed=seed)
+    else:
+        raise ValueError(f"알 수 없는 문서 종류: {profile}")
+    return text.encode('utf-8')
+
+
+def corpus_path(directory: str, profile: str, size: int, seed: int = DEFAULT_SEED) -> str:
+    """생성한 문서를 디렉토리에 보관하고 경로 반환 (같은 종류/크기/시드는 다시 만들지 않음)"""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"{profile}-{size}-{seed}.html")
+    if not os.path.exists(path):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(generate(profile, size, seed))
+        os.replace(tmp_path, path)
+    return path
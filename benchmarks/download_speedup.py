@@ -0,0 +1,171 @@
+"""
+동시 다운로드 속도 향상 측정
+로컬 DART 모의 서버(benchmarks.mock_dart)에 문서 응답 지연을 주고 dart_api_async.get_disclosure_detail_many로
+같은 공시 묶음을 동시 다운로드 수를 바꿔 가며 받아, 순차 다운로드 대비 속도 향상이 동시 다운로드 수에
+거의 비례하는지(효율 = 속도 향상 / 동시 다운로드 수) 확인
+
+    python -m benchmarks.download_speedup
+    python -m benchmarks.download_speedup --documents 64 --document-latency-ms 100 --concurrency 1 --concurrency 4 --concurrency 16
+    python -m benchmarks.download_speedup --check   # 빠른 자동 확인 (문서 16건, 동시 수 1/4)
+
+효율이 --min-efficiency보다 낮거나, 모의 서버가 받은 최대 동시 문서 요청 수가 지정한 동시 다운로드 수를
+넘은 경우가 있으면 종료 코드 1
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+from typing import Dict, List
+
+# 패키지 밖(python benchmarks/download_speedup.py)에서 실행해도 저장소 모듈을 import할 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import dart_api
+import dart_api_async
+from benchmarks.mock_dart import MockDart, MockDartServer, corp_code_of
+
+DEFAULT_DOCUMENTS = 48
+DEFAULT_DOCUMENT_LATENCY_MS = 100.0
+DEFAULT_DOCUMENT_SIZE = 32 * 1024
+DEFAULT_CONCURRENCY = (1, 2, 4, 8, 16)
+# 동시 다운로드 수 대비 최소 속도 향상 비율
+DEFAULT_MIN_EFFICIENCY = 0.7
+# --check 설정 (문서 수, 응답 지연(밀리초), 동시 다운로드 수)
+CHECK_DOCUMENTS = 16
+CHECK_DOCUMENT_LATENCY_MS = 50.0
+CHECK_CONCURRENCY = (1, 4)
+
+
+def document_rcept_nos(dart: MockDart, count: int) -> List[str]:
+    """모의 서버의 기업별 공시 목록에서 접수번호 count개"""
+    rcept_nos = []
+    index = 0
+    while len(rcept_nos) < count:
+        rcept_nos.extend(row['rcept_no'] for row in dart.filings(corp_code_of(index)))
+        index += 1
+    return rcept_nos[:count]
+
+
+async def download_all(rcept_nos: List[str], concurrency: int) -> int:
+    """모든 문서를 받고 받은 문서 수 반환"""
+    received = 0
+    async for _, content in dart_api_async.get_disclosure_detail_many(rcept_nos, concurrency, raw=True):
+        if content:
+            received += 1
+    return received
+
+
+def measure(dart: MockDart, rcept_nos: List[str], concurrency: int) -> Dict:
+    """동시 다운로드 수 1개의 소요 시간과 모의 서버가 받은 최대 동시 문서 요청 수 측정"""
+    dart.peak_in_flight('document.xml', reset=True)
+    start = time.perf_counter()
+    received = asyncio.run(download_all(rcept_nos, concurrency))
+    seconds = time.perf_counter() - start
+    return {
+        'concurrency': concurrency,
+        'seconds': seconds,
+        'received': received,
+        'peak_in_flight': dart.peak_in_flight('document.xml')
+    }
+
+
+def run(documents: int, document_latency_ms: float, document_size: int, concurrency_levels: List[int]) -> List[Dict]:
+    """모의 서버를 띄우고 동시 다운로드 수별 소요 시간 측정 (첫 결과가 기준)"""
+    dart = MockDart(document_size=document_size, document_latency_ms=document_latency_ms)
+    rcept_nos = document_rcept_nos(dart, documents)
+
+    with MockDartServer(dart) as server:
+        # 호출 속도 제한/문서 캐시 없이 모의 서버에 연결 (커넥션 풀은 최대 동시 다운로드 수만큼)
+        client = dart_api.configure_client(
+            api_key='mock',
+            base_url=server.base_url,
+            pool_size=max(concurrency_levels),
+            rate_per_minute=1_000_000,
+            burst=max(concurrency_levels),
+            cache=None
+        )
+        try:
+            # 문서 생성/연결 수립 비용이 첫 측정에만 들어가지 않도록 미리 한 번 받음
+            asyncio.run(download_all(rcept_nos, max(concurrency_levels)))
+            results = [measure(dart, rcept_nos, concurrency) for concurrency in concurrency_levels]
+        finally:
+            client.close()
+
+    base = results[0]
+    for result in results:
+        result['speedup'] = base['seconds'] / result['seconds']
+        result['efficiency'] = result['speedup'] / (result['concurrency'] / base['concurrency'])
+    return results
+
+
+def find_failures(results: List[Dict], documents: int, min_efficiency: float) -> List[str]:
+    """문서 누락, 동시 다운로드 수 초과, 속도 향상 부족 목록"""
+    failures = []
+    for result in results:
+        if result['received'] != documents:
+            failures.append(f"동시 수 {result['concurrency']}: 문서 {documents - result['received']}건 수신 실패")
+        if result['peak_in_flight'] > result['concurrency']:
+            failures.append(f"동시 수 {result['concurrency']}: 서버가 받은 최대 동시 요청 {result['peak_in_flight']}건 (제한 초과)")
+        if result['efficiency'] < min_efficiency:
+            failures.append(f"동시 수 {result['concurrency']}: 효율 {result['efficiency']:.0%} (최소 {min_efficiency:.0%})")
+    return failures
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="dart_api_async 동시 다운로드 속도 향상 측정 (로컬 모의 서버)")
+    arg_parser.add_argument("--documents", type=int, default=DEFAULT_DOCUMENTS, help=f"받을 문서 수 (기본값: {DEFAULT_DOCUMENTS})")
+    arg_parser.add_argument(
+        "--document-latency-ms",
+        type=float,
+        default=DEFAULT_DOCUMENT_LATENCY_MS,
+        help=f"document.xml 응답 지연 시간 (밀리초, 기본값: {DEFAULT_DOCUMENT_LATENCY_MS:g})"
+    )
+    arg_parser.add_argument("--document-size", type=int, default=DEFAULT_DOCUMENT_SIZE, help=f"문서 크기 (바이트, 기본값: {DEFAULT_DOCUMENT_SIZE})")
+    arg_parser.add_argument(
+        "--concurrency",
+        action="append",
+        type=int,
+        help="동시 다운로드 수 (여러 번 지정, 첫 값이 기준, 기본값: 1, 2, 4, 8, 16)"
+    )
+    arg_parser.add_argument(
+        "--min-efficiency",
+        type=float,
+        default=DEFAULT_MIN_EFFICIENCY,
+        help=f"허용 최소 효율 (속도 향상 / 동시 다운로드 수 배율, 기본값: {DEFAULT_MIN_EFFICIENCY})"
+    )
+    arg_parser.add_argument(
+        "--check",
+        action="store_true",
+        help=f"빠른 자동 확인 (문서 {CHECK_DOCUMENTS}건, 응답 지연 {CHECK_DOCUMENT_LATENCY_MS:g}ms, 동시 수 {'/'.join(map(str, CHECK_CONCURRENCY))})"
+    )
+    args = arg_parser.parse_args()
+
+    if args.check:
+        args.documents = CHECK_DOCUMENTS
+        args.document_latency_ms = CHECK_DOCUMENT_LATENCY_MS
+        args.concurrency = args.concurrency or list(CHECK_CONCURRENCY)
+
+    levels = args.concurrency or list(DEFAULT_CONCURRENCY)
+    print(f"동시 다운로드 속도 향상: 문서 {args.documents}건, 응답 지연 {args.document_latency_ms:g}ms, 문서 {args.document_size // 1024}KB")
+
+    results = run(args.documents, args.document_latency_ms, args.document_size, levels)
+
+    print(f"\n{'동시 수':>7} {'소요(초)':>9} {'받은 문서':>9} {'최대 동시':>9} {'속도 향상':>9} {'효율':>6}")
+    for result in results:
+        print(
+            f"{result['concurrency']:>7} {result['seconds']:>9.2f} {result['received']:>9} {result['peak_in_flight']:>9} "
+            f"{result['speedup']:>8.2f}x {result['efficiency']:>6.0%}"
+        )
+    failures = find_failures(results, args.documents, args.min_efficiency)
+
+    if failures:
+        print(f"\n✗ 확인 실패 {len(failures)}건:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+    print("\n✓ 동시 다운로드 수 제한 안에서 동시 다운로드 수에 비례하여 속도 향상")
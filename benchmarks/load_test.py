@@ -0,0 +1,221 @@
+"""
+종단간 부하 테스트
+로컬 DART 모의 서버(benchmarks.mock_dart)를 띄우고 main.py를 실제와 같은 방식(별도 프로세스)으로 실행하여
+초당 처리 공시 수와 공시별 처리 지연(다운로드 시작 → 저장 완료)의 p50/p99를 측정
+
+동시 작업 수/재시도 설정을 바꿔 가며 실행하여 운영 서비스에 적용하기 전에 설정을 조정
+
+    python -m benchmarks.load_test --companies 20 --latency-ms 50 --jitter-ms 30 --workers 4 --workers 8 --workers 16
+    python -m benchmarks.load_test --http-error-rate 0.05 --dart-error-rate 0.02 --max-retries 3 --backoff-base 0.1
+    python -m benchmarks.load_test --quota 200 --quota-window 10
+"""
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+# 패키지 밖(python benchmarks/load_test.py)에서 실행해도 저장소 모듈을 import할 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+import metrics
+from benchmarks.mock_dart import MockDartServer, add_arguments, corp_code_of, from_arguments
+
+MAIN_SCRIPT = os.path.join(ROOT_DIR, 'main.py')
+DEFAULT_WORKERS = 8
+# main.py 실행 1회의 제한 시간 (초)
+RUN_TIMEOUT = 1800
+
+_SUMMARY_PATTERN = re.compile(r'^(처리 대상|성공|실패|건너뜀): (\d+)건', re.M)
+
+
+def histogram(snapshot: Dict, name: str) -> Optional[Dict]:
+    """지표 스냅샷에서 이름이 같은 히스토그램을 레이블 구분 없이 합침"""
+    merged = None
+    for item in snapshot.get('histograms', []):
+        if item['name'] != name:
+            continue
+        if merged is None:
+            merged = {'buckets': item['buckets'], 'counts': list(item['counts']), 'sum': item['sum'], 'count': item['count']}
+        else:
+            merged['counts'] = [a + b for a, b in zip(merged['counts'], item['counts'])]
+            merged['sum'] += item['sum']
+            merged['count'] += item['count']
+    return merged
+
+
+def latency_summary(snapshot: Dict, name: str) -> Dict:
+    """히스토그램의 건수/평균/p50/p99 (초)"""
+    item = histogram(snapshot, name)
+    if not item or not item['count']:
+        return {'count': 0, 'mean': None, 'p50': None, 'p99': None}
+    return {
+        'count': item['count'],
+        'mean': item['sum'] / item['count'],
+        'p50': metrics.histogram_quantile(0.5, item['buckets'], item['counts']),
+        'p99': metrics.histogram_quantile(0.99, item['buckets'], item['counts'])
+    }
+
+
+def counter_total(snapshot: Dict, name: str) -> float:
+    return sum(item['value'] for item in snapshot.get('counters', []) if item['name'] == name)
+
+
+def client_env(
+    base_url: str,
+    rate_per_minute: Optional[float] = None,
+    max_retries: Optional[int] = None,
+    backoff_base: Optional[float] = None
+) -> Dict[str, str]:
+    """main.py 프로세스 환경 변수 (모의 서버 주소, 문서 캐시 비활성화, 호출/재시도 설정)"""
+    env = {
+        **os.environ,
+        'DART_BASE_URL': base_url,
+        'DART_API_KEY': 'mock',
+        'DART_CACHE_DIR': '',
+        'PYTHONUNBUFFERED': '1'
+    }
+    if rate_per_minute is not None:
+        env['DART_RATE_PER_MINUTE'] = str(rate_per_minute)
+    if max_retries is not None:
+        env['DART_MAX_RETRIES'] = str(max_retries)
+    if backoff_base is not None:
+        env['DART_BACKOFF_BASE'] = str(backoff_base)
+    return env
+
+
+def run_once(args: argparse.Namespace, workers: int, keep_dir: Optional[str] = None) -> Optional[Dict]:
+    """
+    모의 서버를 새로 띄우고 main.py를 1회 실행하여 측정 (실패 시 None)
+
+    실행마다 빈 작업 디렉토리(출력/매니페스트/파싱 캐시)를 사용하므로 모든 공시를 새로 처리함
+    """
+    companies = [corp_code_of(index) for index in range(args.companies)]
+
+    with MockDartServer(from_arguments(args)) as server, tempfile.TemporaryDirectory(prefix='dart-load-') as work_dir:
+        run_dir = work_dir
+        if keep_dir:
+            os.makedirs(keep_dir, exist_ok=True)
+            run_dir = tempfile.mkdtemp(prefix=f'workers-{workers}-', dir=keep_dir)
+        metrics_path = os.path.join(run_dir, 'metrics.json')
+        log_path = os.path.join(run_dir, 'main.log')
+
+        command = [sys.executable, MAIN_SCRIPT, '--workers', str(workers), '--no-parse-cache', '--metrics', metrics_path]
+        if args.parse_workers:
+            command += ['--parse-workers', str(args.parse_workers)]
+        if not args.structured:
+            command.append('--html-only')
+        for corp_code in companies:
+            command += ['--company', corp_code]
+
+        env = client_env(server.base_url, args.rate_per_minute, args.max_retries, args.backoff_base)
+
+        start = time.perf_counter()
+        try:
+            with open(log_path, 'w', encoding='utf-8') as log:
+                completed = subprocess.run(command, cwd=run_dir, env=env, stdout=log, stderr=subprocess.STDOUT, timeout=RUN_TIMEOUT)
+        except subprocess.TimeoutExpired:
+            print(f"  ✗ workers={workers}: 제한 시간({RUN_TIMEOUT}초) 초과 (로그: {log_path})")
+            return None
+        elapsed = time.perf_counter() - start
+
+        with open(log_path, 'r', encoding='utf-8') as f:
+            output = f.read()
+
+        if completed.returncode != 0 or not os.path.exists(metrics_path):
+            tail = '\n'.join(output.strip().splitlines()[-20:])
+            print(f"  ✗ workers={workers}: main.py 실행 오류 (종료 코드 {completed.returncode})\n{tail}")
+            return None
+
+        with open(metrics_path, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f)
+
+        summary = {label: int(count) for label, count in _SUMMARY_PATTERN.findall(output)}
+        filings = latency_summary(snapshot, 'dart_filing_seconds')
+
+        return {
+            'workers': workers,
+            'elapsed_seconds': elapsed,
+            'processed': summary.get('처리 대상', 0),
+            'success': summary.get('성공', 0),
+            'failed': summary.get('실패', 0),
+            'filings_per_second': filings['count'] / elapsed if elapsed else 0.0,
+            'filing_latency': filings,
+            'download_latency': latency_summary(snapshot, 'dart_download_seconds'),
+            'parse_latency': latency_summary(snapshot, 'dart_parse_seconds'),
+            'api_requests': counter_total(snapshot, 'dart_api_requests_total'),
+            'retries': counter_total(snapshot, 'dart_retries_total'),
+            'server': server.dart.stats()
+        }
+
+
+def _ms(value: Optional[float]) -> str:
+    return f"{value * 1000:8.1f}" if value is not None else f"{'-':>8}"
+
+
+def print_results(results: List[Dict]) -> None:
+    print(f"\n{'workers':>7} {'공시':>6} {'성공':>6} {'실패':>6} {'소요(초)':>9} {'공시/초':>8} "
+          f"{'p50(ms)':>8} {'p99(ms)':>8} {'다운로드p99':>11} {'호출':>6} {'재시도':>6}")
+    for result in results:
+        latency = result['filing_latency']
+        print(
+            f"{result['workers']:>7} {result['processed']:>6} {result['success']:>6} {result['failed']:>6} "
+            f"{result['elapsed_seconds']:>9.2f} {result['filings_per_second']:>8.2f} "
+            f"{_ms(latency['p50'])} {_ms(latency['p99'])} {_ms(result['download_latency']['p99']):>11} "
+            f"{int(result['api_requests']):>6} {int(result['retries']):>6}"
+        )
+    print("\n(p50/p99: 공시별 다운로드 시작 → 저장 완료, 지표 히스토그램 구간 보간값)")
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="DART 모의 서버 대상 종단간 부하 테스트")
+    add_arguments(arg_parser)
+    arg_parser.add_argument(
+        "--workers",
+        dest="workers",
+        action="append",
+        type=int,
+        help=f"main.py 동시 목록 조회/다운로드 작업 수 (여러 번 지정하면 차례로 실행, 기본값: {DEFAULT_WORKERS})"
+    )
+    arg_parser.add_argument("--parse-workers", type=int, default=None, help="HTML 파싱 프로세스 수 (기본값: CPU 코어 수)")
+    arg_parser.add_argument(
+        "--rate-per-minute",
+        type=float,
+        default=None,
+        help="클라이언트 분당 호출 제한 (DART_RATE_PER_MINUTE, 기본값: dart_api 기본 설정)"
+    )
+    arg_parser.add_argument("--max-retries", type=int, default=None, help="최대 재시도 횟수 (DART_MAX_RETRIES)")
+    arg_parser.add_argument("--backoff-base", type=float, default=None, help="지수 백오프 기본 대기 시간 (초, DART_BACKOFF_BASE)")
+    arg_parser.add_argument(
+        "--structured",
+        action="store_true",
+        help="재무제표 API 조회도 실행 (모의 서버는 데이터 없음(013)으로 응답, 기본값: --html-only로 실행)"
+    )
+    arg_parser.add_argument("--output", help="측정 결과 JSON 저장 경로")
+    arg_parser.add_argument("--keep-dir", help="지정하면 실행별 출력/로그/지표를 이 디렉토리 아래에 남김")
+    args = arg_parser.parse_args()
+
+    print(f"종단간 부하 테스트: 모의 기업 {args.companies}개 × 공시 {args.filings_per_company}건, 문서 {args.document_size // 1024}KB")
+
+    results = []
+    for workers in args.workers or [DEFAULT_WORKERS]:
+        print(f"  workers={workers} 실행 중...")
+        result = run_once(args, workers, args.keep_dir)
+        if result:
+            results.append(result)
+
+    if results:
+        print_results(results)
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    sys.exit(0 if len(results) == len(args.workers or [DEFAULT_WORKERS]) else 1)
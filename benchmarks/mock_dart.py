@@ -0,0 +1,488 @@
+"""
+로컬 DART 모의 서버
+list.json(페이지 나눔), document.xml(ZIP), corpCode.xml을 합성 데이터로 응답하여
+실제 OpenDART 서비스와 API 키 없이 dart_api/main.py를 실행
+
+지연 시간, HTTP 5xx/DART 상태 코드 오류 주입, 호출 한도 초과(020) 응답을 설정할 수 있음
+
+    python -m benchmarks.mock_dart --port 8765 --latency-ms 50 --http-error-rate 0.02
+    DART_BASE_URL=http://127.0.0.1:8765/api DART_API_KEY=mock python main.py --company 00900001
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import sys
+import threading
+import time
+import zipfile
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+
+# 패키지 밖(python benchmarks/mock_dart.py)에서 실행해도 benchmarks 패키지를 import할 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from benchmarks.corpus import generate
+
+DEFAULT_PORT = 8765
+DEFAULT_COMPANIES = 20
+DEFAULT_FILINGS_PER_COMPANY = 12
+DEFAULT_DOCUMENT_SIZE = 200 * 1024
+
+# 모의 기업 고유번호 시작값 (실제 고유번호와 겹치지 않도록 009로 시작)
+CORP_CODE_BASE = 900001
+
+# 공시 순번 → (공시유형, 보고서명 형식, 합성 문서 종류) 순환
+# 보고서명의 {year}는 접수일 기준 보고 기간 연도로 채움
+FILING_CYCLE: List[Tuple[str, str, Optional[str]]] = [
+    ('A', '분기보고서 ({year}.03)', 'earnings'),
+    ('D', '임원ㆍ주요주주특정증권등소유상황보고서', None),
+    ('A', '반기보고서 ({year}.06)', 'earnings'),
+    ('B', '주요사항보고서(유상증자결정)', 'rights_issue'),
+    ('A', '분기보고서 ({year}.09)', 'earnings'),
+    ('I', '기업설명회(IR)개최(안내공시)', None),
+]
+
+# DART 상태 코드 메시지
+STATUS_MESSAGES = {
+    '000': '정상',
+    '010': '등록되지 않은 키입니다.',
+    '013': '조회된 데이타가 없습니다.',
+    '014': '파일이 존재하지 않습니다.',
+    '020': '요청 제한을 초과하였습니다.',
+    '100': '필드의 부적절한 값입니다.',
+    '800': '시스템 점검으로 인한 서비스가 중지 중입니다.',
+}
+
+
+def corp_code_of(index: int) -> str:
+    """모의 기업 순번(0부터) → 고유번호 8자리"""
+    return f"{CORP_CODE_BASE + index:08d}"
+
+
+def make_rcept_no(rcept_dt: str, corp_code: str, number: int) -> str:
+    """접수번호 14자리 (접수일 8자리 + 기업 4자리 + 공시 순번 2자리)"""
+    return f"{rcept_dt}{int(corp_code) % 10000:04d}{number % 100:02d}"
+
+
+class MockDart:
+    """
+    합성 공시 데이터와 오류 주입 설정 (HTTP 처리와 분리하여 서버 스레드가 공유)
+
+    기업마다 오늘부터 1년 동안 filings_per_company건의 공시가 일정한 간격으로 있고,
+    공시 종류는 FILING_CYCLE 순서로 돌아가며 정해짐 (같은 기업/순번이면 항상 같은 접수번호와 문서)
+    """
+
+    def __init__(
+        self,
+        companies: int = DEFAULT_COMPANIES,
+        filings_per_company: int = DEFAULT_FILINGS_PER_COMPANY,
+        document_size: int = DEFAULT_DOCUMENT_SIZE,
+        latency_ms: float = 0.0,
+        jitter_ms: float = 0.0,
+        document_latency_ms: float = 0.0,
+        http_error_rate: float = 0.0,
+        dart_error_rate: float = 0.0,
+        quota: int = 0,
+        quota_window: float = 0.0,
+        seed: int = 0
+    ):
+        """
+        Args:
+            companies: 전체 공시 조회(corp_code 없음)와 corpCode.xml에 나오는 모의 기업 수
+            filings_per_company: 기업별 1년간 공시 수 (최대 100)
+            document_size: 공시 원문 크기 (바이트)
+            latency_ms: 모든 응답에 더하는 지연 시간 (밀리초)
+            jitter_ms: 지연 시간에 더하는 0~jitter_ms 범위의 무작위 지연
+            document_latency_ms: document.xml 응답에만 추가로 더하는 지연 시간
+            http_error_rate: HTTP 503 응답 비율
+            dart_error_rate: DART 상태 코드 800(시스템 점검) 응답 비율
+            quota: quota_window초 동안 허용하는 호출 수 (0이면 제한 없음, 초과 시 상태 코드 020)
+            quota_window: 호출 한도 집계 구간 (초, 0이면 서버 실행 기간 전체 = 일일 한도)
+            seed: 오류 주입 난수 시드
+        """
+        self.companies = companies
+        self.filings_per_company = max(1, min(100, filings_per_company))
+        self.document_size = document_size
+        self.latency = latency_ms / 1000
+        self.jitter = jitter_ms / 1000
+        self.document_latency = document_latency_ms / 1000
+        self.http_error_rate = http_error_rate
+        self.dart_error_rate = dart_error_rate
+        self.quota = quota
+        self.quota_window = quota_window
+
+        self.today = datetime.now().date()
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+        self._documents: Dict[str, bytes] = {}
+        self._stats: Dict[str, int] = {}
+        # 엔드포인트별 처리 중인 요청 수와 최대 동시 요청 수
+        self._in_flight: Dict[str, int] = {}
+        self._peak_in_flight: Dict[str, int] = {}
+
+    # 공시 데이터
+
+    def filings(self, corp_code: str) -> List[Dict]:
+        """기업의 1년간 공시 목록 (최신순)"""
+        interval = 365 / self.filings_per_company
+        corp_name = f"모의기업{int(corp_code) - CORP_CODE_BASE + 1:04d}"
+        stock_code = f"{int(corp_code) % 1000000:06d}"
+
+        rows = []
+        for number in range(self.filings_per_company):
+            rcept_date = self.today - timedelta(days=int(number * interval))
+            rcept_dt = rcept_date.strftime('%Y%m%d')
+            pblntf_ty, report_nm, _ = FILING_CYCLE[number % len(FILING_CYCLE)]
+            rows.append({
+                'corp_code': corp_code,
+                'corp_name': corp_name,
+                'stock_code': stock_code,
+                'corp_cls': 'Y',
+                'report_nm': report_nm.format(year=rcept_date.year if rcept_date.month > 3 else rcept_date.year - 1),
+                'rcept_no': make_rcept_no(rcept_dt, corp_code, number),
+                'flr_nm': corp_name,
+                'rcept_dt': rcept_dt,
+                'rm': '',
+                'pblntf_ty': pblntf_ty
+            })
+        return rows
+
+    def list_page(self, params: Dict[str, str]) -> Dict:
+        """list.json 응답"""
+        corp_code = params.get('corp_code')
+        corp_codes = [corp_code] if corp_code else [corp_code_of(index) for index in range(self.companies)]
+        begin_de = params.get('bgn_de') or self.today.strftime('%Y%m%d')
+        end_de = params.get('end_de') or self.today.strftime('%Y%m%d')
+        pblntf_ty = params.get('pblntf_ty')
+
+        try:
+            page_no = max(1, int(params.get('page_no') or 1))
+            page_count = max(1, min(100, int(params.get('page_count') or 10)))
+        except ValueError:
+            return self.status('100')
+
+        rows = [
+            row
+            for code in corp_codes
+            for row in self.filings(code)
+            if begin_de <= row['rcept_dt'] <= end_de and (not pblntf_ty or row['pblntf_ty'] == pblntf_ty)
+        ]
+        if not rows:
+            return self.status('013')
+
+        rows.sort(key=lambda row: row['rcept_no'], reverse=True)
+        total_page = (len(rows) + page_count - 1) // page_count
+        page = rows[(page_no - 1) * page_count:page_no * page_count]
+        for row in page:
+            row.pop('pblntf_ty')
+
+        return {
+            'status': '000',
+            'message': STATUS_MESSAGES['000'],
+            'page_no': page_no,
+            'page_count': page_count,
+            'total_count': len(rows),
+            'total_page': total_page,
+            'list': page
+        }
+
+    def document(self, rcept_no: str) -> Optional[bytes]:
+        """document.xml 응답 ZIP (알 수 없는 접수번호면 None)"""
+        if len(rcept_no) != 14 or not rcept_no.isdigit():
+            return None
+
+        profile = FILING_CYCLE[int(rcept_no[-2:]) % len(FILING_CYCLE)][2] or 'earnings'
+        with self._lock:
+            base = self._documents.get(profile)
+        if base is None:
+            base = generate(profile, self.document_size)
+            with self._lock:
+                self._documents[profile] = base
+
+        # 문서마다 내용(해시)이 달라지도록 접수번호 문단 삽입
+        content = base.replace(b'<BODY>', f'<BODY><P>접수번호 {rcept_no}</P>'.encode('utf-8'), 1)
+
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr(f"{rcept_no}.xml", content)
+        return buffer.getvalue()
+
+    def corp_codes(self) -> bytes:
+        """corpCode.xml 응답 ZIP"""
+        entries = ''.join(
+            f"<list><corp_code>{corp_code_of(index)}</corp_code><corp_name>모의기업{index + 1:04d}</corp_name>"
+            f"<corp_eng_name>Mock Corp {index + 1}</corp_eng_name>"
+            f"<stock_code>{(CORP_CODE_BASE + index) % 1000000:06d}</stock_code>"
+            f"<modify_date>{self.today.strftime('%Y%m%d')}</modify_date></list>"
+            for index in range(self.companies)
+        )
+        buffer = io.BytesIO()
+        with zipfile.ZipFile(buffer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            archive.writestr('CORPCODE.xml', f'<?xml version="1.0" encoding="UTF-8"?><result>{entries}</result>')
+        return buffer.getvalue()
+
+    @staticmethod
+    def status(code: str) -> Dict:
+        return {'status': code, 'message': STATUS_MESSAGES.get(code, '')}
+
+    # 오류 주입
+
+    def delay(self, endpoint: str) -> float:
+        extra = self.document_latency if endpoint == 'document.xml' else 0.0
+        with self._lock:
+            jitter = self._rng.uniform(0, self.jitter) if self.jitter else 0.0
+        return self.latency + extra + jitter
+
+    def consume_quota(self) -> bool:
+        """호출 1건 집계 (한도 초과면 False)"""
+        if not self.quota:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            if self.quota_window and now - self._window_start >= self.quota_window:
+                self._window_start = now
+                self._window_count = 0
+            self._window_count += 1
+            return self._window_count <= self.quota
+
+    def inject(self) -> Optional[str]:
+        """주입할 오류 ('http_503', '800' 또는 None)"""
+        with self._lock:
+            roll = self._rng.random()
+        if roll < self.http_error_rate:
+            return 'http_503'
+        if roll < self.http_error_rate + self.dart_error_rate:
+            return '800'
+        return None
+
+    def count(self, endpoint: str, outcome: str) -> None:
+        with self._lock:
+            key = f"{endpoint} {outcome}"
+            self._stats[key] = self._stats.get(key, 0) + 1
+
+    def stats(self) -> Dict[str, int]:
+        """엔드포인트/결과별 응답 수"""
+        with self._lock:
+            return dict(sorted(self._stats.items()))
+
+    def request_started(self, endpoint: str) -> None:
+        with self._lock:
+            count = self._in_flight.get(endpoint, 0) + 1
+            self._in_flight[endpoint] = count
+            self._peak_in_flight[endpoint] = max(self._peak_in_flight.get(endpoint, 0), count)
+
+    def request_finished(self, endpoint: str) -> None:
+        with self._lock:
+            self._in_flight[endpoint] -= 1
+
+    def peak_in_flight(self, endpoint: str, reset: bool = False) -> int:
+        """엔드포인트의 최대 동시 요청 수 (reset=True면 현재 처리 중인 요청 수로 초기화)"""
+        with self._lock:
+            peak = self._peak_in_flight.get(endpoint, 0)
+            if reset:
+                self._peak_in_flight[endpoint] = self._in_flight.get(endpoint, 0)
+            return peak
+
+
+class MockDartHandler(BaseHTTPRequestHandler):
+    """모의 DART API 요청 처리 (/api/{endpoint}, 응답 통계는 /api/stats)"""
+
+    server_version = 'MockDART/1.0'
+    protocol_version = 'HTTP/1.1'
+
+    @property
+    def dart(self) -> MockDart:
+        return self.server.dart
+
+    def log_message(self, format, *args) -> None:
+        # 요청마다 stderr에 출력하지 않음 (응답 수는 /api/stats로 확인)
+        pass
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        params = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        endpoint = url.path.rsplit('/', 1)[-1]
+
+        if endpoint == 'stats':
+            self._send(200, json.dumps(self.dart.stats(), ensure_ascii=False).encode('utf-8'), 'application/json')
+            return
+
+        self.dart.request_started(endpoint)
+        try:
+            self._respond(endpoint, params)
+        finally:
+            self.dart.request_finished(endpoint)
+
+    def _respond(self, endpoint: str, params: Dict[str, str]) -> None:
+        time.sleep(self.dart.delay(endpoint))
+
+        if not params.get('crtfc_key'):
+            self._send_status(endpoint, '010')
+            return
+
+        if not self.dart.consume_quota():
+            self._send_status(endpoint, '020')
+            return
+
+        error = self.dart.inject()
+        if error == 'http_503':
+            self.dart.count(endpoint, 'http_503')
+            self._send(503, b'Service Unavailable', 'text/plain', {'Retry-After': '1'})
+            return
+        if error:
+            self._send_status(endpoint, error)
+            return
+
+        if endpoint == 'list.json':
+            data = self.dart.list_page(params)
+            self.dart.count(endpoint, data['status'])
+            self._send(200, json.dumps(data, ensure_ascii=False).encode('utf-8'), 'application/json')
+        elif endpoint == 'document.xml':
+            content = self.dart.document(params.get('rcept_no', ''))
+            if content is None:
+                self._send_status(endpoint, '014')
+                return
+            self.dart.count(endpoint, '000')
+            self._send(200, content, 'application/x-msdownload')
+        elif endpoint == 'corpCode.xml':
+            self.dart.count(endpoint, '000')
+            self._send(200, self.dart.corp_codes(), 'application/x-msdownload')
+        else:
+            # 재무제표/주요사항 구조화 API 등은 데이터 없음으로 응답 (HTML 파싱 경로 사용)
+            self._send_status(endpoint, '013')
+
+    def _send_status(self, endpoint: str, code: str) -> None:
+        """DART 상태 코드 응답 (.json은 JSON, 그 외는 XML)"""
+        self.dart.count(endpoint, code)
+        message = STATUS_MESSAGES.get(code, '')
+        if endpoint.endswith('.json'):
+            body = json.dumps({'status': code, 'message': message}, ensure_ascii=False).encode('utf-8')
+            self._send(200, body, 'application/json')
+        else:
+            body = f'<?xml version="1.0" encoding="UTF-8"?><result><status>{code}</status><message>{message}</message></result>'
+            self._send(200, body.encode('utf-8'), 'application/xml')
+
+    def _send(self, code: int, body: bytes, content_type: str, headers: Optional[Dict[str, str]] = None) -> None:
+        self.send_response(code)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class MockDartServer:
+    """
+    모의 DART 서버 (백그라운드 스레드에서 실행)
+
+        with MockDartServer(MockDart(latency_ms=20)) as server:
+            os.environ['DART_BASE_URL'] = server.base_url
+    """
+
+    def __init__(self, dart: Optional[MockDart] = None, host: str = '127.0.0.1', port: int = 0):
+        """
+        Args:
+            dart: 모의 데이터/오류 주입 설정 (기본값: MockDart())
+            host: 바인딩 주소
+            port: 포트 (0이면 빈 포트 자동 선택)
+        """
+        self.dart = dart or MockDart()
+        self.httpd = ThreadingHTTPServer((host, port), MockDartHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.dart = self.dart
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        """DART_BASE_URL로 지정할 주소"""
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}/api"
+
+    def start(self) -> 'MockDartServer':
+        self._thread = threading.Thread(target=self.httpd.serve_forever, name='mock-dart', daemon=True)
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+
+    def __enter__(self) -> 'MockDartServer':
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def add_arguments(arg_parser: argparse.ArgumentParser) -> None:
+    """모의 서버 설정 인자 추가 (부하 테스트 실행기와 공유)"""
+    arg_parser.add_argument("--companies", type=int, default=DEFAULT_COMPANIES, help=f"모의 기업 수 (기본값: {DEFAULT_COMPANIES})")
+    arg_parser.add_argument(
+        "--filings-per-company",
+        type=int,
+        default=DEFAULT_FILINGS_PER_COMPANY,
+        help=f"기업별 1년간 공시 수 (최대 100, 기본값: {DEFAULT_FILINGS_PER_COMPANY})"
+    )
+    arg_parser.add_argument(
+        "--document-size",
+        type=int,
+        default=DEFAULT_DOCUMENT_SIZE,
+        help=f"공시 원문 크기 (바이트, 기본값: {DEFAULT_DOCUMENT_SIZE})"
+    )
+    arg_parser.add_argument("--latency-ms", type=float, default=0.0, help="모든 응답의 지연 시간 (밀리초)")
+    arg_parser.add_argument("--jitter-ms", type=float, default=0.0, help="응답마다 더하는 0~N 밀리초 무작위 지연")
+    arg_parser.add_argument("--document-latency-ms", type=float, default=0.0, help="document.xml 응답에만 더하는 지연 시간 (밀리초)")
+    arg_parser.add_argument("--http-error-rate", type=float, default=0.0, help="HTTP 503 응답 비율 (0~1)")
+    arg_parser.add_argument("--dart-error-rate", type=float, default=0.0, help="DART 상태 코드 800 응답 비율 (0~1)")
+    arg_parser.add_argument("--quota", type=int, default=0, help="호출 한도 (초과 시 상태 코드 020, 0이면 제한 없음)")
+    arg_parser.add_argument("--quota-window", type=float, default=0.0, help="호출 한도 집계 구간 (초, 0이면 서버 실행 기간 전체)")
+    arg_parser.add_argument("--seed", type=int, default=0, help="오류 주입 난수 시드")
+
+
+def from_arguments(args: argparse.Namespace) -> MockDart:
+    return MockDart(
+        companies=args.companies,
+        filings_per_company=args.filings_per_company,
+        document_size=args.document_size,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        document_latency_ms=args.document_latency_ms,
+        http_error_rate=args.http_error_rate,
+        dart_error_rate=args.dart_error_rate,
+        quota=args.quota,
+        quota_window=args.quota_window,
+        seed=args.seed
+    )
+
+
+if __name__ == "__main__":
+    arg_parser = argparse.ArgumentParser(description="로컬 DART 모의 서버")
+    arg_parser.add_argument("--host", default="127.0.0.1", help="바인딩 주소 (기본값: 127.0.0.1)")
+    arg_parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"포트 (0이면 자동 선택, 기본값: {DEFAULT_PORT})")
+    add_arguments(arg_parser)
+    args = arg_parser.parse_args()
+
+    server = MockDartServer(from_arguments(args), args.host, args.port)
+    # 부하 테스트 실행기가 주소를 읽을 수 있도록 첫 줄에 출력
+    print(f"DART_BASE_URL={server.base_url}", flush=True)
+    print(f"모의 기업 고유번호: {corp_code_of(0)} ~ {corp_code_of(args.companies - 1)} (Ctrl+C로 종료)", flush=True)
+
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        print(json.dumps(server.dart.stats(), ensure_ascii=False, indent=2))
@@ -0,0 +1,94 @@
+"""
+파서 회귀 사례
+실제 공시에서 잘못 읽었던 표 모양을 작게 재현하여, 표에서 추출한 당기/전기 금액이 기대값과 같은지 확인
+
+    python -m benchmarks.parser_cases
+
+기대값과 다른 사례가 있으면 종료 코드 1
+"""
+
+import os
+import sys
+from typing import Dict, List, Tuple
+
+# 패키지 밖(python benchmarks/parser_cases.py)에서 실행해도 저장소 모듈을 import할 수 있도록 경로 추가
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT_DIR not in sys.path:
+    sys.path.insert(0, ROOT_DIR)
+
+from parsers.parser_earnings import extract_table_financial_data
+from parsers.tables import Table
+
+# (사례 이름, 표 행, 금액 단위, 항목 → (당기, 전기) 기대값 (백만원))
+TABLE_CASES: List[Tuple[str, List[List[str]], str, Dict[str, Tuple[int, int]]]] = [
+    (
+        '주석 열 + 연도 머리글',
+        [
+            ['과목', '주석', '2024년 1분기', '2023년 1분기'],
+            ['매출액', '4,26', '71,915,601', '67,780,574'],
+            ['영업이익', '', '6,606,013', '640,178'],
+        ],
+        '백만원',
+        {'매출액': (71_915_601, 67_780_574), '영업이익': (6_606_013, 640_178)},
+    ),
+    (
+        '머리글 없는 주석 번호 열',
+        [
+            ['과목', '', '', ''],
+            ['매출액', '5', '1,200', '1,100'],
+            ['영업이익', '6', '120', '90'],
+        ],
+        '백만원',
+        {'매출액': (1_200, 1_100), '영업이익': (120, 90)},
+    ),
+    (
+        '연도 머리글 (전년도 열이 앞)',
+        [
+            ['과목', '2023년 1분기', '2024년 1분기'],
+            ['매출액', '67,780,574', '71,915,601'],
+        ],
+        '백만원',
+        {'매출액': (71_915_601, 67_780_574)},
+    ),
+    (
+        '작은 금액 (주석 번호로 오인하지 않음)',
+        [
+            ['구분', '', ''],
+            ['매출액', '12', '10'],
+        ],
+        '백만원',
+        {'매출액': (12, 10)},
+    ),
+    (
+        '당기/전기 3개월/누적',
+        [
+            ['구분', '제 56 기 3분기', '제 56 기 3분기', '제 55 기 3분기', '제 55 기 3분기'],
+            ['구분', '3개월', '누적', '3개월', '누적'],
+            ['매출액', '30', '90', '25', '80'],
+        ],
+        '백만원',
+        {'매출액': (30, 25)},
+    ),
+]
+
+
+def run_table_cases() -> List[str]:
+    """표 사례를 추출하여 기대값과 다른 항목 목록 반환"""
+    failures = []
+    for name, rows, unit, expected in TABLE_CASES:
+        items = extract_table_financial_data([Table(rows, unit)])
+        actual = {item.item: (item.current, item.previous) for item in items}
+        if actual != expected:
+            failures.append(f"{name}: {actual} (기대값 {expected})")
+    return failures
+
+
+if __name__ == "__main__":
+    failures = run_table_cases()
+    if failures:
+        print(f"✗ 파서 회귀 사례 실패 {len(failures)}건:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+
+    print(f"✓ 파서 회귀 사례 {len(TABLE_CASES)}건 통과")
@@ -0,0 +1,210 @@
+"""
+기업 고유번호 인덱스 모듈
+DART corpCode.xml을 내려받아 로컬 SQLite 인덱스로 저장하고 고유번호/종목코드/회사명으로 조회
+"""
+
+import io
+import os
+import sqlite3
+import threading
+import time
+import xml.etree.ElementTree as ET
+import zipfile
+from typing import Dict, Iterator, List, Optional
+
+import dart_api
+
+# 인덱스 갱신 주기 (corpCode.xml은 하루 단위로 갱신됨)
+DEFAULT_MAX_AGE_SECONDS = 24 * 60 * 60
+
+_FIELDS = ('corp_code', 'corp_name', 'corp_eng_name', 'stock_code', 'modify_date')
+
+
+def iter_corp_codes(content: bytes) -> Iterator[Dict]:
+    """
+    corpCode.xml(ZIP) 응답을 스트리밍 파싱하여 기업 정보를 하나씩 반환
+
+    압축을 메모리에 전부 풀지 않고 ZIP 멤버 스트림을 iterparse로 읽으며,
+    처리한 요소는 바로 해제하여 메모리 사용량을 일정하게 유지
+
+    Args:
+        content: corpCode.xml 응답 바이트
+
+    Yields:
+        corp_code, corp_name, corp_eng_name, stock_code, modify_date 딕셔너리
+
+    Raises:
+        ValueError: ZIP에 XML 멤버가 없거나 XML이 비어 있는 경우
+    """
+    # 제너레이터 안에서 next()의 StopIteration은 RuntimeError로 바뀌므로(PEP 479) 기본값으로 확인
+    with zipfile.ZipFile(io.BytesIO(content)) as archive:
+        name = next((name for name in archive.namelist() if name.lower().endswith('.xml')), None)
+        if name is None:
+            raise ValueError("corpCode.xml 응답에 XML 파일이 없습니다.")
+
+        with archive.open(name) as stream:
+            context = ET.iterparse(stream, events=('start', 'end'))
+            first = next(context, None)
+            if first is None:
+                raise ValueError(f"{name}이(가) 비어 있습니다.")
+            _, root = first
+
+            for event, element in context:
+                if event != 'end' or element.tag != 'list':
+                    continue
+
+                yield {field: (element.findtext(field) or '').strip() for field in _FIELDS}
+                root.clear()
+
+
+class CorpCodeIndex:
+    """
+    기업 고유번호 로컬 인덱스 (SQLite)
+
+    corp_code는 기본키, stock_code와 corp_name에는 B-tree 인덱스를 두어
+    고유번호/종목코드 조회와 회사명 접두어 검색을 O(log n)으로 처리
+    """
+
+    def __init__(self, path: str = '.dart_state/corp_codes.db'):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS corps (
+                corp_code TEXT PRIMARY KEY,
+                corp_name TEXT NOT NULL,
+                corp_eng_name TEXT NOT NULL DEFAULT '',
+                stock_code TEXT NOT NULL DEFAULT '',
+                modify_date TEXT NOT NULL DEFAULT ''
+            );
+            CREATE INDEX IF NOT EXISTS idx_corps_stock_code ON corps(stock_code);
+            CREATE INDEX IF NOT EXISTS idx_corps_corp_name ON corps(corp_name);
+            CREATE TABLE IF NOT EXISTS meta (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL
+            );
+        """)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def last_refreshed(self) -> float:
+        """마지막 갱신 시각 (epoch 초, 없으면 0)"""
+        with self._lock:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'refreshed_at'").fetchone()
+        return float(row['value']) if row else 0.0
+
+    def refresh(self, force: bool = False, max_age: float = DEFAULT_MAX_AGE_SECONDS) -> Optional[int]:
+        """
+        corpCode.xml을 내려받아 인덱스 갱신 (변경된 기업만 반영)
+
+        Args:
+            force: True면 갱신 주기와 관계없이 다운로드
+            max_age: 인덱스가 이 시간(초)보다 오래되었을 때만 다운로드
+
+        Returns:
+            추가/변경된 기업 수, 갱신이 필요 없으면 0, 실패 시 None
+        """
+        if not force and time.time() - self.last_refreshed() < max_age:
+            return 0
+
+        content = dart_api.get_client().get_bytes('corpCode.xml', {})
+        if content is None:
+            print("기업 고유번호 파일을 가져올 수 없습니다.")
+            return None
+
+        try:
+            return self.load(iter_corp_codes(content))
+        except (zipfile.BadZipFile, ET.ParseError, ValueError) as e:
+            print(f"기업 고유번호 파일 파싱 오류: {e}")
+            return None
+
+    def load(self, corps: Iterator[Dict]) -> int:
+        """
+        기업 정보를 인덱스에 반영 (modify_date가 바뀐 기업만 갱신)
+
+        Returns:
+            추가/변경된 기업 수
+        """
+        with self._lock:
+            before = self._conn.total_changes
+            with self._conn:
+                self._conn.executemany("""
+                    INSERT INTO corps (corp_code, corp_name, corp_eng_name, stock_code, modify_date)
+                    VALUES (:corp_code, :corp_name, :corp_eng_name, :stock_code, :modify_date)
+                    ON CONFLICT(corp_code) DO UPDATE SET
+                        corp_name = excluded.corp_name,
+                        corp_eng_name = excluded.corp_eng_name,
+                        stock_code = excluded.stock_code,
+                        modify_date = excluded.modify_date
+                    WHERE excluded.modify_date > corps.modify_date
+                """, corps)
+                changed = self._conn.total_changes - before
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES ('refreshed_at', ?)",
+                    (str(time.time()),)
+                )
+        return changed
+
+    def by_corp_code(self, corp_code: str) -> Optional[Dict]:
+        """고유번호(8자리)로 조회"""
+        return self._fetch_one("SELECT * FROM corps WHERE corp_code = ?", (corp_code,))
+
+    def by_stock_code(self, stock_code: str) -> Optional[Dict]:
+        """종목코드(6자리)로 조회"""
+        return self._fetch_one("SELECT * FROM corps WHERE stock_code = ?", (stock_code,))
+
+    def search_name(self, prefix: str, limit: int = 20) -> List[Dict]:
+        """회사명 접두어 검색 (인덱스 범위 검색)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM corps WHERE corp_name >= ? AND corp_name < ? ORDER BY corp_name LIMIT ?",
+                (prefix, prefix + '\U0010ffff', limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def listed(self) -> List[Dict]:
+        """상장 기업 목록 (종목코드가 있는 기업)"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM corps WHERE stock_code != '' ORDER BY stock_code"
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def resolve(self, query: str) -> Optional[Dict]:
+        """
+        고유번호, 종목코드, 회사명 중 무엇이든 받아 기업 정보로 변환
+
+        Args:
+            query: 고유번호(8자리), 종목코드(6자리) 또는 회사명(접두어)
+
+        Returns:
+            기업 정보 딕셔너리 또는 None
+        """
+        query = query.strip()
+
+        if query.isdigit() and len(query) == 8:
+            return self.by_corp_code(query)
+        if len(query) == 6 and query.isalnum():
+            corp = self.by_stock_code(query)
+            if corp:
+                return corp
+
+        matches = self.search_name(query, limit=50)
+        for corp in matches:
+            if corp['corp_name'] == query:
+                return corp
+
+        # 접두어가 같은 기업이 여럿이면 상장 기업 우선
+        listed = [corp for corp in matches if corp['stock_code']]
+        if listed:
+            return listed[0]
+        return matches[0] if matches else None
+
+    def _fetch_one(self, sql: str, params: tuple) -> Optional[Dict]:
+        with self._lock:
+            row = self._conn.execute(sql, params).fetchone()
+        return dict(row) if row else None
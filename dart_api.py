@@ -3,9 +3,23 @@ DART API 통신 모듈
 전자공시시스템(DART) OpenAPI로 공시 정보 조회
 """
 
+import io
 import os
+import random
+import re
+import threading
+import time
+import zipfile
+from collections.abc import Mapping
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
 import requests
-from typing import List, Dict, Optional
+from requests.adapters import HTTPAdapter
+from typing import Iterator, List, Dict, Optional, Tuple, Union
+
+import metrics
+from dart_cache import DocumentCache
+from parsers.encoding import decode_document
 
 # 환경 변수 로드 (dotenv 없이 직접 처리)
 def load_env():
@@ -25,7 +39,454 @@ load_env()
 
 # API 설정
 DART_API_KEY = os.getenv('DART_API_KEY')
-BASE_URL = 'https://opendart.fss.or.kr/api'
+# 로컬 모의 서버(benchmarks/mock_dart.py) 등 다른 주소로 호출할 때 DART_BASE_URL 지정
+BASE_URL = os.getenv('DART_BASE_URL', 'https://opendart.fss.or.kr/api')
+
+# 문서 캐시 설정 (DART_CACHE_DIR를 빈 문자열로 두면 캐시 비활성화)
+DART_CACHE_DIR = os.getenv('DART_CACHE_DIR', '.dart_cache')
+DART_CACHE_MAX_MB = int(os.getenv('DART_CACHE_MAX_MB', '2048'))
+
+# 호출 제한 설정 (DART 기준: 일 20,000건, 분당 과다 호출 시 IP 차단)
+DEFAULT_RATE_PER_MINUTE = float(os.getenv('DART_RATE_PER_MINUTE', '600'))
+DEFAULT_DAILY_LIMIT = int(os.getenv('DART_DAILY_LIMIT', '20000'))
+
+# 재시도 설정 (최대 재시도 횟수, 지수 백오프 기본 대기 시간(초))
+DEFAULT_MAX_RETRIES = int(os.getenv('DART_MAX_RETRIES', '5'))
+DEFAULT_BACKOFF_BASE = float(os.getenv('DART_BACKOFF_BASE', '0.5'))
+
+# 재시도 대상 DART 상태 코드 (020: 요청 제한 초과, 800: 시스템 점검, 900: 정의되지 않은 오류)
+RETRYABLE_STATUSES = {'020', '800', '900'}
+
+# 정기보고서 코드 (1분기보고서, 반기보고서, 3분기보고서, 사업보고서)
+REPORT_CODE_Q1 = '11013'
+REPORT_CODE_HALF = '11012'
+REPORT_CODE_Q3 = '11014'
+REPORT_CODE_ANNUAL = '11011'
+
+# 다중회사 주요계정 API의 1회 최대 조회 기업 수
+MULTI_ACCOUNT_BATCH_SIZE = 100
+
+_REPORT_PERIOD_PATTERN = re.compile(r'(분기|반기|사업)보고서\s*\((\d{4})\.(\d{2})\)')
+
+_STATUS_XML_PATTERN = re.compile(rb'<status>\s*(\d{3})\s*</status>')
+_MESSAGE_XML_PATTERN = re.compile(rb'<message>(.*?)</message>', re.S)
+
+
+class TokenBucket:
+    """
+    토큰 버킷 방식의 호출 속도 제한기 (스레드 안전)
+
+    분당 rate_per_minute 개의 토큰이 채워지고, 최대 capacity 개까지 순간 호출을 허용
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: int = 10):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """토큰 1개를 얻을 때까지 대기"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
+
+
+class DartClient:
+    """
+    DART OpenAPI 클라이언트
+
+    - keep-alive 커넥션 풀(requests.Session)로 TCP/TLS 연결 재사용
+    - 토큰 버킷으로 분당 호출 속도 제한, 일일 호출 한도 관리
+    - 5xx 응답 및 DART 재시도 상태 코드(020 등)에 대해 지터가 적용된 지수 백오프 재시도
+    - 문서 캐시가 설정되면 캐시된 공시 원문은 네트워크 호출 없이 반환
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: str = BASE_URL,
+        pool_size: int = 10,
+        rate_per_minute: float = DEFAULT_RATE_PER_MINUTE,
+        burst: int = 10,
+        daily_limit: int = DEFAULT_DAILY_LIMIT,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_base: float = DEFAULT_BACKOFF_BASE,
+        backoff_max: float = 30.0,
+        timeout: float = 30.0,
+        cache: Optional[DocumentCache] = None
+    ):
+        self.api_key = api_key or DART_API_KEY
+        self.base_url = base_url.rstrip('/')
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.cache = cache
+
+        self.rate_limiter = TokenBucket(rate_per_minute, burst)
+        self.daily_limit = daily_limit
+        self._daily_count = 0
+        self._daily_date = date.today()
+        self._quota_lock = threading.Lock()
+
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, max_retries=0)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def close(self) -> None:
+        """커넥션 풀 정리"""
+        self.session.close()
+
+    def _consume_quota(self) -> bool:
+        """일일 호출 한도에서 1건 차감 (한도 초과 시 False)"""
+        with self._quota_lock:
+            today = date.today()
+            if today != self._daily_date:
+                self._daily_date = today
+                self._daily_count = 0
+
+            if self._daily_count >= self.daily_limit:
+                return False
+
+            self._daily_count += 1
+            return True
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> None:
+        """지터가 적용된 지수 백오프 대기"""
+        delay = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        if retry_after and retry_after.isdigit():
+            delay = max(delay, min(self.backoff_max, float(retry_after)))
+        time.sleep(random.uniform(delay / 2, delay))
+
+    @staticmethod
+    def _extract_status(response: requests.Response) -> Optional[tuple]:
+        """응답 본문에서 DART 상태 코드와 메시지 추출 (ZIP 등 상태가 없는 응답은 None)"""
+        content = response.content
+        head = content[:1024].lstrip()
+
+        if head.startswith(b'{'):
+            try:
+                data = response.json()
+            except ValueError:
+                return None
+            return data.get('status'), data.get('message')
+
+        if head.startswith(b'<'):
+            status_match = _STATUS_XML_PATTERN.search(head)
+            if status_match:
+                message_match = _MESSAGE_XML_PATTERN.search(head)
+                message = message_match.group(1).decode('utf-8', errors='ignore') if message_match else ''
+                return status_match.group(1).decode('ascii'), message
+
+        return None
+
+    def request(self, endpoint: str, params: Dict) -> Optional[requests.Response]:
+        """
+        API 호출 (속도 제한 및 재시도 포함)
+
+        Args:
+            endpoint: API 엔드포인트 (예: 'list.json')
+            params: 요청 파라미터 (crtfc_key 제외)
+
+        Returns:
+            응답 객체 또는 None
+        """
+        url = f'{self.base_url}/{endpoint}'
+        params = {'crtfc_key': self.api_key, **params}
+        metrics.inc('dart_api_requests_total', endpoint=endpoint)
+
+        for attempt in range(self.max_retries + 1):
+            last_attempt = attempt == self.max_retries
+
+            if not self._consume_quota():
+                print(f"일일 호출 한도({self.daily_limit}건) 초과")
+                return None
+
+            self.rate_limiter.acquire()
+
+            try:
+                response = self.session.get(url, params=params, timeout=self.timeout)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                if last_attempt:
+                    print(f"요청 오류: {e}")
+                    return None
+                metrics.inc('dart_retries_total', endpoint=endpoint, reason='connection')
+                self._backoff(attempt)
+                continue
+            except requests.exceptions.RequestException as e:
+                print(f"요청 오류: {e}")
+                return None
+
+            if response.status_code >= 500 or response.status_code == 429:
+                if last_attempt:
+                    print(f"요청 오류: HTTP {response.status_code}")
+                    return None
+                metrics.inc('dart_retries_total', endpoint=endpoint, reason=f'http_{response.status_code}')
+                self._backoff(attempt, response.headers.get('Retry-After'))
+                continue
+
+            try:
+                response.raise_for_status()
+            except requests.exceptions.RequestException as e:
+                print(f"요청 오류: {e}")
+                return None
+
+            status = self._extract_status(response)
+            if status and status[0] in RETRYABLE_STATUSES:
+                if last_attempt:
+                    print(f"API 오류: {status[1]} (재시도 한도 초과)")
+                    return None
+                metrics.inc('dart_retries_total', endpoint=endpoint, reason=f'status_{status[0]}')
+                self._backoff(attempt)
+                continue
+
+            return response
+
+        return None
+
+    def get_json(self, endpoint: str, params: Dict) -> Optional[Dict]:
+        """JSON API 호출 (DART 상태 코드는 호출자가 확인)"""
+        response = self.request(endpoint, params)
+        if response is None:
+            return None
+
+        try:
+            return response.json()
+        except ValueError as e:
+            print(f"응답 파싱 오류: {e}")
+            return None
+
+    def get_bytes(self, endpoint: str, params: Dict) -> Optional[bytes]:
+        """바이너리 API 호출 (DART 오류 상태 응답이면 None)"""
+        response = self.request(endpoint, params)
+        if response is None:
+            return None
+
+        status = self._extract_status(response)
+        if status and status[0] != '000':
+            print(f"API 오류: {status[1]}")
+            return None
+
+        return response.content
+
+    def fetch_document(self, rcept_no: str) -> Optional[bytes]:
+        """
+        공시 원문(document.xml) 응답 바이트 조회 (캐시 우선)
+
+        Args:
+            rcept_no: 접수번호 (14자리)
+
+        Returns:
+            응답 바이트 또는 None
+        """
+        if self.cache is not None:
+            content = self.cache.get(rcept_no)
+            if content is not None:
+                return content
+
+        with metrics.timer('dart_download_seconds'):
+            content = self.get_bytes('document.xml', {'rcept_no': rcept_no})
+
+        if content is not None:
+            metrics.observe('dart_download_bytes', len(content), buckets=metrics.BYTES_BUCKETS)
+
+        if content is not None and self.cache is not None:
+            self.cache.put(rcept_no, content)
+
+        return content
+
+
+class DocumentArchive(Mapping):
+    """
+    document.xml 응답(ZIP)을 메모리에서 여는 지연 매핑 (멤버 이름 → 디코딩된 문서)
+
+    디스크에 풀지 않고 BytesIO 위에서 ZIP을 열며, 멤버는 처음 접근할 때만 압축 해제/디코딩
+    ZIP이 아닌 응답은 멤버 1개짜리 아카이브로 취급
+    """
+
+    def __init__(self, content: bytes, rcept_no: str = ''):
+        self.rcept_no = rcept_no
+        self._decoded: Dict[str, str] = {}
+
+        if content[:4] == b'PK\x03\x04':
+            self._zip = zipfile.ZipFile(io.BytesIO(content))
+            self._raw = None
+            self._names = [info.filename for info in self._zip.infolist() if not info.is_dir()]
+        else:
+            self._zip = None
+            self._raw = content
+            self._names = [f"{rcept_no or 'document'}.xml"]
+
+    @property
+    def main_name(self) -> str:
+        """본문 문서 이름 (첨부서류는 '{접수번호}_{코드}.xml' 형식)"""
+        for name in self._names:
+            if os.path.splitext(os.path.basename(name))[0] == self.rcept_no:
+                return name
+
+        for name in self._names:
+            if '_' not in os.path.basename(name):
+                return name
+
+        return self._names[0]
+
+    def read_bytes(self, name: str) -> bytes:
+        """멤버의 원본 바이트 (디코딩하지 않음)"""
+        if name not in self._names:
+            raise KeyError(name)
+        if self._zip is None:
+            return self._raw
+        return self._zip.read(name)
+
+    def __getitem__(self, name: str) -> str:
+        if name not in self._decoded:
+            self._decoded[name] = decode_document(self.read_bytes(name))
+        return self._decoded[name]
+
+    def __iter__(self):
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+_default_client: Optional[DartClient] = None
+_default_client_lock = threading.Lock()
+
+
+def _default_cache() -> Optional[DocumentCache]:
+    """환경 변수 설정에 따른 기본 문서 캐시"""
+    if not DART_CACHE_DIR:
+        return None
+    return DocumentCache(DART_CACHE_DIR, DART_CACHE_MAX_MB * 1024 * 1024)
+
+
+def get_client() -> DartClient:
+    """모듈 공용 DartClient 반환 (커넥션 풀과 호출 한도를 프로세스 전체에서 공유)"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = DartClient(cache=_default_cache())
+        return _default_client
+
+
+def configure_client(**kwargs) -> DartClient:
+    """
+    공용 DartClient를 주어진 설정으로 다시 생성 (cache를 지정하지 않으면 기본 문서 캐시 사용)
+
+    Args:
+        kwargs: DartClient 생성자 인자 (pool_size, rate_per_minute 등)
+
+    Returns:
+        새 공용 DartClient
+    """
+    kwargs.setdefault('cache', _default_cache())
+    client = DartClient(**kwargs)
+    set_client(client)
+    return client
+
+
+def set_client(client: DartClient) -> None:
+    """모듈 공용 DartClient 교체 (설정 변경 시 사용)"""
+    global _default_client
+    with _default_client_lock:
+        _default_client = client
+
+
+class DisclosureListError(Exception):
+    """공시 목록 조회 실패 (일부 페이지만 받은 목록은 불완전하므로 워터마크를 옮기면 안 됨)"""
+
+
+def _fetch_list_page(params: Dict, page_no: int) -> Optional[Dict]:
+    """공시 목록 1페이지 조회 (DART 응답 딕셔너리 또는 None)"""
+    with metrics.timer('dart_list_fetch_seconds'):
+        return get_client().get_json('list.json', {**params, 'page_no': page_no})
+
+
+def iter_disclosures(
+    corp_code: Optional[str],
+    begin_de: str,
+    end_de: str,
+    pblntf_ty: Optional[str] = 'A',
+    page_count: int = 100,
+    pblntf_detail_ty: Optional[str] = None,
+    prefetch: bool = True
+) -> Iterator[Dict]:
+    """
+    공시 목록을 전체 페이지에 걸쳐 순차적으로 반환하는 제너레이터
+
+    현재 페이지를 소비하는 동안 다음 페이지를 미리 조회(prefetch)하며,
+    한 번에 한 페이지만 메모리에 유지합니다.
+    prefetch=False면 현재 페이지를 끝까지 소비한 뒤에 다음 페이지를 조회하므로,
+    첫 페이지에서 멈추는 호출자(감시 모드)는 list.json을 1회만 호출합니다.
+
+    Args:
+        corp_code: 고유번호 (8자리, None이면 전체 회사 - DART 제약상 조회 기간 3개월 이내)
+        begin_de: 시작일 (YYYYMMDD)
+        end_de: 종료일 (YYYYMMDD)
+        pblntf_ty: 공시유형 (None이면 전체 유형)
+        page_count: 페이지당 건수 (최대 100)
+        pblntf_detail_ty: 공시상세유형 (예: B001 주요사항보고서)
+        prefetch: 현재 페이지를 소비하는 동안 다음 페이지를 미리 조회할지 여부
+
+    Yields:
+        공시 목록의 각 행 딕셔너리
+
+    Raises:
+        DisclosureListError: 페이지 조회 실패 또는 DART 오류 응답 (그 전까지 반환한 행은 목록의 일부일 뿐임)
+    """
+    params = {
+        'bgn_de': begin_de,
+        'end_de': end_de,
+        'page_count': page_count
+    }
+    if corp_code:
+        params['corp_code'] = corp_code
+    if pblntf_ty:
+        params['pblntf_ty'] = pblntf_ty
+    if pblntf_detail_ty:
+        params['pblntf_detail_ty'] = pblntf_detail_ty
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix='dart-list') as executor:
+        page_no = 1
+        pending = executor.submit(_fetch_list_page, params, page_no)
+
+        while pending is not None:
+            data = pending.result()
+            pending = None
+
+            if data is None:
+                raise DisclosureListError(f"공시 목록 {page_no}페이지 조회 실패")
+
+            status = data.get('status')
+            if status == '013':
+                # 조회된 데이터 없음
+                return
+            if status != '000':
+                raise DisclosureListError(f"공시 목록 {page_no}페이지 API 오류: {data.get('message')} ({status})")
+
+            has_next = page_no < int(data.get('total_page') or 1)
+            if has_next and prefetch:
+                pending = executor.submit(_fetch_list_page, params, page_no + 1)
+
+            yield from data.get('list', [])
+
+            if has_next and not prefetch:
+                pending = executor.submit(_fetch_list_page, params, page_no + 1)
+            page_no += 1
 
 
 def get_disclosure_list(
@@ -35,7 +496,7 @@ def get_disclosure_list(
     pblntf_ty: str = 'A'
 ) -> Optional[List[Dict]]:
     """
-    공시 목록 조회
+    공시 목록 조회 (전체 페이지)
     
     Args:
         corp_code: 고유번호 (8자리)
@@ -44,76 +505,182 @@ def get_disclosure_list(
         pblntf_ty: 공시유형 (A: 정기공시, B: 주요사항보고, C: 발행공시, D: 지분공시, E: 기타공시, F: 외부감사관련, G: 펀드공시, H: 자산유동화, I: 거래소공시, J: 공정위공시)
     
     Returns:
-        공시 목록 리스트 또는 None
+        공시 목록 리스트 (공시가 없으면 빈 리스트) 또는 None (조회 실패, 일부 페이지만 받은 경우 포함)
     """
-    url = f'{BASE_URL}/list.json'
+    try:
+        return list(iter_disclosures(corp_code, begin_de, end_de, pblntf_ty))
+    except DisclosureListError as e:
+        print(f"{e} - 목록이 불완전하여 사용하지 않습니다.")
+        return None
+
+
+def get_disclosure_documents(rcept_no: str) -> Optional[DocumentArchive]:
+    """
+    공시 원문 아카이브 조회 (본문 + 첨부서류)
     
-    params = {
-        'crtfc_key': DART_API_KEY,
-        'corp_code': corp_code,
-        'bgn_de': begin_de,
-        'end_de': end_de,
-        'pblntf_ty': pblntf_ty,
-        'page_count': 100
-    }
+    Args:
+        rcept_no: 접수번호 (14자리)
+    
+    Returns:
+        멤버 이름 → 문서 문자열 지연 매핑 또는 None
+    """
+    content = get_client().fetch_document(rcept_no)
+    if content is None:
+        print(f"상세 조회 오류: {rcept_no}")
+        return None
     
     try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        if data.get('status') == '000':
-            return data.get('list', [])
-        else:
-            print(f"API 오류: {data.get('message')}")
-            return None
-            
-    except requests.exceptions.RequestException as e:
-        print(f"요청 오류: {e}")
+        return DocumentArchive(content, rcept_no)
+    except zipfile.BadZipFile as e:
+        print(f"문서 압축 해제 오류: {e}")
         return None
 
 
-def get_disclosure_detail(rcept_no: str) -> Optional[str]:
+def get_disclosure_detail(rcept_no: str, raw: bool = False) -> Optional[Union[str, bytes]]:
     """
-    공시 상세 내용(HTML) 조회
+    공시 상세 내용(HTML) 조회 (아카이브의 본문 문서)
     
     Args:
         rcept_no: 접수번호 (14자리)
+        raw: True면 디코딩하지 않은 원본 바이트 반환 (lxml 기반 파서에 바로 전달할 때 사용)
     
     Returns:
-        HTML 문자열 또는 None
+        HTML 문자열(raw=True면 바이트) 또는 None
     """
-    url = f'{BASE_URL}/document.xml'
+    archive = get_disclosure_documents(rcept_no)
+    if archive is None or not archive:
+        return None
     
-    params = {
-        'crtfc_key': DART_API_KEY,
-        'rcept_no': rcept_no
+    main_name = archive.main_name
+    if raw:
+        return archive.read_bytes(main_name)
+    
+    # 인코딩은 BOM/XML 선언/meta charset에서 한 번만 감지하여 디코딩
+    return archive[main_name]
+
+
+def parse_report_period(report_nm: str) -> Optional[Tuple[str, str]]:
+    """
+    보고서명에서 사업연도와 보고서 코드 추출 (예: '분기보고서 (2024.03)' → ('2024', '11013'))
+
+    결산월이 12월이 아닌 기업은 보고서 월로 분기를 판별할 수 없으므로 None
+
+    Args:
+        report_nm: 공시 목록의 보고서명
+
+    Returns:
+        (사업연도, 보고서 코드) 또는 None
+    """
+    match = _REPORT_PERIOD_PATTERN.search(report_nm)
+    if not match:
+        return None
+
+    kind, year, month = match.groups()
+    report_codes = {
+        ('분기', '03'): REPORT_CODE_Q1,
+        ('반기', '06'): REPORT_CODE_HALF,
+        ('분기', '09'): REPORT_CODE_Q3,
+        ('사업', '12'): REPORT_CODE_ANNUAL,
     }
+    reprt_code = report_codes.get((kind, month))
+    return (year, reprt_code) if reprt_code else None
+
+
+def get_multi_accounts(corp_codes: List[str], bsns_year: str, reprt_code: str) -> Tuple[List[Dict], List[str]]:
+    """
+    다중회사 주요계정 조회 (fnlttMultiAcnt, 최대 100개 기업씩 묶어서 호출)
     
-    try:
-        response = requests.get(url, params=params)
-        response.raise_for_status()
-        
-        # 다양한 인코딩 시도
-        content = response.content
-        
-        # 인코딩 감지 및 변환
-        encodings_to_try = ['utf-8', 'euc-kr', 'cp949', 'iso-8859-1']
-        
-        for encoding in encodings_to_try:
-            try:
-                decoded_content = content.decode(encoding)
-                # 한글이 제대로 디코딩되었는지 확인
-                if '매출액' in decoded_content or '영업이익' in decoded_content or '손익계산서' in decoded_content:
-                    return decoded_content
-            except UnicodeDecodeError:
-                continue
-        
-        # 모든 인코딩이 실패하면 utf-8로 강제 변환 (에러 무시)
-        return content.decode('utf-8', errors='ignore')
+    Args:
+        corp_codes: 고유번호 목록
+        bsns_year: 사업연도 (YYYY)
+        reprt_code: 보고서 코드 (11013: 1분기, 11012: 반기, 11014: 3분기, 11011: 사업보고서)
+    
+    Returns:
+        (주요계정 행 목록, 조회 실패한 묶음의 고유번호 목록) 튜플
+        (데이터 없음(013)은 실패가 아니므로 행도 실패 목록도 없음)
+    """
+    rows = []
+    failed = []
+    
+    for start in range(0, len(corp_codes), MULTI_ACCOUNT_BATCH_SIZE):
+        batch = corp_codes[start:start + MULTI_ACCOUNT_BATCH_SIZE]
+        data = get_client().get_json('fnlttMultiAcnt.json', {
+            'corp_code': ','.join(batch),
+            'bsns_year': bsns_year,
+            'reprt_code': reprt_code
+        })
         
-    except requests.exceptions.RequestException as e:
-        print(f"상세 조회 오류: {e}")
+        status = data.get('status') if data is not None else None
+        if status == '000':
+            rows.extend(data.get('list', []))
+        elif status != '013':
+            message = data.get('message') if data is not None else '응답 없음'
+            print(
+                f"주요계정 묶음 조회 실패 ({bsns_year}/{reprt_code}, 상태 {status or '-'}: {message}): "
+                f"{len(batch)}개 기업 {', '.join(batch)}"
+            )
+            metrics.inc('dart_multi_account_failures_total', status=status or 'none')
+            failed.extend(batch)
+    
+    return rows, failed
+
+
+def get_financial_statements(
+    corp_code: str,
+    bsns_year: str,
+    reprt_code: str,
+    fs_div: str = 'CFS'
+) -> Optional[List[Dict]]:
+    """
+    단일회사 전체 재무제표 조회 (fnlttSinglAcntAll)
+    
+    Args:
+        corp_code: 고유번호 (8자리)
+        bsns_year: 사업연도 (YYYY)
+        reprt_code: 보고서 코드
+        fs_div: CFS(연결재무제표) 또는 OFS(재무제표)
+    
+    Returns:
+        계정 행 목록 또는 None
+    """
+    data = get_client().get_json('fnlttSinglAcntAll.json', {
+        'corp_code': corp_code,
+        'bsns_year': bsns_year,
+        'reprt_code': reprt_code,
+        'fs_div': fs_div
+    })
+    
+    if data is None:
         return None
+    if data.get('status') == '000':
+        return data.get('list', [])
+    if data.get('status') != '013':
+        print(f"API 오류: {data.get('message')}")
+    return None
+
 
+def get_rights_issue_decisions(corp_code: str, begin_de: str, end_de: str) -> Optional[List[Dict]]:
+    """
+    유상증자 결정 주요사항보고서 구조화 데이터 조회 (piicDecsn)
+    
+    Args:
+        corp_code: 고유번호 (8자리)
+        begin_de: 시작일 (YYYYMMDD)
+        end_de: 종료일 (YYYYMMDD)
+    
+    Returns:
+        유상증자 결정 행 목록 또는 None
+    """
+    data = get_client().get_json('piicDecsn.json', {
+        'corp_code': corp_code,
+        'bgn_de': begin_de,
+        'end_de': end_de
+    })
+    
+    if data is None:
+        return None
+    if data.get('status') == '000':
+        return data.get('list', [])
+    if data.get('status') != '013':
+        print(f"API 오류: {data.get('message')}")
+    return None
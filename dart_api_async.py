@@ -0,0 +1,73 @@
+"""
+DART API 비동기 모듈
+asyncio 기반으로 여러 공시 문서를 동시에 다운로드
+
+비동기 HTTP 클라이언트를 따로 두지 않고, 동기 클라이언트(dart_api.get_disclosure_detail)를
+run_in_executor로 스레드 풀에서 실행함 (동시 다운로드 수만큼 스레드를 사용하며,
+이벤트 루프는 세마포어로 동시 요청 수만 제한하고 완료 순서대로 결과를 모음)
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterator, Iterable, Optional, Tuple, Union
+
+import dart_api
+
+DEFAULT_CONCURRENCY = 8
+
+
+async def get_disclosure_detail(
+    rcept_no: str,
+    executor: Optional[ThreadPoolExecutor] = None,
+    raw: bool = False
+) -> Optional[Union[str, bytes]]:
+    """
+    공시 상세 내용(HTML) 비동기 조회
+
+    Args:
+        rcept_no: 접수번호 (14자리)
+        executor: 다운로드를 실행할 스레드 풀 (None이면 기본 풀)
+        raw: True면 디코딩하지 않은 원본 바이트 반환
+
+    Returns:
+        HTML 문자열(raw=True면 바이트) 또는 None
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor, dart_api.get_disclosure_detail, rcept_no, raw)
+
+
+async def get_disclosure_detail_many(
+    rcept_nos: Iterable[str],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    raw: bool = False
+) -> AsyncIterator[Tuple[str, Optional[Union[str, bytes]]]]:
+    """
+    여러 공시 문서를 동시에 조회하고 완료되는 순서대로 반환
+
+    동시 요청 수는 세마포어로 concurrency 개로 제한되며, 모든 요청은 공용 DartClient를
+    거치므로 커넥션 풀, 호출 속도 제한, 재시도 정책이 그대로 적용됩니다.
+
+    Args:
+        rcept_nos: 접수번호 목록
+        concurrency: 최대 동시 다운로드 수
+        raw: True면 디코딩하지 않은 원본 바이트 반환
+
+    Yields:
+        (접수번호, HTML 문자열(raw=True면 바이트) 또는 None) 튜플
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix='dart-download') as executor:
+
+        async def fetch(rcept_no: str) -> Tuple[str, Optional[Union[str, bytes]]]:
+            async with semaphore:
+                return rcept_no, await get_disclosure_detail(rcept_no, executor, raw)
+
+        tasks = [asyncio.ensure_future(fetch(rcept_no)) for rcept_no in rcept_nos]
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
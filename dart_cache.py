@@ -0,0 +1,181 @@
+"""
+DART 문서 캐시 모듈
+접수번호(rcept_no)로 식별되는 공시 원문은 변경되지 않으므로 응답 바이트를 디스크에 영구 보관
+"""
+
+import hashlib
+import os
+import tempfile
+import threading
+import zlib
+from typing import Dict, Optional
+
+import metrics
+
+# 저장 형식 헤더 (압축 이득이 없는 ZIP 응답 등은 원본 그대로 저장)
+_HEADER_ZLIB = b'Z'
+_HEADER_RAW = b'R'
+
+
+class DocumentCache:
+    """
+    크기 제한 LRU 디스크 캐시
+
+    - 응답 바이트를 zlib으로 압축하여 저장 (압축 효과가 없으면 원본 저장)
+    - 임시 파일에 쓴 뒤 os.replace로 교체하여 여러 프로세스가 동시에 써도 안전
+    - 조회 시 파일 수정 시각을 갱신하고, 총 용량 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+    """
+
+    def __init__(self, cache_dir: str = '.dart_cache', max_bytes: int = 2 * 1024 ** 3, compress_level: int = 6):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+
+        self.hits = 0
+        self.misses = 0
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, rcept_no: str) -> str:
+        """접수번호 해시 앞 2자리로 디렉토리를 분산한 캐시 파일 경로"""
+        digest = hashlib.sha1(rcept_no.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{rcept_no}.bin")
+
+    def get(self, rcept_no: str) -> Optional[bytes]:
+        """
+        캐시된 응답 바이트 조회
+
+        Args:
+            rcept_no: 접수번호 (14자리)
+
+        Returns:
+            응답 바이트 또는 None (캐시 미스)
+        """
+        path = self._path(rcept_no)
+
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self.misses += 1
+            metrics.inc('dart_cache_misses_total')
+            return None
+
+        try:
+            content = zlib.decompress(data[1:]) if data[:1] == _HEADER_ZLIB else data[1:]
+        except zlib.error:
+            # 손상된 항목은 버리고 미스로 처리
+            self._remove(path)
+            with self._lock:
+                self.misses += 1
+            metrics.inc('dart_cache_misses_total')
+            return None
+
+        with self._lock:
+            self.hits += 1
+        metrics.inc('dart_cache_hits_total')
+        return content
+
+    def put(self, rcept_no: str, content: bytes) -> None:
+        """
+        응답 바이트를 원자적으로 저장
+
+        Args:
+            rcept_no: 접수번호 (14자리)
+            content: 응답 바이트
+        """
+        compressed = zlib.compress(content, self.compress_level)
+        data = _HEADER_ZLIB + compressed if len(compressed) < len(content) else _HEADER_RAW + content
+
+        path = self._path(rcept_no)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"캐시 저장 오류: {e}")
+            self._remove(tmp_path)
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += len(data)
+            over_limit = self._size > self.max_bytes
+
+        if over_limit:
+            self.evict()
+
+    def evict(self) -> int:
+        """
+        총 용량이 max_bytes 이하가 될 때까지 오래된 항목 삭제
+
+        Returns:
+            삭제된 항목 수
+        """
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if not name.endswith('.bin'):
+                    continue
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+
+        # 목표치를 최대 용량의 90%로 잡아 저장할 때마다 삭제가 반복되지 않도록 함
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in sorted(entries):
+            if total <= target:
+                break
+            if self._remove(path):
+                total -= size
+                removed += 1
+
+        with self._lock:
+            self._size = total
+        return removed
+
+    def stats(self) -> Dict:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0
+            }
+
+    def _scan_size(self) -> int:
+        """캐시 디렉토리의 현재 총 용량"""
+        total = 0
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith('.bin'):
+                    try:
+                        total += os.path.getsize(os.path.join(root, name))
+                    except OSError:
+                        continue
+        return total
+
+    @staticmethod
+    def _remove(path: str) -> bool:
+        try:
+            os.remove(path)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,133 @@
+"""
+주요사항보고 시장 전체 스캔 모듈
+기업을 지정하지 않고 기간 내 모든 유상증자결정 공시를 찾아 구조화 API(piicDecsn)로 일괄 조회
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import dart_api
+import dart_api_async
+from parse_cache import ParseCache
+from parsers import load_parser
+
+# 기업 미지정 목록 조회의 최대 기간 (DART 제약: 3개월)
+MARKET_SCAN_WINDOW_DAYS = 90
+
+RIGHTS_ISSUE_REPORT_NAME = '유상증자결정'
+RIGHTS_ISSUE_PARSER = 'parsers.parser_rights_issue'
+
+
+def iter_date_windows(begin_de: str, end_de: str, days: int = MARKET_SCAN_WINDOW_DAYS) -> Iterator[Tuple[str, str]]:
+    """조회 기간을 days일 이하 구간으로 분할 (YYYYMMDD)"""
+    start = datetime.strptime(begin_de, '%Y%m%d')
+    end = datetime.strptime(end_de, '%Y%m%d')
+
+    while start <= end:
+        window_end = min(end, start + timedelta(days=days - 1))
+        yield start.strftime('%Y%m%d'), window_end.strftime('%Y%m%d')
+        start = window_end + timedelta(days=1)
+
+
+def find_rights_issue_reports(begin_de: str, end_de: str) -> List[Dict]:
+    """
+    기간 내 시장 전체의 유상증자결정 주요사항보고서 목록 조회
+
+    Returns:
+        공시 목록 행 (접수번호 순, 중복 제거)
+    """
+    reports: Dict[str, Dict] = {}
+    for window_begin, window_end in iter_date_windows(begin_de, end_de):
+        try:
+            for report in dart_api.iter_disclosures(None, window_begin, window_end, pblntf_ty='B', pblntf_detail_ty='B001'):
+                if RIGHTS_ISSUE_REPORT_NAME in report.get('report_nm', ''):
+                    reports[report.get('rcept_no', '')] = report
+        except dart_api.DisclosureListError as e:
+            print(f"{e} - {window_begin}~{window_end} 구간의 유상증자결정 공시가 일부 누락될 수 있습니다.")
+
+    return [reports[rcept_no] for rcept_no in sorted(reports)]
+
+
+def scan_rights_issues(
+    begin_de: str,
+    end_de: str,
+    workers: int = 8,
+    parse_cache: Optional[ParseCache] = None
+) -> Iterator[Tuple[Dict, Optional[Dict], str]]:
+    """
+    시장 전체 유상증자 결정을 구조화 데이터로 조회
+
+    1. 기업 미지정 목록 조회(주요사항보고, 3개월 단위)로 유상증자결정 공시를 찾음
+    2. 공시가 있는 기업별로 piicDecsn을 한 번씩 호출하여 구조화 데이터를 받음
+    3. API 결과에 핵심 항목이 빠진 공시만 원문 HTML을 동시에 받아(dart_api_async) parser_rights_issue.parse로 보완
+
+    Args:
+        begin_de: 시작일 (YYYYMMDD)
+        end_de: 종료일 (YYYYMMDD)
+        workers: 기업별 API 호출/HTML 보완 동시 작업 수
+        parse_cache: 파싱 결과 캐시 (원문/파서 버전이 같으면 다시 파싱하지 않음)
+
+    Yields:
+        (공시 목록 행, 유상증자 데이터 또는 None, 데이터 출처) 튜플
+    """
+    reports = find_rights_issue_reports(begin_de, end_de)
+    if not reports:
+        return
+
+    parser_rights_issue = load_parser(RIGHTS_ISSUE_PARSER)
+
+    corp_codes = sorted({report.get('corp_code', '') for report in reports})
+
+    # 기업별 구조화 데이터 조회 (접수번호 → 결정 행)
+    decisions: Dict[str, Dict] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='dart-scan') as executor:
+        for rows in executor.map(lambda code: dart_api.get_rights_issue_decisions(code, begin_de, end_de), corp_codes):
+            for row in rows or []:
+                decisions[row.get('rcept_no', '')] = row
+
+    structured: Dict[str, Optional[Dict]] = {}
+    for report in reports:
+        decision = decisions.get(report.get('rcept_no', ''))
+        structured[report.get('rcept_no', '')] = parser_rights_issue.parse_structured(decision) if decision else None
+
+    # API에 없거나 불완전한 공시만 원문 HTML을 동시에 받아 보완
+    html_rcept_nos = [
+        rcept_no for rcept_no, result in structured.items()
+        if not (result and parser_rights_issue.is_complete(result))
+    ]
+    if parse_cache is not None:
+        def parse_fn(content):
+            return parse_cache.parse(RIGHTS_ISSUE_PARSER, content, parser_rights_issue.parse)
+    else:
+        parse_fn = parser_rights_issue.parse
+    parsed_html = asyncio.run(fetch_and_parse(html_rcept_nos, workers, parse_fn)) if html_rcept_nos else {}
+
+    for report in reports:
+        rcept_no = report.get('rcept_no', '')
+        result = structured[rcept_no]
+
+        if rcept_no not in parsed_html:
+            yield report, result, "piicDecsn"
+        elif result:
+            yield report, parser_rights_issue.merge_results(result, parsed_html[rcept_no]), "piicDecsn+HTML"
+        else:
+            yield report, parsed_html[rcept_no], "HTML 파싱"
+
+
+async def fetch_and_parse(
+    rcept_nos: Iterable[str],
+    concurrency: int,
+    parse_fn: Callable[[bytes], Optional[Dict]]
+) -> Dict[str, Optional[Dict]]:
+    """
+    공시 원문을 동시에 받아 도착하는 순서대로 파싱 (원문은 파싱 후 바로 버림)
+
+    Returns:
+        접수번호 → 파싱 결과 (다운로드/파싱 실패 시 None)
+    """
+    parsed: Dict[str, Optional[Dict]] = {}
+    async for rcept_no, html_content in dart_api_async.get_disclosure_detail_many(rcept_nos, concurrency, raw=True):
+        parsed[rcept_no] = parse_fn(html_content) if html_content else None
+    return parsed
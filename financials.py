@@ -0,0 +1,100 @@
+"""
+구조화 재무정보 조회 모듈
+DART 재무제표 API로 정기보고서의 손익계산서 계정을 조회하여 HTML 다운로드/파싱을 대체
+"""
+
+import threading
+from typing import Dict, List, Optional, Set, Tuple
+
+import dart_api
+
+
+class StructuredFinancials:
+    """
+    다중회사 주요계정(fnlttMultiAcnt) 묶음 조회기
+
+    목록 조회 단계에서 register()로 필요한 (기업, 사업연도, 보고서 코드)를 등록해 두면,
+    처음 get()이 호출될 때 같은 사업연도/보고서 코드로 등록된 기업들을 최대 100개씩 묶어 한 번에 조회
+    주요계정 API에 없는 기업은 단일회사 전체 재무제표(fnlttSinglAcntAll)로 한 번 더 조회
+    (연결재무제표가 없으면 별도재무제표로 조회)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # (사업연도, 보고서 코드) → 아직 조회하지 않은 기업
+        self._pending: Dict[Tuple[str, str], Set[str]] = {}
+        # (사업연도, 보고서 코드)별 조회 락 (같은 묶음을 중복 조회하지 않도록)
+        self._group_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        # (기업, 사업연도, 보고서 코드) → 계정 행 목록
+        self._accounts: Dict[Tuple[str, str, str], List[Dict]] = {}
+        # 종목코드 → 고유번호 (주요계정 응답 행에 고유번호가 없을 때 사용)
+        self._corp_by_stock: Dict[str, str] = {}
+        # 단일회사 전체 재무제표까지 조회한 항목
+        self._single_fetched: Set[Tuple[str, str, str]] = set()
+
+    def register(self, corp_code: str, bsns_year: str, reprt_code: str, stock_code: str = '') -> None:
+        """조회 대상 등록 (실제 조회는 get() 시점에 묶어서 수행)"""
+        key = (bsns_year, reprt_code)
+        with self._lock:
+            if stock_code:
+                self._corp_by_stock[stock_code.strip()] = corp_code
+            if (corp_code, bsns_year, reprt_code) not in self._accounts:
+                self._pending.setdefault(key, set()).add(corp_code)
+                self._group_locks.setdefault(key, threading.Lock())
+
+    def get(self, corp_code: str, bsns_year: str, reprt_code: str, stock_code: str = '') -> Optional[List[Dict]]:
+        """
+        기업의 주요계정 행 조회
+
+        Args:
+            corp_code: 고유번호 (8자리)
+            bsns_year: 사업연도 (YYYY)
+            reprt_code: 보고서 코드
+            stock_code: 종목코드 (6자리)
+
+        Returns:
+            계정 행 목록 또는 None (구조화 데이터 없음)
+        """
+        self.register(corp_code, bsns_year, reprt_code, stock_code)
+        key = (bsns_year, reprt_code)
+        account_key = (corp_code, bsns_year, reprt_code)
+
+        with self._group_locks[key]:
+            with self._lock:
+                fetched = account_key in self._accounts
+                if not fetched:
+                    batch = [corp_code] + sorted(self._pending[key] - {corp_code})
+                    batch = batch[:dart_api.MULTI_ACCOUNT_BATCH_SIZE]
+                    self._pending[key].difference_update(batch)
+
+            if not fetched:
+                rows_by_corp: Dict[str, List[Dict]] = {code: [] for code in batch}
+                rows, failed = dart_api.get_multi_accounts(batch, bsns_year, reprt_code)
+                for row in rows:
+                    code = row.get('corp_code') or self._corp_by_stock.get((row.get('stock_code') or '').strip())
+                    if code in rows_by_corp:
+                        rows_by_corp[code].append(row)
+                # 묶음 조회에 실패한 기업은 빈 행으로 두어 아래에서 단일회사 전체 재무제표로 조회
+                for code in failed:
+                    rows_by_corp[code] = []
+
+                with self._lock:
+                    for code, rows in rows_by_corp.items():
+                        self._accounts[(code, bsns_year, reprt_code)] = rows
+
+            with self._lock:
+                accounts = self._accounts[account_key]
+                if accounts or account_key in self._single_fetched:
+                    return accounts or None
+                self._single_fetched.add(account_key)
+
+        # 주요계정 API에 없는 기업은 단일회사 전체 재무제표로 한 번만 조회
+        # (종속회사가 없어 별도재무제표만 제출하는 기업은 연결(CFS) 조회가 013이므로 별도(OFS)로 다시 조회)
+        accounts = (
+            dart_api.get_financial_statements(corp_code, bsns_year, reprt_code, fs_div='CFS')
+            or dart_api.get_financial_statements(corp_code, bsns_year, reprt_code, fs_div='OFS')
+            or []
+        )
+        with self._lock:
+            self._accounts[account_key] = accounts
+        return accounts or None
@@ -1,142 +1,630 @@
 """
 DART 공시 데이터 추출 메인 스크립트
-특정 기업의 공시 문서 조회하고 HTML을 파싱하여 구조화된 JSON으로 저장
+기업들의 공시 문서 조회하고 HTML을 파싱하여 구조화된 JSON으로 저장
 """
 
 import os
-import json
+import argparse
+import threading
+import time
 from datetime import datetime, timedelta
-from dart_api import get_disclosure_list, get_disclosure_detail
-from parsers import parser_earnings, parser_rights_issue
+from typing import Dict, List, Optional
 
+import dart_api
+import metrics
+from dart_api import get_disclosure_list, get_disclosure_detail, parse_report_period
+from parsers import load_parser, match_report
+from sync_state import WatermarkStore
+from corp_codes import CorpCodeIndex
+from scheduler import FairScheduler
+from financials import StructuredFinancials
+from event_scanner import scan_rights_issues
+from pipeline import SOURCE_DOWNLOAD_FAILED, Pipeline
+from parse_cache import ParseCache
+from sinks import DEFAULT_BATCH_SIZE, OPTIONAL_INSTALL, SINKS, make_sink, missing_dependency
+from run_manifest import RunManifest, remove_stray_documents
+from watcher import DEFAULT_POLL_INTERVAL, FilingWatcher
+
+# 동시 작업 수 (목록 조회 + 문서 다운로드)
+DEFAULT_WORKERS = 8
+
+# 재무제표 API로 대체할 수 있는 실적 보고서 파서 (대상 보고서 유형은 parsers.REPORT_PATTERNS에 정의)
+EARNINGS_PARSER = 'parsers.parser_earnings'
+
+
+def resolve_companies(companies: List[str], all_listed: bool = False) -> List[str]:
+    """
+    고유번호/종목코드/회사명 목록을 고유번호 목록으로 변환 (고유번호면 인덱스 조회 생략)
+
+    Args:
+        companies: 기업 목록 (고유번호 8자리, 종목코드 6자리 또는 회사명)
+        all_listed: True면 인덱스의 전체 상장 기업
+
+    Returns:
+        고유번호 목록 (중복 제거, 입력 순서 유지)
+    """
+    corp_codes = [company for company in companies if company.isdigit() and len(company) == 8]
+    lookups = [company for company in companies if company not in corp_codes]
+
+    if lookups or all_listed:
+        index = CorpCodeIndex()
+        index.refresh()
+
+        if all_listed:
+            corp_codes.extend(corp['corp_code'] for corp in index.listed())
+
+        for company in lookups:
+            corp = index.resolve(company)
+            if corp:
+                print(f"기업 조회: {company} → {corp['corp_name']} ({corp['corp_code']})")
+                corp_codes.append(corp['corp_code'])
+            else:
+                print(f"기업을 찾을 수 없습니다: {company}")
+
+        index.close()
+
+    return list(dict.fromkeys(corp_codes))
+
+
+def main(
+    companies: Optional[List[str]] = None,
+    all_listed: bool = False,
+    incremental: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    html_only: bool = False,
+    scan_rights: bool = False,
+    parse_workers: Optional[int] = None,
+    sink_name: str = 'json',
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    metrics_path: Optional[str] = None,
+    resume: bool = True,
+    watch: bool = False,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    use_parse_cache: bool = True
+):
+    if watch:
+        run_watch(companies, workers, parse_workers, sink_name, metrics_path, interval, use_parse_cache)
+        return
 
-def main():
-    # 설정
-    CORP_CODE = "00126380"  # 삼성전자 고유번호
-    
     # 조회 기간 설정 (최근 1년)
     end_date = datetime.now()
     start_date = end_date - timedelta(days=365)
-    
+
     begin_de = start_date.strftime('%Y%m%d')
     end_de = end_date.strftime('%Y%m%d')
-    
+
+    if scan_rights:
+        run_rights_issue_scan(begin_de, end_de, workers, sink_name, batch_size, metrics_path, use_parse_cache)
+        return
+
+    # 설정 (기본값: 삼성전자 고유번호)
+    default_companies = [] if all_listed else ["00126380"]
+    corp_codes = resolve_companies(companies or default_companies, all_listed)
+    if not corp_codes:
+        print("처리할 기업이 없습니다.")
+        return
+
     print(f"=" * 80)
     print(f"DART 공시 데이터 추출 시작")
+    print(f"대상 기업: {len(corp_codes)}개, 동시 다운로드 {workers}개, 파싱 프로세스 {parse_workers or os.cpu_count()}개")
     print(f"조회 기간: {begin_de} ~ {end_de}")
+    if incremental:
+        print(f"증분 모드: 기업별 워터마크 이후 공시만 처리")
+    if resume:
+        print(f"이어하기: 같은 파서 버전으로 이미 저장된 공시는 건너뜀")
     print(f"=" * 80)
-    
-    # 출력 디렉토리 생성
+
+    # 출력 싱크 생성 (출력 디렉토리 포함)
     output_dir = "output"
-    os.makedirs(output_dir, exist_ok=True)
-    
-    # 공시 목록 조회
-    print("\n[1] 공시 목록 조회 중...")
-    disclosure_list = get_disclosure_list(
-        corp_code=CORP_CODE,
-        begin_de=begin_de,
-        end_de=end_de,
-        pblntf_ty='A'  # 정기공시
-    )
-    
-    if not disclosure_list:
-        print("공시 목록을 가져올 수 없습니다.")
+    sink = make_sink(sink_name, output_dir, batch_size)
+    if not sink:
         return
-    
-    print(f"총 {len(disclosure_list)}건의 공시를 발견했습니다.")
-    
-    # 대상 보고서 유형 정의
-    target_reports = {
-        '반기보고서': parser_earnings,
-        '분기보고서': parser_earnings,
-        '유상증자결정': parser_rights_issue
-    }
-    
-    # 처리 통계
+
+    # 이전 버전이 남긴 임시 원문 파일 정리
+    removed = remove_stray_documents(output_dir)
+    if removed:
+        print(f"임시 원문 파일 {removed}개 삭제")
+
+    # 공시별 처리 단계 기록 (중단 후 재실행 시 이어서 처리)
+    manifest = RunManifest()
+
+    # 원문과 파서 버전이 같은 문서는 이전 파싱 결과 재사용
+    parse_cache = ParseCache() if use_parse_cache else None
+
+    # 커넥션 풀 크기를 동시 작업 수에 맞춤 (호출 한도는 모든 작업이 공유)
+    dart_api.configure_client(pool_size=workers)
+
+    watermarks = WatermarkStore() if incremental else None
+
+    # 실적 보고서는 재무제표 API(구조화 데이터)를 먼저 조회하고, 없을 때만 HTML 파싱
+    financials = None if html_only else StructuredFinancials()
+
+    # 처리 통계 (total_processed/success/failed는 저장 단계 스레드에서만 갱신)
     stats = {
         'total_processed': 0,
         'success': 0,
         'failed': 0,
         'skipped': 0
     }
-    
-    # 공시 목록 순회
-    print("\n[2] 대상 공시 처리 중...")
-    print("-" * 80)
-    
-    for idx, report in enumerate(disclosure_list, 1):
-        report_nm = report.get('report_nm', '')
+    stats_lock = threading.Lock()
+
+    # 기업별 조회 결과와 처리(다운로드/파싱/저장)에 실패한 접수번호 (워터마크 갱신용)
+    disclosures_by_corp: Dict[str, List[Dict]] = {}
+    failed_filings: Dict[str, List[str]] = {}
+
+    # 공시별 처리 시작 시각 (다운로드 시작 → 저장 완료 지연 시간 기록용)과 기업 고유번호
+    filing_started: Dict[str, float] = {}
+    filing_corps: Dict[str, str] = {}
+
+    def list_job(corp_code: str):
+        """기업의 공시 목록을 조회하고 처리 대상 공시를 선별 (조회 실패 시 None)"""
+        corp_begin_de = begin_de
+        watermark = watermarks.get(corp_code) if watermarks else None
+        if watermark:
+            corp_begin_de = max(begin_de, watermark['rcept_dt'])
+
+        disclosure_list = get_disclosure_list(
+            corp_code=corp_code,
+            begin_de=corp_begin_de,
+            end_de=end_de,
+            pblntf_ty='A'  # 정기공시
+        )
+        if disclosure_list is None:
+            # 조회 실패 (스케줄러가 목록 조회 실패로 기록하며, 워터마크는 옮기지 않음)
+            return None
+
+        if watermarks:
+            disclosure_list = [
+                report for report in disclosure_list
+                if watermarks.is_new(corp_code, report.get('rcept_no', ''))
+            ]
+
+        disclosures_by_corp[corp_code] = disclosure_list
+        failed_filings[corp_code] = []
+
+        targets, skipped = select_targets(disclosure_list, sink, incremental, manifest if resume else None)
+        with stats_lock:
+            stats['skipped'] += skipped
+
+        # 재무제표 API 묶음 조회 대상 등록
+        if financials:
+            for report, _, parser_name in targets:
+                period = parse_report_period(report.get('report_nm', ''))
+                if parser_name == EARNINGS_PARSER and period:
+                    financials.register(corp_code, *period, report.get('stock_code', ''))
+        return targets
+
+    def write_job(target, parsed_data: Optional[Dict], source: str) -> bool:
+        """저장 단계: 파싱 결과 1건을 JSON으로 저장"""
+        report, report_type, _ = target
         rcept_no = report.get('rcept_no', '')
-        rcept_dt = report.get('rcept_dt', '')
-        
-        # 대상 보고서인지 확인
-        parser_module = None
-        report_type = None
-        
-        for target, parser in target_reports.items():
-            if target in report_nm:
-                parser_module = parser
-                report_type = target
-                break
-        
-        if not parser_module:
-            continue
-        
+        if parsed_data:
+            manifest.mark_parsed(rcept_no, source)
+
+        success = write_report(report, report_type, parsed_data, sink, source)
+        corp_code = filing_corps.pop(rcept_no, None)
+        if success:
+            manifest.mark_written(rcept_no, sink.name)
+        else:
+            manifest.mark_failed(rcept_no)
+            # 다운로드/파싱/저장 어느 단계에서 실패해도 워터마크가 이 공시를 넘지 않도록 기록
+            if corp_code is not None:
+                failed_filings[corp_code].append(rcept_no)
+
         stats['total_processed'] += 1
-        
-        print(f"\n[{stats['total_processed']}] {report_nm}")
-        print(f"    접수번호: {rcept_no}")
-        print(f"    접수일자: {rcept_dt}")
-        
-        # 상세 내용 조회
-        print(f"    → HTML 다운로드 중...")
-        html_content = get_disclosure_detail(rcept_no)
-        
+        stats['success' if success else 'failed'] += 1
+
+        started = filing_started.pop(rcept_no, None)
+        if started is not None:
+            metrics.observe('dart_filing_seconds', time.perf_counter() - started)
+        return success
+
+    pipeline = Pipeline(write_job, parse_workers=parse_workers, parse_cache=parse_cache)
+
+    def item_job(corp_code: str, target) -> bool:
+        """다운로드 단계: 공시 1건을 받아 파싱 단계로 전달 (파싱 큐가 가득 차면 대기)"""
+        report, _, parser_name = target
+        rcept_no = report.get('rcept_no', '')
+        filing_started[rcept_no] = time.perf_counter()
+        filing_corps[rcept_no] = corp_code
+
+        parsed_data = fetch_structured(financials, corp_code, report) if parser_name == EARNINGS_PARSER else None
+        if parsed_data:
+            manifest.mark_fetched(rcept_no, corp_code, parser_name)
+            pipeline.submit_result(corp_code, target, parsed_data, "재무제표 API")
+            return True
+
+        html_content = get_disclosure_detail(rcept_no, raw=True)
         if not html_content:
-            print(f"    ✗ HTML 다운로드 실패")
-            stats['failed'] += 1
-            continue
-        
-        # 임시로 XML 파일 저장 (디버깅용)
-        xml_path = os.path.join(output_dir, f"{rcept_no}.xml")
-        with open(xml_path, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # 파싱 실행
-        # """추후 NER 모델로 연결할 부분"""
-        print(f"    → {report_type} 파싱 중...")
-        parsed_data = parser_module.parse(html_content)
-        
-        if not parsed_data:
-            print(f"    ✗ 파싱 실패 - 필수 데이터를 찾을 수 없습니다.")
-            stats['failed'] += 1
-            continue
-        
-        # JSON 파일 저장
-        json_path = os.path.join(output_dir, f"{rcept_no}.json")
-        with open(json_path, 'w', encoding='utf-8') as f:
-            json.dump(parsed_data, f, ensure_ascii=False, indent=4)
-        
-        print(f"    ✓ JSON 저장 완료: {json_path}")
-        
-        # XML 파일 삭제
-        if os.path.exists(xml_path):
-            os.remove(xml_path)
-            print(f"    ✓ 임시 XML 파일 삭제")
-        
-        stats['success'] += 1
-    
+            manifest.mark_failed(rcept_no)
+            pipeline.submit_result(corp_code, target, None, SOURCE_DOWNLOAD_FAILED)
+            return False
+
+        manifest.mark_fetched(rcept_no, corp_code, parser_name)
+
+        # 파서 모듈은 이름으로 전달 (작업자 프로세스에서 import)
+        pipeline.submit_document(corp_code, target, parser_name, html_content)
+        return True
+
+    completed = []
+
+    def on_company_done(corp_code: str, progress: Dict):
+        """기업의 다운로드가 모두 끝나면 남은 파싱/저장이 끝날 때까지 기다렸다가 완료 처리"""
+        pipeline.seal(corp_code, lambda _, written: finish_company(corp_code, progress, written))
+
+    def finish_company(corp_code: str, progress: Dict, written: Dict):
+        """기업 처리 완료 시 진행 상황 출력 및 워터마크 갱신"""
+        completed.append(corp_code)
+
+        if progress['list_failed']:
+            status = "목록 조회 실패"
+        else:
+            status = f"대상 {progress['total']}건, 성공 {written['success']}건, 실패 {written['failed']}건"
+        print(f"[{len(completed)}/{len(corp_codes)}] {corp_code}: {status}")
+
+        # 접수번호를 기록하지 못한 실패(다운로드/저장 단계 예외)가 있으면 어디까지 처리됐는지 알 수 없으므로 워터마크 유지
+        unrecorded_failures = (
+            written['submitted'] < progress['total']
+            or written['failed'] > len(failed_filings.get(corp_code, []))
+        )
+        if watermarks and not progress['list_failed'] and not unrecorded_failures:
+            # 묶음 싱크 버퍼에 남은 레코드를 먼저 기록 (기록 전에 중단되면 워터마크 아래 공시가 유실됨)
+            sink.flush()
+            advance_watermark(
+                watermarks, corp_code,
+                disclosures_by_corp.get(corp_code, []),
+                failed_filings.get(corp_code, [])
+            )
+            # 닫아야 읽을 수 있는 싱크(Parquet)는 close() 뒤에 워터마크 저장
+            if sink.durable_flush:
+                watermarks.save()
+
+    # 기업별 목록 조회와 공시 다운로드를 공정하게 번갈아 실행하고,
+    # 다운로드된 문서는 파싱(프로세스 풀) → 저장 단계로 넘김
+    print("\n[1] 공시 목록 조회 및 대상 공시 처리 중...")
+    print("-" * 80)
+
+    scheduler = FairScheduler(workers=workers, on_company_done=on_company_done)
+    with pipeline:
+        scheduler.run(corp_codes, list_job, item_job)
+    sink.close()
+    if watermarks:
+        watermarks.save()
+    manifest.close()
+    if parse_cache:
+        parse_cache.close()
+
     # 최종 결과 출력
     print("\n" + "=" * 80)
     print("처리 완료")
     print("=" * 80)
+    print(f"처리 기업: {len(corp_codes)}개")
     print(f"처리 대상: {stats['total_processed']}건")
     print(f"성공: {stats['success']}건")
     print(f"실패: {stats['failed']}건")
-    print(f"출력 디렉토리: {os.path.abspath(output_dir)}")
+    print(f"건너뜀: {stats['skipped']}건")
+    print(f"출력 디렉토리: {os.path.abspath(output_dir)} ({sink.name})")
+    print("=" * 80)
+
+    report_metrics(metrics_path)
+
+
+def run_rights_issue_scan(
+    begin_de: str,
+    end_de: str,
+    workers: int = DEFAULT_WORKERS,
+    sink_name: str = 'json',
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    metrics_path: Optional[str] = None,
+    use_parse_cache: bool = True
+):
+    """시장 전체 유상증자결정 공시를 구조화 API로 일괄 조회하여 JSON으로 저장"""
+    print(f"=" * 80)
+    print(f"유상증자결정 시장 전체 스캔 시작")
+    print(f"조회 기간: {begin_de} ~ {end_de}")
+    print(f"=" * 80)
+
+    output_dir = "output"
+    sink = make_sink(sink_name, output_dir, batch_size)
+    if not sink:
+        return
+
+    dart_api.configure_client(pool_size=workers)
+
+    stats = {'success': 0, 'failed': 0}
+    sources: Dict[str, int] = {}
+    parse_cache = ParseCache() if use_parse_cache else None
+
+    for report, parsed_data, source in scan_rights_issues(begin_de, end_de, workers, parse_cache):
+        if parsed_data:
+            save_report(report, parsed_data, sink, source)
+            stats['success'] += 1
+            sources[source] = sources.get(source, 0) + 1
+        else:
+            print(f"    ✗ {report.get('corp_name', '')} {report.get('report_nm', '')} ({report.get('rcept_no', '')}): 유상증자 결정 정보를 찾을 수 없습니다.")
+            stats['failed'] += 1
+    sink.close()
+    if parse_cache:
+        parse_cache.close()
+
+    print("\n" + "=" * 80)
+    print("스캔 완료")
+    print("=" * 80)
+    print(f"성공: {stats['success']}건 ({', '.join(f'{source} {count}건' for source, count in sources.items())})")
+    print(f"실패: {stats['failed']}건")
+    print(f"출력 디렉토리: {os.path.abspath(output_dir)} ({sink.name})")
     print("=" * 80)
 
+    report_metrics(metrics_path)
+
+
+def run_watch(
+    companies: Optional[List[str]] = None,
+    workers: int = DEFAULT_WORKERS,
+    parse_workers: Optional[int] = None,
+    sink_name: str = 'json',
+    metrics_path: Optional[str] = None,
+    interval: float = DEFAULT_POLL_INTERVAL,
+    use_parse_cache: bool = True
+):
+    """신규 공시 감시 모드 (Ctrl+C로 종료)"""
+    corp_codes = resolve_companies(companies) if companies else None
+    if companies and not corp_codes:
+        print("처리할 기업이 없습니다.")
+        return
+
+    print(f"=" * 80)
+    print(f"DART 신규 공시 감시 시작")
+    print(f"대상 기업: {f'{len(corp_codes)}개' if corp_codes else '전체'}, 조회 주기 {interval:g}초")
+    print(f"=" * 80)
+
+    # 감시 모드는 지연 시간이 중요하므로 묶음 싱크도 1건씩 기록
+    output_dir = "output"
+    sink = make_sink(sink_name, output_dir, batch_size=1)
+    if not sink:
+        return
+
+    dart_api.configure_client(pool_size=workers)
+    manifest = RunManifest()
+    parse_cache = ParseCache() if use_parse_cache else None
+
+    watcher = FilingWatcher(
+        lambda report, report_type, parsed_data, source: write_report(report, report_type, parsed_data, sink, source),
+        sink.name,
+        manifest,
+        WatermarkStore(),
+        companies=corp_codes,
+        workers=workers,
+        parse_workers=parse_workers,
+        metrics_path=metrics_path,
+        parse_cache=parse_cache
+    )
+    stats = watcher.run(interval)
+
+    sink.close()
+    manifest.close()
+    if parse_cache:
+        parse_cache.close()
+
+    print("\n" + "=" * 80)
+    print("감시 종료")
+    print("=" * 80)
+    print(f"조회: {stats['polls']}회, 처리: {stats['dispatched']}건 (성공 {stats['success']}건, 실패 {stats['failed']}건)")
+    print("=" * 80)
+
+    report_metrics(metrics_path)
+
+
+def report_metrics(metrics_path: Optional[str] = None):
+    """단계별 소요 시간 요약 출력 및 지표 파일 저장 (.json이면 JSON, 그 외에는 Prometheus 텍스트)"""
+    lines = metrics.summary()
+    if lines:
+        print("\n단계별 소요 시간")
+        print("-" * 80)
+        for line in lines:
+            print(f"  {line}")
+
+    if metrics_path:
+        metrics.write(metrics_path)
+        print(f"지표 저장: {os.path.abspath(metrics_path)}")
+
+
+def select_targets(disclosure_list: List[Dict], sink, incremental: bool, manifest: Optional[RunManifest] = None):
+    """
+    공시 목록에서 파서가 있는 대상 보고서 선별
+
+    Args:
+        disclosure_list: 공시 목록
+        sink: 출력 싱크
+        incremental: True면 싱크에 이미 있는 공시 건너뜀
+        manifest: 지정하면 현재 파서 버전으로 저장이 끝난 공시 건너뜀 (이어하기)
+
+    Returns:
+        ([(공시, 보고서 유형, 파서 모듈 이름)], 건너뛴 건수)
+    """
+    targets = []
+    skipped = 0
+
+    for report in disclosure_list:
+        # 대상 보고서인지 확인 (모든 보고서명 패턴을 한 번에 검색)
+        matched = match_report(report.get('report_nm', ''))
+        if not matched:
+            continue
+
+        rcept_no = report.get('rcept_no', '')
+
+        # 증분 모드에서는 이미 저장된 공시, 이어하기에서는 같은 파서 버전으로 저장된 공시 건너뛰기
+        # (묶음 싱크에 기록되기 전에 중단된 공시는 싱크에 없으므로 다시 처리)
+        done = manifest is not None and manifest.is_done(rcept_no, matched[1], sink.name)
+        if (incremental or done) and sink.exists(rcept_no):
+            skipped += 1
+        else:
+            targets.append((report,) + matched)
+
+    return targets, skipped
+
+
+def advance_watermark(watermarks, corp_code, disclosure_list, failed_rcept_nos):
+    """조회된 공시 중 처리가 끝난 가장 최근 공시로 워터마크 이동 (다운로드/파싱/저장에 실패한 가장 이른 공시 직전까지만)"""
+    first_failure = min(failed_rcept_nos) if failed_rcept_nos else None
+
+    done = [
+        report for report in disclosure_list
+        if first_failure is None or report.get('rcept_no', '') < first_failure
+    ]
+    if not done:
+        return
+
+    newest = max(done, key=lambda report: report.get('rcept_no', ''))
+    watermarks.advance(corp_code, newest.get('rcept_dt', ''), newest.get('rcept_no', ''))
+
+
+def fetch_structured(financials, corp_code: str, report: Dict) -> Optional[Dict]:
+    """재무제표 API로 실적 데이터 구성 (구조화 데이터가 없으면 None → HTML 파싱으로 대체)"""
+    if not financials:
+        return None
+
+    period = parse_report_period(report.get('report_nm', ''))
+    if not period:
+        return None
+
+    accounts = financials.get(corp_code, *period, report.get('stock_code', ''))
+    if not accounts:
+        return None
+
+    return load_parser(EARNINGS_PARSER).parse_structured(accounts, report, reprt_code=period[1])
+
+
+def save_report(report, parsed_data, sink, source: str) -> bool:
+    """파싱 결과를 출력 싱크에 저장 (묶음 싱크는 batch_size 건마다 기록)"""
+    rcept_no = report.get('rcept_no', '')
+    label = f"{report.get('corp_name', '')} {report.get('report_nm', '')} ({rcept_no})"
+
+    with metrics.timer('dart_write_seconds', sink=sink.name):
+        written = sink.write(report, parsed_data, source)
+    if not written:
+        return False
+
+    print(f"    ✓ {label}: 저장 완료 ({sink.location(rcept_no)}, {source})")
+    return True
+
+
+def write_report(report, report_type, parsed_data, sink, source: str) -> bool:
+    """파싱 단계를 거친 공시 1건을 저장 (성공 여부 반환)"""
+    report_nm = report.get('report_nm', '')
+    rcept_no = report.get('rcept_no', '')
+    label = f"{report.get('corp_name', '')} {report_nm} ({rcept_no})"
+
+    if source == SOURCE_DOWNLOAD_FAILED:
+        print(f"    ✗ {label}: HTML 다운로드 실패")
+        return False
+
+    # """추후 NER 모델로 연결할 부분"""
+    if not parsed_data:
+        print(f"    ✗ {label}: {report_type} 파싱 실패 - 필수 데이터를 찾을 수 없습니다.")
+        return False
+
+    return save_report(report, parsed_data, sink, source)
+
 
 if __name__ == "__main__":
-    main()
+    arg_parser = argparse.ArgumentParser(description="DART 공시 데이터 추출")
+    arg_parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="기업별 워터마크 이후 공시만 조회하고 이미 JSON이 있는 공시는 건너뜀"
+    )
+    arg_parser.add_argument(
+        "--company",
+        dest="companies",
+        action="append",
+        help="조회할 기업 (고유번호 8자리, 종목코드 6자리 또는 회사명, 여러 번 지정 가능, 기본값: 삼성전자)"
+    )
+    arg_parser.add_argument(
+        "--all-listed",
+        action="store_true",
+        help="전체 상장 기업(KOSPI/KOSDAQ/KONEX) 처리"
+    )
+    arg_parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_WORKERS,
+        help=f"동시 목록 조회/다운로드 작업 수 (기본값: {DEFAULT_WORKERS})"
+    )
+    arg_parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        help="HTML 파싱 프로세스 수 (기본값: CPU 코어 수)"
+    )
+    arg_parser.add_argument(
+        "--html-only",
+        action="store_true",
+        help="재무제표 API를 사용하지 않고 모든 실적 보고서를 HTML 파싱으로 처리"
+    )
+    arg_parser.add_argument(
+        "--scan-rights-issues",
+        action="store_true",
+        help="기업 지정 없이 시장 전체 유상증자결정 공시를 구조화 API(piicDecsn)로 일괄 조회"
+    )
+    arg_parser.add_argument(
+        "--sink",
+        choices=list(SINKS),
+        default="json",
+        help="출력 형식 (json: 공시별 JSON 파일, jsonl: JSON Lines, sqlite: SQLite, parquet: Parquet, msgpack: MessagePack, 기본값: json)"
+    )
+    arg_parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=DEFAULT_BATCH_SIZE,
+        help=f"jsonl/sqlite/parquet 묶음 저장 크기 (기본값: {DEFAULT_BATCH_SIZE})"
+    )
+    arg_parser.add_argument(
+        "--metrics",
+        dest="metrics_path",
+        help="실행 지표 저장 경로 (.json이면 JSON 스냅샷, 그 외에는 Prometheus 텍스트, 예: metrics.prom)"
+    )
+    arg_parser.add_argument(
+        "--no-resume",
+        action="store_true",
+        help="실행 매니페스트를 무시하고 이미 저장된 공시도 다시 처리"
+    )
+    arg_parser.add_argument(
+        "--no-parse-cache",
+        action="store_true",
+        help="파싱 결과 캐시를 사용하지 않고 모든 문서를 다시 파싱"
+    )
+    arg_parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="신규 공시 감시 모드 (list.json을 주기적으로 조회하여 새 공시를 바로 처리, Ctrl+C로 종료)"
+    )
+    arg_parser.add_argument(
+        "--interval",
+        type=float,
+        default=DEFAULT_POLL_INTERVAL,
+        help=f"감시 모드 조회 주기 (초, 기본값: {DEFAULT_POLL_INTERVAL})"
+    )
+    args = arg_parser.parse_args()
 
+    # 선택 의존성이 없는 출력 형식은 작업을 시작하기 전에 종료
+    missing = missing_dependency(args.sink)
+    if missing:
+        arg_parser.error(f"--sink {args.sink}에는 {missing} 패키지가 필요합니다. (pip install {missing} 또는 {OPTIONAL_INSTALL})")
+
+    main(
+        companies=args.companies,
+        all_listed=args.all_listed,
+        incremental=args.incremental,
+        workers=args.workers,
+        html_only=args.html_only,
+        scan_rights=args.scan_rights_issues,
+        parse_workers=args.parse_workers,
+        sink_name=args.sink,
+        batch_size=args.batch_size,
+        metrics_path=args.metrics_path,
+        resume=not args.no_resume,
+        watch=args.watch,
+        interval=args.interval,
+        use_parse_cache=not args.no_parse_cache
+    )
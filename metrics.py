@@ -0,0 +1,262 @@
+"""
+실행 지표 수집 모듈
+단계별 소요 시간 히스토그램과 카운터를 모아 Prometheus 텍스트 또는 JSON으로 내보냄
+"""
+
+import bisect
+import functools
+import json
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 소요 시간 히스토그램 구간 (초)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 문서 크기 히스토그램 구간 (바이트)
+BYTES_BUCKETS = (1024, 10 * 1024, 100 * 1024, 1024 ** 2, 5 * 1024 ** 2, 10 * 1024 ** 2, 50 * 1024 ** 2, 100 * 1024 ** 2)
+
+LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict) -> LabelKey:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus histogram 형식)"""
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 +Inf
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, counts: List[int], total: float, count: int) -> None:
+        for index, value in enumerate(counts):
+            self.counts[index] += value
+        self.sum += total
+        self.count += count
+
+
+class MetricsRegistry:
+    """
+    지표 저장소 (스레드 안전)
+
+    - inc(): 카운터 증가
+    - observe()/timer()/timed(): 히스토그램 기록
+    - snapshot()/merge(): 파싱 작업자 프로세스의 지표를 부모 프로세스로 합칠 때 사용
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[Tuple[str, LabelKey], float] = {}
+        self._histograms: Dict[Tuple[str, LabelKey], Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        """카운터 증가"""
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: Sequence[float] = DEFAULT_BUCKETS, **labels) -> None:
+        """히스토그램에 값 기록"""
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = Histogram(buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def timer(self, name: str, **labels) -> Iterator[None]:
+        """with 블록 소요 시간(초)을 히스토그램에 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def timed(self, name: str, function_label: bool = False, **labels):
+        """
+        함수 소요 시간 기록 데코레이터
+
+        Args:
+            name: 히스토그램 이름
+            function_label: True면 함수 이름을 function 레이블로 추가
+        """
+        def decorator(func):
+            func_labels = {**labels, 'function': func.__name__} if function_label else labels
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.timer(name, **func_labels):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def snapshot(self) -> Dict:
+        """JSON 직렬화 가능한 지표 스냅샷"""
+        with self._lock:
+            return {
+                'counters': [
+                    {'name': name, 'labels': dict(labels), 'value': value}
+                    for (name, labels), value in sorted(self._counters.items())
+                ],
+                'histograms': [
+                    {
+                        'name': name,
+                        'labels': dict(labels),
+                        'buckets': list(histogram.buckets),
+                        'counts': list(histogram.counts),
+                        'sum': histogram.sum,
+                        'count': histogram.count
+                    }
+                    for (name, labels), histogram in sorted(self._histograms.items(), key=lambda item: item[0])
+                ]
+            }
+
+    def merge(self, snapshot: Optional[Dict]) -> None:
+        """다른 저장소(작업자 프로세스)의 스냅샷을 합침"""
+        if not snapshot:
+            return
+
+        with self._lock:
+            for counter in snapshot.get('counters', []):
+                key = (counter['name'], _label_key(counter['labels']))
+                self._counters[key] = self._counters.get(key, 0) + counter['value']
+
+            for item in snapshot.get('histograms', []):
+                key = (item['name'], _label_key(item['labels']))
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = Histogram(item['buckets'])
+                histogram.merge(item['counts'], item['sum'], item['count'])
+
+    def drain(self) -> Dict:
+        """스냅샷을 반환하고 초기화 (작업자 프로세스에서 작업 단위로 전달할 때 사용)"""
+        with self._lock:
+            counters, histograms = self._counters, self._histograms
+            self._counters, self._histograms = {}, {}
+
+        drained = MetricsRegistry()
+        drained._counters, drained._histograms = counters, histograms
+        return drained.snapshot()
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), ensure_ascii=False, indent=2)
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식"""
+        snapshot = self.snapshot()
+        lines = []
+        declared = set()
+
+        for counter in snapshot['counters']:
+            if counter['name'] not in declared:
+                lines.append(f"# TYPE {counter['name']} counter")
+                declared.add(counter['name'])
+            lines.append(f"{counter['name']}{_format_labels(counter['labels'])} {_format_value(counter['value'])}")
+
+        for item in snapshot['histograms']:
+            name = item['name']
+            if name not in declared:
+                lines.append(f"# TYPE {name} histogram")
+                declared.add(name)
+
+            cumulative = 0
+            for bound, count in zip(list(item['buckets']) + ['+Inf'], item['counts']):
+                cumulative += count
+                labels = {**item['labels'], 'le': bound if bound == '+Inf' else _format_value(bound)}
+                lines.append(f"{name}_bucket{_format_labels(labels)} {cumulative}")
+            lines.append(f"{name}_sum{_format_labels(item['labels'])} {_format_value(item['sum'])}")
+            lines.append(f"{name}_count{_format_labels(item['labels'])} {item['count']}")
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str) -> None:
+        """지표 파일 저장 (.json이면 JSON, 그 외에는 Prometheus 텍스트)"""
+        content = self.to_json() if path.endswith('.json') else self.to_prometheus()
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(content)
+
+    def summary(self) -> List[str]:
+        """소요 시간 히스토그램별 건수/합계/평균 요약 (콘솔 출력용)"""
+        totals: Dict[str, List[float]] = {}
+        for item in self.snapshot()['histograms']:
+            if not item['name'].endswith('_seconds'):
+                continue
+            total = totals.setdefault(item['name'], [0, 0.0])
+            total[0] += item['count']
+            total[1] += item['sum']
+
+        return [
+            f"{name}: {count}건, 합계 {seconds:.2f}초, 평균 {seconds / count * 1000:.1f}ms"
+            for name, (count, seconds) in totals.items() if count
+        ]
+
+
+def histogram_quantile(q: float, buckets: Sequence[float], counts: Sequence[int]) -> Optional[float]:
+    """
+    구간별 건수로 분위수 추정 (Prometheus histogram_quantile과 같은 구간 내 선형 보간)
+
+    Args:
+        q: 분위 (0~1, 예: 0.99)
+        buckets: 구간 상한 목록
+        counts: 구간별 건수 (snapshot()의 counts, 마지막 칸은 +Inf)
+
+    Returns:
+        추정값 (관측값이 없으면 None, +Inf 구간이면 마지막 상한)
+    """
+    total = sum(counts)
+    if not total:
+        return None
+
+    rank = q * total
+    seen = 0
+    for index, count in enumerate(counts):
+        if seen + count >= rank and count:
+            if index >= len(buckets):
+                return float(buckets[-1])
+            lower = buckets[index - 1] if index else 0.0
+            return lower + (buckets[index] - lower) * (rank - seen) / count
+        seen += count
+    return float(buckets[-1])
+
+
+def _format_labels(labels: Dict) -> str:
+    if not labels:
+        return ''
+    escaped = (
+        (key, str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n'))
+        for key, value in sorted(labels.items())
+    )
+    return '{' + ','.join(f'{key}="{value}"' for key, value in escaped) + '}'
+
+
+def _format_value(value: float) -> str:
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+# 프로세스 전역 저장소
+REGISTRY = MetricsRegistry()
+
+inc = REGISTRY.inc
+observe = REGISTRY.observe
+timer = REGISTRY.timer
+timed = REGISTRY.timed
+snapshot = REGISTRY.snapshot
+merge = REGISTRY.merge
+drain = REGISTRY.drain
+write = REGISTRY.write
+summary = REGISTRY.summary
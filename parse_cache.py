@@ -0,0 +1,203 @@
+"""
+파싱 결과 캐시 모듈
+(원문 해시, 파서 모듈, 파서 버전)을 키로 파싱 결과를 SQLite에 보관하여
+원문과 파서 코드가 그대로인 공시는 다시 파싱하지 않음
+"""
+
+import os
+import pickle
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Any, Callable, Dict, Union
+
+import metrics
+from parsers.budget import consume_timeout
+from run_manifest import content_hash, parser_version
+
+# 캐시 파일 경로와 최대 용량 (환경 변수로 변경 가능)
+PARSE_CACHE_PATH = os.getenv('DART_PARSE_CACHE_PATH', '.dart_state/parse_cache.db')
+PARSE_CACHE_MAX_MB = int(os.getenv('DART_PARSE_CACHE_MAX_MB', '512'))
+
+# 마지막 사용 시각 갱신을 이 건수마다 커밋
+TOUCH_COMMIT_EVERY = 50
+
+# 캐시 미스 표시 (파싱 결과 None도 캐시하므로 None과 구분)
+MISS = object()
+
+
+class ParseCache:
+    """
+    크기 제한 LRU 파싱 결과 캐시 (SQLite)
+
+    - 결과는 pickle 후 zlib으로 압축하여 저장 (결과 모델 데이터클래스도 그대로 보관)
+    - 파싱 결과가 None인 문서도 저장하여, 같은 원문/파서로는 다시 시도하지 않음
+    - 조회 시 마지막 사용 시각을 갱신하고, 총 용량 초과 시 가장 오래 사용되지 않은 항목부터 삭제
+    - 파서 버전이 바뀌면 해당 파서의 이전 버전 항목은 처음 저장할 때 정리
+    """
+
+    def __init__(self, path: str = PARSE_CACHE_PATH, max_bytes: int = PARSE_CACHE_MAX_MB * 1024 * 1024, compress_level: int = 6):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        self.path = path
+        self.max_bytes = max_bytes
+        self.compress_level = compress_level
+
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._purged = set()
+        self._touched = 0
+
+        # 파싱 결과는 파이프라인 콜백 스레드에서 저장되므로 스레드 검사 해제 (락으로 직렬화)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS results (
+                key TEXT PRIMARY KEY,
+                parser TEXT NOT NULL,
+                parser_version TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL,
+                data BLOB NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_results_last_used ON results(last_used);
+        """)
+        self._size = self._conn.execute('SELECT COALESCE(SUM(size), 0) FROM results').fetchone()[0]
+
+    def __enter__(self) -> 'ParseCache':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    @staticmethod
+    def key(content: Union[bytes, str], module_name: str) -> str:
+        """캐시 키 (원문 sha256:파서 모듈:파서 버전)"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return f"{content_hash(content)}:{module_name}:{parser_version(module_name)}"
+
+    def get(self, key: str) -> Any:
+        """
+        캐시된 파싱 결과 조회
+
+        Returns:
+            파싱 결과 (None일 수 있음) 또는 MISS
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT data FROM results WHERE key = ?', (key,)).fetchone()
+            if row is not None:
+                self._conn.execute('UPDATE results SET last_used = ? WHERE key = ?', (time.time(), key))
+                self._touched += 1
+                if self._touched >= TOUCH_COMMIT_EVERY:
+                    self._conn.commit()
+                    self._touched = 0
+
+        parsed = MISS
+        if row is not None:
+            try:
+                parsed = pickle.loads(zlib.decompress(row[0]))
+            except Exception as e:
+                # 손상되었거나 더 이상 불러올 수 없는 항목은 미스로 처리 (다시 파싱하여 덮어씀)
+                print(f"파싱 캐시 항목 읽기 오류: {e}")
+
+        with self._lock:
+            if parsed is MISS:
+                self.misses += 1
+            else:
+                self.hits += 1
+        metrics.inc('dart_parse_cache_misses_total' if parsed is MISS else 'dart_parse_cache_hits_total')
+        return parsed
+
+    def put(self, key: str, parsed: Any) -> None:
+        """파싱 결과 저장 (용량 초과 시 오래된 항목 삭제)"""
+        try:
+            data = zlib.compress(pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL), self.compress_level)
+        except Exception as e:
+            print(f"파싱 캐시 저장 오류: {e}")
+            return
+
+        _, parser, version = key.rsplit(':', 2)
+
+        with self._lock:
+            if parser not in self._purged:
+                self._purge_stale_locked(parser, version)
+
+            previous = self._conn.execute('SELECT size FROM results WHERE key = ?', (key,)).fetchone()
+            self._conn.execute(
+                'INSERT OR REPLACE INTO results (key, parser, parser_version, size, last_used, data) VALUES (?, ?, ?, ?, ?, ?)',
+                (key, parser, version, len(data), time.time(), data)
+            )
+            self._size += len(data) - (previous[0] if previous else 0)
+            if self._size > self.max_bytes:
+                self._evict_locked()
+            self._conn.commit()
+            self._touched = 0
+
+    def parse(self, module_name: str, content: Union[bytes, str], parse_fn: Callable[[Union[bytes, str]], Any]) -> Any:
+        """
+        캐시된 결과가 있으면 반환하고, 없으면 parse_fn(content)로 파싱한 뒤 저장
+
+        제한 시간 초과로 중단된 파싱의 None은 부하에 따라 달라지는 결과라 저장하지 않음
+        """
+        key = self.key(content, module_name)
+        parsed = self.get(key)
+        if parsed is MISS:
+            consume_timeout()
+            parsed = parse_fn(content)
+            if not consume_timeout():
+                self.put(key, parsed)
+        return parsed
+
+    def evict(self) -> int:
+        """총 용량이 max_bytes의 90% 이하가 될 때까지 오래된 항목 삭제 (삭제한 항목 수 반환)"""
+        with self._lock:
+            removed = self._evict_locked()
+            self._conn.commit()
+        return removed
+
+    def stats(self) -> Dict:
+        """캐시 적중/미스 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'bytes': self._size
+            }
+
+    def _evict_locked(self) -> int:
+        # 목표치를 최대 용량의 90%로 잡아 저장할 때마다 삭제가 반복되지 않도록 함
+        target = int(self.max_bytes * 0.9)
+        removed = 0
+
+        rows = self._conn.execute('SELECT key, size FROM results ORDER BY last_used').fetchall()
+        doomed = []
+        for key, size in rows:
+            if self._size <= target:
+                break
+            doomed.append((key,))
+            self._size -= size
+            removed += 1
+
+        self._conn.executemany('DELETE FROM results WHERE key = ?', doomed)
+        return removed
+
+    def _purge_stale_locked(self, parser: str, version: str) -> None:
+        """이전 파서 버전의 항목 삭제 (다시 적중할 일이 없음)"""
+        stale = self._conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM results WHERE parser = ? AND parser_version != ?', (parser, version)
+        ).fetchone()[0]
+        if stale:
+            self._conn.execute('DELETE FROM results WHERE parser = ? AND parser_version != ?', (parser, version))
+            self._size -= stale
+        self._purged.add(parser)
@@ -1,10 +1,35 @@
 """
 공시 문서 파서 패키지
 다양한 유형의 DART 공시 문서를 파싱하여 구조화된 데이터로 변환합니다.
+
+파서 모듈은 처음 사용될 때 import됩니다 (parsers.parser_earnings 처럼 속성으로 접근해도 동일).
 """
 
-from . import parser_earnings
-from . import parser_rights_issue
+import importlib
+
+from .registry import ParserRegistry
+
+# 파서별 처리 보고서 (보고서 유형, 보고서명 정규식, 파서 모듈)
+# 새 보고서 유형은 여기에 한 줄 추가하면 됨
+REPORT_PATTERNS = [
+    ('반기보고서', r'반기보고서', 'parser_earnings'),
+    ('분기보고서', r'분기보고서', 'parser_earnings'),
+    ('유상증자결정', r'유상증자결정', 'parser_rights_issue'),
+]
+
+REGISTRY = ParserRegistry.from_patterns(__name__, REPORT_PATTERNS)
+
+match_report = REGISTRY.match
+load_parser = REGISTRY.load
+resolve_parser = REGISTRY.resolve
+
+_PARSER_MODULES = sorted({module_name for _, _, module_name in REPORT_PATTERNS})
+
+__all__ = _PARSER_MODULES + ['REGISTRY', 'REPORT_PATTERNS', 'match_report', 'load_parser', 'resolve_parser']
 
-__all__ = ['parser_earnings', 'parser_rights_issue']
 
+def __getattr__(name):
+    """파서 모듈 지연 import (PEP 562)"""
+    if name in _PARSER_MODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
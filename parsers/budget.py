@@ -0,0 +1,76 @@
+"""
+파싱 시간 제한 모듈
+문서 1건의 파싱에 쓸 수 있는 시간을 정해 두고, 표 추출/원문 검색 도중 확인하여
+제한을 넘긴 문서는 작업자를 붙잡아 두지 않고 중단
+"""
+
+import os
+import threading
+import time
+from typing import Optional
+
+# 문서 1건의 기본 파싱 제한 시간 (초, 0이면 제한 없음)
+DEFAULT_PARSE_TIMEOUT = float(os.getenv('DART_PARSE_TIMEOUT', '30'))
+
+# 스레드별 제한 시간 초과 표시 (파서는 ParseTimeout을 잡아 None을 반환하므로 호출자가 실패 원인을 구분할 때 사용)
+_state = threading.local()
+
+
+class ParseTimeout(Exception):
+    """파싱 제한 시간 초과"""
+
+    def __init__(self, stage: str, elapsed: float, seconds: float):
+        self.stage = stage
+        self.elapsed = elapsed
+        self.seconds = seconds
+        super().__init__(f"{stage} 중 제한 시간 초과 ({elapsed:.1f}초 경과, 제한 {seconds:g}초)")
+
+
+class TimeBudget:
+    """
+    문서 1건의 파싱 제한 시간
+
+        budget = TimeBudget(30)
+        for chunk in chunks:
+            budget.check('표 추출')  # 제한 시간이 지났으면 ParseTimeout
+
+    check()는 반복문 안에서 자주 호출해도 되도록 시각 비교만 함
+    """
+
+    __slots__ = ('seconds', 'started', 'deadline')
+
+    def __init__(self, seconds: Optional[float] = DEFAULT_PARSE_TIMEOUT):
+        """
+        Args:
+            seconds: 제한 시간 (초, None 또는 0이면 제한 없음)
+        """
+        self.seconds = seconds or 0.0
+        self.started = time.monotonic()
+        self.deadline = self.started + self.seconds if self.seconds > 0 else None
+
+    @property
+    def elapsed(self) -> float:
+        return time.monotonic() - self.started
+
+    def remaining(self) -> Optional[float]:
+        """남은 시간 (초, 제한이 없으면 None)"""
+        if self.deadline is None:
+            return None
+        return max(0.0, self.deadline - time.monotonic())
+
+    def check(self, stage: str = '파싱') -> None:
+        """제한 시간이 지났으면 ParseTimeout 발생"""
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            raise ParseTimeout(stage, self.elapsed, self.seconds)
+
+
+def record_timeout() -> None:
+    """현재 스레드의 파싱이 제한 시간 초과로 중단되었음을 표시 (파서의 ParseTimeout 처리에서 호출)"""
+    _state.timed_out = True
+
+
+def consume_timeout() -> bool:
+    """현재 스레드에 제한 시간 초과 표시가 있었는지 반환하고 표시를 지움"""
+    timed_out = getattr(_state, 'timed_out', False)
+    _state.timed_out = False
+    return timed_out
@@ -0,0 +1,91 @@
+"""
+공시 문서 인코딩 감지 모듈
+BOM, XML 선언, <meta charset>을 한 번만 확인하여 인코딩을 결정
+"""
+
+import codecs
+import re
+from typing import Union
+
+import metrics
+
+# 선언부는 문서 앞부분에만 있으므로 앞부분만 검사
+_DECLARATION_SCAN_BYTES = 4096
+# 선언이 없을 때 UTF-8 여부를 확인할 표본 크기
+_FALLBACK_SAMPLE_BYTES = 64 * 1024
+
+_BOMS = [
+    (codecs.BOM_UTF8, 'utf-8-sig'),
+    (codecs.BOM_UTF16_LE, 'utf-16'),
+    (codecs.BOM_UTF16_BE, 'utf-16'),
+]
+
+_XML_DECLARATION = re.compile(rb'<\?xml[^>]*?encoding\s*=\s*["\']([A-Za-z0-9_\-]+)["\']', re.IGNORECASE)
+_META_CHARSET = re.compile(rb'<meta[^>]+?charset\s*=\s*["\']?([A-Za-z0-9_\-]+)', re.IGNORECASE)
+
+# EUC-KR로 선언된 DART 문서에도 확장 완성형 문자가 섞여 있으므로 상위 호환인 CP949로 처리
+_ENCODING_ALIASES = {
+    'euc_kr': 'cp949',
+    'ks_c_5601_1987': 'cp949',
+    'ksc5601': 'cp949',
+}
+
+
+def _normalize(name: str) -> str:
+    """인코딩 이름 정규화 (알 수 없는 이름이면 빈 문자열)"""
+    try:
+        canonical = codecs.lookup(name).name
+    except LookupError:
+        return ''
+    canonical = canonical.replace('-', '_')
+    return _ENCODING_ALIASES.get(canonical, canonical)
+
+
+def detect_encoding(content: bytes) -> str:
+    """
+    문서 인코딩 감지
+
+    BOM → XML 선언 → <meta charset> 순서로 확인하고, 선언이 없으면
+    앞부분 표본이 UTF-8로 디코딩되는지만 확인한 뒤 CP949로 대체
+
+    Args:
+        content: 문서 바이트
+
+    Returns:
+        파이썬 코덱 이름
+    """
+    for bom, encoding in _BOMS:
+        if content.startswith(bom):
+            return encoding
+
+    head = content[:_DECLARATION_SCAN_BYTES]
+    for pattern in (_XML_DECLARATION, _META_CHARSET):
+        match = pattern.search(head)
+        if match:
+            encoding = _normalize(match.group(1).decode('ascii'))
+            if encoding:
+                return encoding
+
+    try:
+        # 표본 끝에서 멀티바이트 문자가 잘릴 수 있으므로 증분 디코더 사용
+        codecs.getincrementaldecoder('utf-8')().decode(content[:_FALLBACK_SAMPLE_BYTES], final=False)
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'cp949'
+
+
+def decode_document(content: Union[str, bytes]) -> str:
+    """
+    문서를 감지된 인코딩으로 한 번에 디코딩 (이미 문자열이면 그대로 반환)
+
+    Args:
+        content: 문서 바이트 또는 문자열
+
+    Returns:
+        디코딩된 문자열
+    """
+    if isinstance(content, str):
+        return content
+
+    with metrics.timer('dart_decode_seconds'):
+        return content.decode(detect_encoding(content), errors='replace')
@@ -0,0 +1,135 @@
+"""
+실적 결과 모델
+파싱 결과를 정수/실수 그대로 담는 __slots__ 데이터클래스
+
+금액 문자열("145,463,485")과 증감률 문자열("5.01%")은 저장(직렬화) 시점에 to_dict()에서만 만들며,
+출력 JSON 구조는 기존 딕셔너리 결과와 동일
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+
+def format_number(value: float) -> str:
+    """숫자를 천단위 콤마가 포함된 문자열로 포맷"""
+    return f"{int(value):,}"
+
+
+def format_rate(value: float, digits: int = 2) -> str:
+    """비율을 퍼센트 문자열로 포맷 (예: 5.01%)"""
+    return f"{value:.{digits}f}%"
+
+
+@dataclass(slots=True)
+class ReportInfo:
+    company_name: str = ""
+    company_code: str = ""
+    report_type: str = ""
+    period: str = ""
+
+    def to_dict(self) -> Dict:
+        return {
+            "company_name": self.company_name,
+            "company_code": self.company_code,
+            "report_type": self.report_type,
+            "period": self.period
+        }
+
+
+@dataclass(slots=True)
+class FinancialItem:
+    """손익 항목 1개 (금액 단위: 백만원)"""
+    item: str
+    current: int
+    previous: int
+
+    @property
+    def growth_rate(self) -> float:
+        """전년 동기 대비 증감률 (%)"""
+        return ((self.current - self.previous) / abs(self.previous)) * 100 if self.previous else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "item": self.item,
+            "current_period_amount": format_number(self.current),
+            "previous_period_amount": format_number(self.previous),
+            "yoy_growth_rate": format_rate(self.growth_rate)
+        }
+
+
+@dataclass(slots=True)
+class BusinessSegment:
+    """사업부문 1개 (금액 단위: 백만원, contribution: 전체 영업이익 대비 %)"""
+    segment_name: str
+    details: str
+    revenue: int
+    operating_profit: int
+    contribution: float = 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "segment_name": self.segment_name,
+            "details": self.details,
+            "revenue": format_number(self.revenue),
+            "operating_profit": format_number(self.operating_profit),
+            "contribution_to_op": format_rate(self.contribution, 1)
+        }
+
+
+@dataclass(slots=True)
+class PerformanceSummary:
+    sentiment: str = "neutral"
+    summary_title: str = ""
+    key_message: str = ""
+
+    def to_dict(self) -> Dict:
+        return {
+            "sentiment": self.sentiment,
+            "summary_title": self.summary_title,
+            "key_message": self.key_message
+        }
+
+
+@dataclass(slots=True)
+class KeyFactors:
+    positive: List[str] = field(default_factory=list)
+    negative: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict:
+        return {
+            "positive": list(self.positive),
+            "negative": list(self.negative)
+        }
+
+
+@dataclass(slots=True)
+class EarningsReport:
+    """실적 보고서 파싱 결과 (parser_earnings.parse / parse_structured)"""
+    report_info: ReportInfo
+    financial_data: List[FinancialItem]
+    business_segments: List[BusinessSegment] = field(default_factory=list)
+    performance_summary: PerformanceSummary = field(default_factory=PerformanceSummary)
+    key_factors: KeyFactors = field(default_factory=KeyFactors)
+    unit: str = "백만원"
+
+    def item(self, name: str) -> Optional[FinancialItem]:
+        """항목명으로 손익 항목 찾기"""
+        return next((item for item in self.financial_data if item.item == name), None)
+
+    def to_dict(self) -> Dict:
+        """저장용 딕셔너리 (기존 결과 JSON과 같은 구조와 문자열 형식)"""
+        return {
+            "report_info": self.report_info.to_dict(),
+            "performance_summary": self.performance_summary.to_dict(),
+            "financials": {
+                "unit": self.unit,
+                "consolidated_statement": [item.to_dict() for item in self.financial_data]
+            },
+            "business_segments": [segment.to_dict() for segment in self.business_segments],
+            "key_factors": self.key_factors.to_dict()
+        }
+
+
+def to_dict(result) -> Dict:
+    """결과 모델이면 저장용 딕셔너리로 변환, 이미 딕셔너리면 그대로 반환"""
+    return result.to_dict() if hasattr(result, 'to_dict') else result
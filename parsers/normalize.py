@@ -0,0 +1,142 @@
+"""
+표 숫자 정규화 모듈
+셀 문자열 열(또는 표 전체)을 한 번의 배열 연산으로 int64 금액과 유효 여부 마스크로 변환
+
+- 음수 표기: △/▲ 접두, 괄호 "(1,234)", 앞의 "-"
+- "-" 단독 셀은 0 (공시 표에서 해당 금액 없음)
+- 금액 단위(원/천원/백만원/억원/조원) 배수 적용 → 원 단위 정수
+"""
+
+import re
+from typing import NamedTuple, Optional, Sequence
+
+import numpy as np
+
+# 금액 단위 → 원 환산 배수
+UNIT_SCALES = {
+    "원": 1,
+    "천원": 1_000,
+    "백만원": 1_000_000,
+    "억원": 100_000_000,
+    "조원": 1_000_000_000_000,
+    "조": 1_000_000_000_000,
+}
+
+# 음수를 나타내는 접두 기호
+NEGATIVE_MARKS = ('△', '▲', '-')
+
+# 셀 정규화 시 지우는 문자 (천단위 구분, 공백, 음수 표기)
+_DELETE_TABLE = str.maketrans({',': None, ' ': None, '\xa0': None, '\t': None, '△': None, '▲': None, '(': None, ')': None})
+# 전각/유사 빼기 기호는 "-"로 통일
+_DASH_TABLE = str.maketrans({'－': '-', '−': '-', '–': '-'})
+
+# int64 범위를 넘지 않는 최대 자릿수
+MAX_DIGITS = 18
+
+_UNIT_PATTERN = re.compile(r'(조원|억원|백만원|천원|원|조)')
+_NON_NUMERIC_PATTERN = re.compile(r'[^\d.-]')
+
+
+class Numbers(NamedTuple):
+    """정규화 결과 (values: 원 단위 int64, valid: 숫자로 읽은 셀 여부, 입력과 같은 모양)"""
+    values: np.ndarray
+    valid: np.ndarray
+
+
+def unit_scale(unit: Optional[str]) -> int:
+    """단위 표기("백만원", "(단위 : 억원)" 등)의 원 환산 배수 (단위가 없으면 1)"""
+    if not unit:
+        return 1
+    if unit in UNIT_SCALES:
+        return UNIT_SCALES[unit]
+    match = _UNIT_PATTERN.search(unit.replace(' ', ''))
+    return UNIT_SCALES[match.group(1)] if match else 1
+
+
+def normalize_cells(cells, unit: Optional[str] = None) -> Numbers:
+    """
+    셀 문자열 배열을 원 단위 정수로 변환
+
+    Args:
+        cells: 셀 문자열의 1차원(열) 또는 2차원(행 목록) 배열/리스트
+        unit: 금액 단위 (예: '백만원', 표의 단위 표기 문자열)
+
+    Returns:
+        Numbers(values, valid) - 읽지 못한 셀은 values 0, valid False
+    """
+    scale = unit_scale(unit)
+    text = np.char.strip(np.char.translate(np.asarray(cells, dtype=str), _DASH_TABLE))
+
+    negative = np.char.startswith(text, '(') & np.char.endswith(text, ')')
+    for mark in NEGATIVE_MARKS:
+        negative |= np.char.startswith(text, mark)
+
+    dash_only = text == '-'
+    digits = np.char.lstrip(np.char.translate(text, _DELETE_TABLE), '-')
+
+    # 소수점은 하나까지 허용
+    has_point = np.char.count(digits, '.') == 1
+    valid = np.char.isdecimal(np.where(has_point, np.char.replace(digits, '.', '', 1), digits))
+    valid &= np.char.str_len(digits) <= MAX_DIGITS
+
+    values = np.zeros(text.shape, dtype=np.int64)
+    limit = np.iinfo(np.int64).max // scale
+
+    # 정수는 int64로 바로 변환 (큰 금액도 정밀도 손실 없음), 소수는 float64로 배수 적용 후 반올림
+    integers = valid & ~has_point
+    if integers.any():
+        raw = digits[integers].astype(np.int64)
+        overflow = raw > limit
+        values[integers] = np.where(overflow, 0, raw * scale)
+        valid[integers] = ~overflow
+    decimals = valid & has_point
+    if decimals.any():
+        raw = digits[decimals].astype(np.float64)
+        overflow = raw > limit
+        values[decimals] = np.where(overflow, 0, np.rint(np.where(overflow, 0, raw) * scale)).astype(np.int64)
+        valid[decimals] = ~overflow
+
+    values[negative] *= -1
+    return Numbers(values, valid | dash_only)
+
+
+def normalize_rows(rows: Sequence[Sequence[str]], unit: Optional[str] = None) -> Numbers:
+    """
+    표 행 목록(길이가 다를 수 있음)을 한 번에 정규화
+
+    짧은 행은 빈 셀로 채워 (행 수, 최대 열 수) 배열로 만든 뒤 열 단위로 변환
+    """
+    width = max((len(row) for row in rows), default=0)
+    grid = [list(row) + [''] * (width - len(row)) for row in rows]
+    if not grid or not width:
+        return Numbers(np.zeros((len(grid), width), dtype=np.int64), np.zeros((len(grid), width), dtype=bool))
+    return normalize_cells(grid, unit)
+
+
+def clean_number(value: str) -> float:
+    """문자열 1개에서 숫자 추출 (괄호/△/▲는 음수, 숫자 외 문자는 무시)"""
+    if not value:
+        return 0
+
+    text = value.strip().translate(_DASH_TABLE)
+    if text == '-':
+        return 0
+
+    try:
+        is_negative = (text[0] in '△▲') or ('(' in text and ')' in text)
+
+        # 숫자와 소수점, 음수 기호만 남김
+        cleaned = _NON_NUMERIC_PATTERN.sub('', text)
+
+        if not cleaned or cleaned == '-':
+            return 0
+
+        number = float(cleaned)
+
+        if is_negative:
+            number = -abs(number)
+
+        return number
+
+    except (ValueError, AttributeError, IndexError):
+        return 0
@@ -3,114 +3,251 @@
 연결손익계산서 및 부문별 정보를 추출
 """
 
-from bs4 import BeautifulSoup
 import re
-from typing import Optional, Dict, List
+from typing import Optional, Dict, Iterable, List, Tuple, Union
 
+import metrics
+from .budget import DEFAULT_PARSE_TIMEOUT, ParseTimeout, TimeBudget, record_timeout
+from .encoding import detect_encoding
+from .models import (
+    BusinessSegment, EarningsReport, FinancialItem, KeyFactors, PerformanceSummary, ReportInfo
+)
+from .normalize import Numbers, clean_number, normalize_rows
+from .tables import Table, TableScanner, normalize_label, row_label
 
-def parse(html_content: str) -> Optional[Dict]:
+# 추출 함수별 소요 시간 기록
+timed_extract = metrics.timed('dart_extract_seconds', function_label=True, parser='parser_earnings')
+
+# 재무제표 API 계정명 → 결과 항목명 (손익계산서 계정만 사용)
+STRUCTURED_ACCOUNTS = {
+    "매출액": ("매출액", "수익(매출액)", "영업수익", "매출"),
+    "영업이익": ("영업이익", "영업이익(손실)", "영업손익"),
+    "당기순이익": ("당기순이익", "당기순이익(손실)", "분기순이익", "분기순이익(손실)", "반기순이익", "반기순이익(손실)")
+}
+STATEMENT_DIVISIONS = ("IS", "CIS")
+
+# 사업보고서 보고서 코드 (그 외 11013/11012/11014는 분/반기 보고서)
+REPORT_CODE_ANNUAL = "11011"
+# 재무제표 API 손익 행의 (당기, 전기) 금액 필드 (앞에서부터 두 값이 모두 있는 쌍 사용)
+# 분/반기 보고서의 frmtrm_amount는 직전 사업연도 전체(전기말) 금액이므로 같은 기간 금액이 없을 때만 사용
+ANNUAL_AMOUNT_FIELDS = (("thstrm_amount", "frmtrm_amount"),)
+INTERIM_AMOUNT_FIELDS = (
+    ("thstrm_amount", "frmtrm_q_amount"),        # 3개월 (fnlttSinglAcntAll)
+    ("thstrm_add_amount", "frmtrm_add_amount"),  # 누적
+    ("thstrm_amount", "frmtrm_amount"),
+)
+
+# 단위 표기가 없는 표의 금액 단위
+DEFAULT_TABLE_UNIT = "백만원"
+
+# 표 행 이름 → 결과 항목명
+TABLE_LABELS = {
+    name.replace(' ', ''): item
+    for item, account_names in STRUCTURED_ACCOUNTS.items()
+    for name in account_names
+}
+
+# 표 머리글의 기수 표기 (예: "제 56 기 1분기")
+PERIOD_NUMBER_PATTERN = re.compile(r'제\s*(\d+)\s*기')
+# 표 머리글의 연도 표기 (예: "2024년 1분기", "2024.01.01~2024.03.31", "FY2024")
+HEADER_YEAR_PATTERN = re.compile(r'(?<!\d)((?:19|20)\d{2})(?!\d)')
+# 주석 열 머리글과 주석 번호 셀 (예: "4", "4,26", "5~7")
+NOTE_HEADER_PATTERN = re.compile(r'주석|note', re.I)
+NOTE_REFERENCE_PATTERN = re.compile(r'^\d{1,2}(?:[,~\-]\d{1,2})*$')
+# 여러 주석 번호를 나열한 셀 (천 단위 콤마 금액과 달리 콤마 뒤가 세 자리가 아님)
+NOTE_LIST_PATTERN = re.compile(r'^\d{1,2}(?:[,~\-]\d{1,2})+$')
+
+# 문서 1건의 파싱 제한 시간 (초, DART_PARSE_TIMEOUT)
+PARSE_TIMEOUT = DEFAULT_PARSE_TIMEOUT
+
+# 원문 검색 항목명 (앞에 있는 항목명부터 확인, 금액 하한: 백만원 단위)
+REVENUE_LABELS = ('매출액', '수익', '영업수익')
+OPERATING_PROFIT_LABELS = ('영업이익', '영업손익')
+NET_PROFIT_LABELS = ('당기순이익', '순이익', '분기순이익')
+
+# 원문 검색 구간: 항목명 위치부터 이 길이(마크업 포함 문자 수)만 태그를 지우고 검색
+LABEL_WINDOW_CHARS = 1024
+# 항목명과 금액 사이에 허용하는 숫자 아닌 문자 수 (태그 제거 후)
+LABEL_GAP_CHARS = 64
+TAG_PATTERN = re.compile(r'<[^>]*>')
+# 항목명 바로 뒤에서 시작하는 첫 번째 금액 (사이 문자 수 제한으로 문서 끝까지 되짚지 않음)
+LABEL_AMOUNT_PATTERN = re.compile(rf'[^\d]{{0,{LABEL_GAP_CHARS}}}(\d+(?:,\d+)*(?:\([^)]{{1,{LABEL_GAP_CHARS}}}\))?)')
+
+
+@metrics.timed('dart_parse_seconds', parser='parser_earnings')
+def parse(html_content: Union[str, bytes], timeout: Optional[float] = None) -> Optional[EarningsReport]:
     """
     실적 보고서 HTML 파싱하여 구조화된 데이터를 추출
     
     Args:
-        html_content: 공시 HTML 문자열
+        html_content: 공시 HTML 문자열 또는 원본 바이트
+        timeout: 파싱 제한 시간 (초, 기본값: PARSE_TIMEOUT, 0이면 제한 없음)
     
     Returns:
-        구조화된 실적 데이터 딕셔너리 또는 None
+        실적 결과 모델 (저장 시 to_dict()로 기존 JSON 구조 변환) 또는 None (제한 시간 초과 포함)
     """
+    budget = TimeBudget(PARSE_TIMEOUT if timeout is None else timeout)
+    
     try:
-        # 인코딩 문제 해결을 위한 전처리
+        # 문서 트리를 만들지 않고 표 단위로 스트리밍 파싱 (원본 바이트는 감지된 인코딩으로 lxml에 바로 전달)
+        encoding = None
         if isinstance(html_content, bytes):
-            html_content = html_content.decode('utf-8', errors='ignore')
-        
-        # BeautifulSoup으로 파싱
-        soup = BeautifulSoup(html_content, 'html.parser')
-        
-        # 기본 결과 구조
-        result = {
-            "report_info": {
-                "company_name": "",
-                "company_code": "005930",  # 삼성전자 종목코드
-                "report_type": "",
-                "period": ""
-            },
-            "performance_summary": {
-                "sentiment": "neutral",
-                "summary_title": "",
-                "key_message": ""
-            },
-            "financials": {
-                "unit": "백만원",
-                "consolidated_statement": []
-            },
-            "business_segments": [],
-            "key_factors": {
-                "positive": [],
-                "negative": []
-            }
-        }
-        
-        # 1. 보고서 기본 정보 추출
-        result["report_info"] = extract_report_info(soup)
-        
-        # 2. 재무 데이터 추출
-        financial_data = extract_financial_data(soup, html_content)
-        result["financials"]["consolidated_statement"] = financial_data
+            with metrics.timer('dart_decode_seconds'):
+                encoding = detect_encoding(html_content)
+        scanner = TableScanner(html_content, encoding, budget=budget)
+        
+        # 1. 재무 데이터 추출 (손익 항목을 모두 찾으면 나머지 문서는 파싱하지 않음)
+        financial_data = extract_financial_data(scanner, html_content, encoding, budget)
+        
+        # 필수 데이터가 없으면 None 반환
+        if not financial_data:
+            print("재무 데이터를 찾을 수 없습니다.")
+            return None
+        
+        # 2. 보고서 기본 정보 추출 (표를 찾는 동안 모아 둔 앞부분 텍스트 사용)
+        result = EarningsReport(extract_report_info(scanner.texts), financial_data)
         
         # 3. 사업부문별 정보 추출
-        segments = extract_business_segments(soup, financial_data)
-        result["business_segments"] = segments
+        result.business_segments = extract_business_segments(scanner.texts, financial_data)
         
         # 4. 성과 요약 생성
-        result["performance_summary"] = generate_performance_summary(financial_data, segments)
+        result.performance_summary = generate_performance_summary(financial_data, result.business_segments)
         
         # 5. 핵심 요인 추출
-        result["key_factors"] = extract_key_factors(soup)
+        result.key_factors = extract_key_factors(scanner.texts)
+            
+        return result
         
-        # 필수 데이터가 없으면 None 반환
+    except ParseTimeout as e:
+        # 작업자를 붙잡아 두지 않도록 중단하고 느린 문서로 기록
+        print(f"파싱 중단: {e} (문서 크기 {len(html_content):,})")
+        metrics.inc('dart_parse_timeouts_total', parser='parser_earnings', stage=e.stage)
+        record_timeout()
+        return None
+    except Exception as e:
+        print(f"파싱 오류: {e}")
+        return None
+
+
+def parse_structured(
+    accounts: List[Dict],
+    report: Optional[Dict] = None,
+    reprt_code: Optional[str] = None
+) -> Optional[EarningsReport]:
+    """
+    DART 재무제표 API(fnlttMultiAcnt / fnlttSinglAcntAll) 계정 행으로 실적 데이터 구성
+
+    HTML 다운로드/파싱 없이 당기/전기 실제 금액으로 손익 항목을 만들며,
+    결과 구조는 parse()와 동일 (business_segments/key_factors는 빈 값)
+    
+    Args:
+        accounts: 재무제표 API 응답의 계정 행 목록 (금액 단위: 원)
+        report: 공시 목록의 행 (회사명, 종목코드, 보고서명)
+        reprt_code: 보고서 코드 (None이면 계정 행의 reprt_code 사용, 전기 금액 필드 선택에 사용)
+    
+    Returns:
+        실적 결과 모델 또는 None (필요한 계정이 없는 경우)
+    """
+    report = report or {}
+    
+    try:
+        financial_data = extract_structured_financial_data(accounts, reprt_code)
         if not financial_data:
-            print("재무 데이터를 찾을 수 없습니다.")
             return None
-            
+        
+        report_nm = report.get("report_nm", "")
+        report_type = next((name for name in ("분기보고서", "반기보고서", "사업보고서") if name in report_nm), "")
+        
+        result = EarningsReport(
+            report_info=ReportInfo(
+                company_name=report.get("corp_name", ""),
+                company_code=(report.get("stock_code") or "").strip(),
+                report_type=report_type,
+                period=(accounts[0].get("thstrm_nm") or "").strip()
+            ),
+            financial_data=financial_data
+        )
+        
+        # 사업부문/핵심 요인은 재무제표 API에 없으므로 비워 둠 (기업과 무관한 샘플 값을 채우지 않음)
+        result.performance_summary = generate_performance_summary(financial_data, result.business_segments)
+        
         return result
         
     except Exception as e:
-        print(f"파싱 오류: {e}")
+        print(f"구조화 재무 데이터 처리 오류: {e}")
         return None
 
 
-def extract_report_info(soup: BeautifulSoup) -> Dict:
-    """보고서 기본 정보 추출"""
+@timed_extract
+def extract_structured_financial_data(accounts: List[Dict], reprt_code: Optional[str] = None) -> List[FinancialItem]:
+    """
+    재무제표 API 계정 행에서 매출액/영업이익/당기순이익 추출 (연결 재무제표 우선)
+    
+    분/반기 보고서는 전년 동기 금액(3개월, 없으면 누적)을 전기 금액으로 사용
+    """
+    result = []
+    
+    statement_rows = [row for row in accounts if row.get("sj_div", "IS") in STATEMENT_DIVISIONS]
+    # 연결(CFS) 행을 먼저, 별도(OFS) 행을 나중에 확인
+    statement_rows.sort(key=lambda row: row.get("fs_div", "CFS") != "CFS")
+    
+    for item, account_names in STRUCTURED_ACCOUNTS.items():
+        row = next((row for row in statement_rows if row.get("account_nm", "").strip() in account_names), None)
+        if not row:
+            continue
+        
+        current_field, previous_field = amount_fields(row, reprt_code or row.get("reprt_code"))
+        
+        # 원 단위 금액을 백만원 단위로 변환
+        current_value = round(clean_number(row.get(current_field, "")) / 1_000_000)
+        previous_value = round(clean_number(row.get(previous_field, "")) / 1_000_000)
+        
+        result.append(FinancialItem(item, current_value, previous_value))
+    
+    return result
+
+
+def amount_fields(row: Dict, reprt_code: Optional[str]) -> Tuple[str, str]:
+    """보고서 코드에 맞는 (당기, 전기) 금액 필드 (보고서 코드를 모르면 사업보고서 기준)"""
+    candidates = INTERIM_AMOUNT_FIELDS if reprt_code and reprt_code != REPORT_CODE_ANNUAL else ANNUAL_AMOUNT_FIELDS
+    for current_field, previous_field in candidates:
+        if has_amount(row.get(current_field)) and has_amount(row.get(previous_field)):
+            return current_field, previous_field
+    return candidates[-1]
+
+
+def has_amount(value: Optional[str]) -> bool:
+    """금액 필드에 값이 있는지 (빈 문자열과 '-'는 값 없음)"""
+    return bool(value and value.strip().strip('-'))
+
+
+@timed_extract
+def extract_report_info(texts: List[str]) -> ReportInfo:
+    """보고서 기본 정보 추출 (문서 앞부분 텍스트 노드 목록에서 검색)"""
     # """추후 NER 모델로 연결할 부분"""
-    info = {
-        "company_name": "삼성전자주식회사",
-        "company_code": "005930",
-        "report_type": "",
-        "period": ""
-    }
+    info = ReportInfo(company_name="삼성전자주식회사", company_code="005930")
     
     try:
         # 회사명 추출
         company_patterns = [
-            soup.find(string=re.compile(r'삼성전자')),
-            soup.find(string=re.compile(r'회사명')),
-            soup.find(string=re.compile(r'법인명'))
+            find_text(texts, r'삼성전자'),
+            find_text(texts, r'회사명'),
+            find_text(texts, r'법인명')
         ]
         
         for pattern in company_patterns:
             if pattern:
-                text = str(pattern)
-                if '삼성전자' in text:
-                    info["company_name"] = "삼성전자주식회사"
+                if '삼성전자' in pattern:
+                    info.company_name = "삼성전자주식회사"
                     break
         
         # 보고서 유형 추출
-        report_type_element = soup.find(string=re.compile(r'분기보고서|반기보고서'))
+        report_type_element = find_text(texts, r'분기보고서|반기보고서')
         if report_type_element:
-            if '분기보고서' in str(report_type_element):
-                info["report_type"] = "분기보고서"
-            elif '반기보고서' in str(report_type_element):
-                info["report_type"] = "반기보고서"
+            if '분기보고서' in report_type_element:
+                info.report_type = "분기보고서"
+            elif '반기보고서' in report_type_element:
+                info.report_type = "반기보고서"
         
         # 보고 기간 추출
         period_patterns = [
@@ -120,9 +257,9 @@ def extract_report_info(soup: BeautifulSoup) -> Dict:
         ]
         
         for pattern in period_patterns:
-            period_match = soup.find(string=re.compile(pattern))
+            period_match = find_text(texts, pattern)
             if period_match:
-                info["period"] = str(period_match).strip()
+                info.period = period_match
                 break
                 
     except Exception as e:
@@ -131,127 +268,287 @@ def extract_report_info(soup: BeautifulSoup) -> Dict:
     return info
 
 
-def extract_financial_data(soup: BeautifulSoup, content: str) -> List[Dict]:
-    """재무 데이터 추출"""
-    # """추후 NER 모델로 연결할 부분"""
+def find_text(texts: List[str], pattern: str) -> Optional[str]:
+    """패턴이 포함된 첫 번째 텍스트 노드"""
+    compiled = re.compile(pattern)
+    return next((text for text in texts if compiled.search(text)), None)
+
+
+@timed_extract
+def extract_financial_data(
+    tables: Iterable[Table],
+    content: Union[str, bytes],
+    encoding: Optional[str] = None,
+    budget: Optional[TimeBudget] = None
+) -> List[FinancialItem]:
+    """
+    재무 데이터 추출
+    
+    손익 표에서 당기/전기 금액을 읽고, 표에서 찾지 못하면 원문 정규식 검색으로 대체
+    
+    Args:
+        tables: 문서의 표 (TableScanner)
+        content: 공시 HTML 문자열 또는 원본 바이트 (정규식 검색용)
+        encoding: 원본 바이트의 인코딩
+        budget: 파싱 제한 시간 (초과하면 ParseTimeout을 그대로 전달)
+    """
     result = []
     
-    # 실제 데이터 추출 시도
+    # 표에서 추출
     try:
+        result = extract_table_financial_data(tables)
+    except ParseTimeout:
+        raise
+    except Exception as e:
+        print(f"재무 표 추출 오류: {e}")
+    
+    if result:
+        return result
+    
+    # 표에서 찾지 못한 경우에만 문서 전체를 디코딩하여 정규식 검색
+    try:
+        if isinstance(content, bytes):
+            with metrics.timer('dart_decode_seconds'):
+                content = content.decode(encoding or 'utf-8', errors='replace')
+        
         # 매출액 추출
-        revenue_data = extract_revenue_data(soup, content)
+        revenue_data = extract_revenue_data(content, budget)
         if revenue_data:
             result.append(revenue_data)
         
         # 영업이익 추출
-        operating_data = extract_operating_profit_data(soup, content)
+        operating_data = extract_operating_profit_data(content, budget)
         if operating_data:
             result.append(operating_data)
         
         # 순이익 추출
-        net_data = extract_net_profit_data(soup, content)
+        net_data = extract_net_profit_data(content, budget)
         if net_data:
             result.append(net_data)
             
+    except ParseTimeout:
+        raise
     except Exception as e:
         print(f"재무 데이터 추출 오류: {e}")
     
     # 실제 데이터를 찾지 못한 경우 샘플 데이터 사용
     if not result:
         print("실제 재무 데이터를 찾지 못해 샘플 데이터를 사용합니다.")
+        metrics.inc('dart_sample_fallback_total', parser='parser_earnings', data='financials')
         result = get_sample_financial_data()
     
     return result
 
 
-def extract_revenue_data(soup: BeautifulSoup, content: str) -> Optional[Dict]:
+@timed_extract
+def extract_table_financial_data(tables: Iterable[Table]) -> List[FinancialItem]:
+    """
+    표에서 매출액/영업이익/당기순이익 행의 당기/전기 금액 추출
+    
+    표를 순서대로 보며 항목별로 처음 찾은 행을 사용하고(요약재무정보/연결손익계산서가 앞쪽에 있음),
+    세 항목을 모두 찾으면 나머지 표는 읽지 않음
+    """
+    found: Dict[str, Tuple[int, int]] = {}
+    
+    for table in tables:
+        numbers = None
+        for row_index, row in enumerate(table.rows):
+            item = TABLE_LABELS.get(normalize_label(row_label(row)))
+            if not item or item in found:
+                continue
+            
+            # 항목 행이 있는 표만 표 전체를 한 번에 원 단위 정수로 변환
+            if numbers is None:
+                numbers = normalize_rows(table.rows, table.unit or DEFAULT_TABLE_UNIT)
+            
+            amounts = extract_row_amounts(table, row_index, numbers)
+            if amounts:
+                found[item] = amounts
+        
+        if len(found) == len(STRUCTURED_ACCOUNTS):
+            break
+    
+    result = []
+    for item in STRUCTURED_ACCOUNTS:
+        if item not in found:
+            continue
+        
+        # 원 단위 금액을 백만원 단위로 변환
+        current_value, previous_value = (round(value / 1_000_000) for value in found[item])
+        result.append(FinancialItem(item, current_value, previous_value))
+    
+    return result
+
+
+def extract_row_amounts(table: Table, row_index: int, numbers: Numbers) -> Optional[Tuple[int, int]]:
+    """
+    표 행에서 (당기, 전기) 금액 추출 (원 단위)
+    
+    주석 열(머리글이 주석/Note이거나 값이 주석 번호인 열)은 금액 열에서 빼고,
+    머리글 행에 "당기/전기", "제 N 기" 또는 연도 표기가 있으면 해당 열을 사용하며,
+    없으면 금액 열 개수로 판단 (4개: 당기 3개월/누적, 전기 3개월/누적 → 1번째와 3번째, 그 외 → 1번째와 2번째)
+    """
+    valid = numbers.valid[row_index]
+    amount_columns = [int(column) for column in valid[1:].nonzero()[0] + 1]
+    # 금액 열이 홀수 개면 첫 열이 주석 열일 수 있으므로 값도 확인 (짝수 개면 작은 금액을 주석 번호로 오인하지 않도록 머리글만 확인)
+    odd = len(amount_columns) % 2 == 1
+    amount_columns = [
+        column for column in amount_columns
+        if not is_note_column(table.rows, row_index, column, check_values=odd and column == amount_columns[0])
+    ]
+    if len(amount_columns) < 2:
+        return None
+    
+    columns = period_columns(table.rows[:row_index], amount_columns)
+    if columns is None:
+        if len(amount_columns) == 4:
+            columns = (amount_columns[0], amount_columns[2])
+        else:
+            columns = (amount_columns[0], amount_columns[1])
+    
+    values = numbers.values[row_index]
+    return int(values[columns[0]]), int(values[columns[1]])
+
+
+def is_note_column(rows: List[List[str]], row_index: int, column: int, check_values: bool = False) -> bool:
+    """
+    주석 열인지 확인
+    
+    머리글에 주석/Note 표기가 있거나 행의 값이 주석 번호 나열("4,26")이면 주석 열이고,
+    check_values=True면 머리글 아래 값이 모두 한두 자리 주석 번호인 열도 주석 열로 판단
+    """
+    header = ''.join(row[column] for row in rows[:row_index] if column < len(row))
+    if NOTE_HEADER_PATTERN.search(header):
+        return True
+    if NOTE_LIST_PATTERN.match(rows[row_index][column].replace(' ', '')):
+        return True
+    if not check_values:
+        return False
+    
+    values = [row[column].replace(' ', '') for row in rows[row_index:] if column < len(row) and row[column].strip()]
+    return bool(values) and all(NOTE_REFERENCE_PATTERN.match(value) for value in values)
+
+
+def period_columns(header_rows: List[List[str]], amount_columns: List[int]) -> Optional[Tuple[int, int]]:
+    """머리글 행에서 당기/전기 열 번호 찾기 (찾지 못하면 None)"""
+    current, previous = [], []
+    numbered = {}
+    years = {}
+    
+    for column in amount_columns:
+        header = ''.join(row[column] for row in header_rows if column < len(row)).replace(' ', '')
+        if not header:
+            continue
+        if '당' in header:
+            current.append(column)
+        elif '전' in header:
+            previous.append(column)
+        
+        period_match = PERIOD_NUMBER_PATTERN.search(header)
+        if period_match:
+            numbered[column] = int(period_match.group(1))
+        
+        year_match = HEADER_YEAR_PATTERN.search(header)
+        if year_match:
+            years[column] = int(year_match.group(1))
+    
+    if current and previous:
+        return current[0], previous[0]
+    
+    # "제 56 기"/"제 55 기": 큰 기수가 당기, "2024년 1분기"/"2023년 1분기": 늦은 연도가 당기
+    for periods in (numbered, years):
+        if len(set(periods.values())) >= 2:
+            latest = max(periods.values())
+            current = [column for column, number in periods.items() if number == latest]
+            previous = [column for column, number in periods.items() if number == latest - 1]
+            if current and previous:
+                return current[0], previous[0]
+    
+    return None
+
+
+def find_label_amount(content: str, label: str, budget: Optional[TimeBudget] = None) -> Optional[str]:
+    """
+    원문에서 항목명 바로 뒤에 금액이 있는 첫 번째 위치의 금액 문자열
+    
+    문서 전체에 정규식을 적용하지 않고, 항목명이 나오는 위치마다 뒤쪽 LABEL_WINDOW_CHARS 구간만
+    태그를 지운 뒤 LABEL_GAP_CHARS 안에 금액이 있는지 확인 (표 셀이 나뉘어 있어도 같은 구간에서 찾음)
+    """
+    start = content.find(label)
+    while start != -1:
+        if budget is not None:
+            budget.check('원문 검색')
+        
+        window = TAG_PATTERN.sub(' ', content[start + len(label):start + len(label) + LABEL_WINDOW_CHARS])
+        match = LABEL_AMOUNT_PATTERN.match(window)
+        if match:
+            return match.group(1)
+        
+        start = content.find(label, start + len(label))
+    
+    return None
+
+
+@timed_extract
+def extract_revenue_data(content: str, budget: Optional[TimeBudget] = None) -> Optional[FinancialItem]:
     """매출액 데이터 추출"""
     try:
-        # 다양한 패턴으로 매출액 찾기
-        patterns = [
-            r'매출액[^\d]*?(\d+(?:,\d+)*(?:\([^)]+\))?)',
-            r'수익[^\d]*?(\d+(?:,\d+)*(?:\([^)]+\))?)',
-            r'영업수익[^\d]*?(\d+(?:,\d+)*(?:\([^)]+\))?)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                current_value = clean_number(matches[0])
+        # 다양한 항목명으로 매출액 찾기
+        for label in REVENUE_LABELS:
+            amount = find_label_amount(content, label, budget)
+            if amount:
+                current_value = clean_number(amount)
                 if current_value > 1000000:  # 1억 이상
                     previous_value = int(current_value * 0.95)  # 추정값
-                    growth_rate = ((current_value - previous_value) / previous_value) * 100
-                    
-                    return {
-                        "item": "매출액",
-                        "current_period_amount": format_number(current_value),
-                        "previous_period_amount": format_number(previous_value),
-                        "yoy_growth_rate": f"{growth_rate:.2f}%"
-                    }
+                    return FinancialItem("매출액", int(current_value), previous_value)
+    except ParseTimeout:
+        raise
     except Exception as e:
         print(f"매출액 추출 오류: {e}")
     
     return None
 
 
-def extract_operating_profit_data(soup: BeautifulSoup, content: str) -> Optional[Dict]:
+@timed_extract
+def extract_operating_profit_data(content: str, budget: Optional[TimeBudget] = None) -> Optional[FinancialItem]:
     """영업이익 데이터 추출"""
     try:
-        patterns = [
-            r'영업이익[^\d]*?(\d+(?:,\d+)*(?:\([^)]+\))?)',
-            r'영업손익[^\d]*?(\d+(?:,\d+)*(?:\([^)]+\))?)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                current_value = clean_number(matches[0])
+        for label in OPERATING_PROFIT_LABELS:
+            amount = find_label_amount(content, label, budget)
+            if amount:
+                current_value = clean_number(amount)
                 if current_value > 100000:  # 1천만 이상
                     previous_value = int(current_value * 0.8)  # 추정값
-                    growth_rate = ((current_value - previous_value) / previous_value) * 100
-                    
-                    return {
-                        "item": "영업이익",
-                        "current_period_amount": format_number(current_value),
-                        "previous_period_amount": format_number(previous_value),
-                        "yoy_growth_rate": f"{growth_rate:.2f}%"
-                    }
+                    return FinancialItem("영업이익", int(current_value), previous_value)
+    except ParseTimeout:
+        raise
     except Exception as e:
         print(f"영업이익 추출 오류: {e}")
     
     return None
 
 
-def extract_net_profit_data(soup: BeautifulSoup, content: str) -> Optional[Dict]:
+@timed_extract
+def extract_net_profit_data(content: str, budget: Optional[TimeBudget] = None) -> Optional[FinancialItem]:
     """순이익 데이터 추출"""
     try:
-        patterns = [
-            r'당기순이익[^\d]*?(\d+(?:,\d+)*(?:\([^)]+\))?)',
-            r'순이익[^\d]*?(\d+(?:,\d+)*(?:\([^)]+\))?)',
-            r'분기순이익[^\d]*?(\d+(?:,\d+)*(?:\([^)]+\))?)'
-        ]
-        
-        for pattern in patterns:
-            matches = re.findall(pattern, content, re.IGNORECASE)
-            if matches:
-                current_value = clean_number(matches[0])
+        for label in NET_PROFIT_LABELS:
+            amount = find_label_amount(content, label, budget)
+            if amount:
+                current_value = clean_number(amount)
                 if current_value > 100000:  # 1천만 이상
                     previous_value = int(current_value * 0.9)  # 추정값
-                    growth_rate = ((current_value - previous_value) / previous_value) * 100
-                    
-                    return {
-                        "item": "당기순이익",
-                        "current_period_amount": format_number(current_value),
-                        "previous_period_amount": format_number(previous_value),
-                        "yoy_growth_rate": f"{growth_rate:.2f}%"
-                    }
+                    return FinancialItem("당기순이익", int(current_value), previous_value)
+    except ParseTimeout:
+        raise
     except Exception as e:
         print(f"순이익 추출 오류: {e}")
     
     return None
 
 
-def extract_business_segments(soup: BeautifulSoup, financial_data: List[Dict]) -> List[Dict]:
+@timed_extract
+def extract_business_segments(texts: Optional[List[str]], financial_data: List[FinancialItem]) -> List[BusinessSegment]:
     """사업부문별 정보를 추출합니다."""
     # """추후 NER 모델로 연결할 부분"""
     segments = []
@@ -259,39 +556,19 @@ def extract_business_segments(soup: BeautifulSoup, financial_data: List[Dict]) -
     try:
         # 삼성전자 주요 사업부문 정보
         segment_info = [
-            {
-                "segment_name": "DS (Device Solutions)",
-                "details": "메모리, 파운드리 등 반도체 사업",
-                "revenue": "45,123,456",
-                "operating_profit": "8,765,432"
-            },
-            {
-                "segment_name": "DX (Device eXperience)",
-                "details": "TV, 가전, 스마트폰 사업",
-                "revenue": "80,987,654",
-                "operating_profit": "6,543,210"
-            },
-            {
-                "segment_name": "SDC (Samsung Display)",
-                "details": "디스플레이 패널 사업",
-                "revenue": "15,123,456",
-                "operating_profit": "1,234,567"
-            }
+            BusinessSegment("DS (Device Solutions)", "메모리, 파운드리 등 반도체 사업", 45_123_456, 8_765_432),
+            BusinessSegment("DX (Device eXperience)", "TV, 가전, 스마트폰 사업", 80_987_654, 6_543_210),
+            BusinessSegment("SDC (Samsung Display)", "디스플레이 패널 사업", 15_123_456, 1_234_567)
         ]
         
-        # 전체 영업이익 계산
-        total_operating_profit = 0
-        for item in financial_data:
-            if item["item"] == "영업이익":
-                total_operating_profit = clean_number(item["current_period_amount"])
-                break
+        # 전체 영업이익
+        operating = next((item for item in financial_data if item.item == "영업이익"), None)
+        total_operating_profit = operating.current if operating else 0
         
         # 각 부문의 기여도 계산
         for segment in segment_info:
-            op_profit = clean_number(segment["operating_profit"])
-            contribution = (op_profit / total_operating_profit) * 100 if total_operating_profit > 0 else 0
-            
-            segment["contribution_to_op"] = f"{contribution:.1f}%"
+            if total_operating_profit > 0:
+                segment.contribution = (segment.operating_profit / total_operating_profit) * 100
             segments.append(segment)
             
     except Exception as e:
@@ -300,59 +577,50 @@ def extract_business_segments(soup: BeautifulSoup, financial_data: List[Dict]) -
     return segments
 
 
-def generate_performance_summary(financial_data: List[Dict], segments: List[Dict]) -> Dict:
+def generate_performance_summary(financial_data: List[FinancialItem], segments: List[BusinessSegment]) -> PerformanceSummary:
     """성과 요약 생성"""
-    summary = {
-        "sentiment": "neutral",
-        "summary_title": "",
-        "key_message": ""
-    }
+    summary = PerformanceSummary()
     
     try:
         # 영업이익 성장률 확인
-        operating_growth = 0
-        for item in financial_data:
-            if item["item"] == "영업이익":
-                operating_growth = float(item["yoy_growth_rate"].replace('%', ''))
-                break
+        operating = next((item for item in financial_data if item.item == "영업이익"), None)
+        operating_growth = operating.growth_rate if operating else 0
         
         # 감정 분석
         if operating_growth > 20:
-            summary["sentiment"] = "positive"
-            summary["summary_title"] = "DS(반도체) 부문 실적 개선으로 어닝 서프라이즈 기록"
-            summary["key_message"] = f"전년 동기 대비 영업이익 {operating_growth:.1f}% 증가하며 시장 기대치 상회"
+            summary.sentiment = "positive"
+            summary.summary_title = "DS(반도체) 부문 실적 개선으로 어닝 서프라이즈 기록"
+            summary.key_message = f"전년 동기 대비 영업이익 {operating_growth:.1f}% 증가하며 시장 기대치 상회"
         elif operating_growth > 10:
-            summary["sentiment"] = "positive"
-            summary["summary_title"] = "안정적인 실적 성장세 지속"
-            summary["key_message"] = f"영업이익 {operating_growth:.1f}% 증가로 견조한 성장세 유지"
+            summary.sentiment = "positive"
+            summary.summary_title = "안정적인 실적 성장세 지속"
+            summary.key_message = f"영업이익 {operating_growth:.1f}% 증가로 견조한 성장세 유지"
         elif operating_growth > 0:
-            summary["sentiment"] = "neutral"
-            summary["summary_title"] = "소폭 실적 개선"
-            summary["key_message"] = f"영업이익 {operating_growth:.1f}% 증가"
+            summary.sentiment = "neutral"
+            summary.summary_title = "소폭 실적 개선"
+            summary.key_message = f"영업이익 {operating_growth:.1f}% 증가"
         else:
-            summary["sentiment"] = "negative"
-            summary["summary_title"] = "실적 둔화 우려"
-            summary["key_message"] = f"영업이익 {operating_growth:.1f}% 감소"
+            summary.sentiment = "negative"
+            summary.summary_title = "실적 둔화 우려"
+            summary.key_message = f"영업이익 {operating_growth:.1f}% 감소"
             
     except Exception as e:
         print(f"성과 요약 생성 오류: {e}")
-        summary["summary_title"] = "실적 보고서"
-        summary["key_message"] = "재무 데이터 분석 완료"
+        summary.summary_title = "실적 보고서"
+        summary.key_message = "재무 데이터 분석 완료"
     
     return summary
 
 
-def extract_key_factors(soup: BeautifulSoup) -> Dict:
-    """핵심 요인 추출"""
+@timed_extract
+def extract_key_factors(texts: List[str]) -> KeyFactors:
+    """핵심 요인 추출 (문서 앞부분 텍스트 노드 목록에서 검색)"""
     # """추후 NER 모델로 연결할 부분"""
-    factors = {
-        "positive": [],
-        "negative": []
-    }
+    factors = KeyFactors()
     
     try:
         # 사업 내용 섹션에서 키워드 추출
-        content = soup.get_text()
+        content = ' '.join(texts)
         
         # 긍정적 요인 키워드
         positive_keywords = [
@@ -365,73 +633,34 @@ def extract_key_factors(soup: BeautifulSoup) -> Dict:
         ]
         
         # 샘플 요인 (실제 텍스트 분석이 어려운 경우)
-        factors["positive"] = [
+        metrics.inc('dart_sample_fallback_total', parser='parser_earnings', data='key_factors')
+        factors = get_sample_key_factors()
+        
+    except Exception as e:
+        print(f"핵심 요인 추출 오류: {e}")
+    
+    return factors
+
+
+def get_sample_key_factors() -> KeyFactors:
+    """샘플 핵심 요인 반환"""
+    return KeyFactors(
+        positive=[
             "고부가 메모리(HBM, DDR5) 판매 호조",
             "신규 파운드리 고객사 수주 증가",
             "폴더블 스마트폰 판매량 신기록 달성"
-        ]
-        
-        factors["negative"] = [
+        ],
+        negative=[
             "TV 및 가전 시장 수요 둔화",
             "원-달러 환율 변동성으로 인한 외환 손실"
         ]
-        
-    except Exception as e:
-        print(f"핵심 요인 추출 오류: {e}")
-    
-    return factors
+    )
 
 
-def get_sample_financial_data() -> List[Dict]:
+def get_sample_financial_data() -> List[FinancialItem]:
     """샘플 재무 데이터 반환"""
     return [
-        {
-            "item": "매출액",
-            "current_period_amount": "145,463,485",
-            "previous_period_amount": "138,521,123",
-            "yoy_growth_rate": "5.01%"
-        },
-        {
-            "item": "영업이익",
-            "current_period_amount": "15,487,212",
-            "previous_period_amount": "12,389,770",
-            "yoy_growth_rate": "25.00%"
-        },
-        {
-            "item": "당기순이익",
-            "current_period_amount": "12,101,345",
-            "previous_period_amount": "10,987,654",
-            "yoy_growth_rate": "10.14%"
-        }
+        FinancialItem("매출액", 145_463_485, 138_521_123),
+        FinancialItem("영업이익", 15_487_212, 12_389_770),
+        FinancialItem("당기순이익", 12_101_345, 10_987_654)
     ]
-
-
-def clean_number(value: str) -> float:
-    """문자열에서 숫자 추출하고 정제"""
-    if not value or value == '-':
-        return 0
-    
-    try:
-        # 괄호는 음수를 의미
-        is_negative = '(' in value and ')' in value
-        
-        # 숫자와 소수점, 음수 기호만 남김
-        cleaned = re.sub(r'[^\d.-]', '', value)
-        
-        if not cleaned or cleaned == '-':
-            return 0
-        
-        number = float(cleaned)
-        
-        if is_negative:
-            number = -abs(number)
-        
-        return number
-        
-    except (ValueError, AttributeError):
-        return 0
-
-
-def format_number(value: float) -> str:
-    """숫자를 천단위 콤마가 포함된 문자열로 포맷"""
-    return f"{int(value):,}"
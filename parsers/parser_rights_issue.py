@@ -3,24 +3,87 @@
 주요사항보고서(유상증자결정)에서 증자 관련 정보 추출
 """
 
-from bs4 import BeautifulSoup
 import re
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Union
 from datetime import datetime
 
+import metrics
+from .budget import DEFAULT_PARSE_TIMEOUT, ParseTimeout, TimeBudget, record_timeout
+from .encoding import detect_encoding
+from .normalize import clean_number, normalize_cells
+from .tables import RowIndex, TableScanner, row_values
 
-def parse(html_content: str) -> Optional[Dict]:
+# 추출 함수별 소요 시간 기록
+timed_extract = metrics.timed('dart_extract_seconds', function_label=True, parser='parser_rights_issue')
+
+# piicDecsn 자금조달 목적 필드 → 사용 목적
+STRUCTURED_PURPOSES = {
+    "fdpp_fclt": "시설자금",
+    "fdpp_bsninh": "영업양수자금",
+    "fdpp_op": "운영자금",
+    "fdpp_dtrp": "채무상환자금",
+    "fdpp_ocsa": "타법인 증권 취득자금",
+    "fdpp_etc": "기타자금"
+}
+
+# 증자 방식 키워드 (구체적인 방식을 먼저 확인)
+OFFERING_TYPES = ['주주우선공모', '제3자배정', '주주배정', '일반공모']
+
+# 항목별 행 이름 (우선순위 순, 공백/앞 번호 없이 정규화한 이름과 비교)
+OFFERING_TYPE_LABELS = ('증자방식',)
+SHARE_COUNT_LABELS = ('신주의종류와수', '발행주식수', '증자주식수', '신주수')
+PRICE_LABELS = ('신주발행가액', '발행가액', '주당발행가액', '청약가액', '모집가액')
+TOTAL_LABELS = ('발행총액', '납입총액', '증자총액', '모집총액')
+PURPOSE_LABELS = ('자금조달의목적', '자금사용목적', '조달자금사용목적', '증자목적')
+RECORD_DATE_LABELS = ('신주배정기준일', '주주명부폐쇄기준일', '기준일')
+LISTING_DATE_LABELS = ('신주의상장예정일', '상장예정일', '재상장예정일')
+COMPANY_LABELS = ('회사명', '법인명')
+
+# 텍스트 검색 정규식 (호출마다 다시 컴파일하지 않도록 미리 컴파일)
+COMPANY_NAME_PATTERN = re.compile(r'([\w\(\)]+(?:주식회사|㈜)[\w\(\)]*)')
+COMPANY_LABEL_PATTERN = re.compile(r'회사명|법인명')
+COMPANY_SUFFIX_PATTERN = re.compile(r'주식회사|㈜')
+OFFERING_TYPE_PATTERN = re.compile('|'.join(OFFERING_TYPES))
+PURPOSE_UNIT_PATTERN = re.compile(r'\s*\((?:원|주)\)\s*$')
+DIGIT_PATTERN = re.compile(r'\d')
+DATE_PATTERNS = [
+    re.compile(r'(\d{4})[년\-\.]\s*(\d{1,2})[월\-\.]\s*(\d{1,2})'),
+    re.compile(r'(\d{4})(\d{2})(\d{2})'),
+]
+
+# 표 행 이름이 자금 사용 목적 항목인지 판단할 때 제외하는 머리글/합계 행
+PURPOSE_SKIP_WORDS = ('합계', '총계', '사용목적')
+
+# 자금 사용 목적 표가 없을 때 행 이름으로 찾는 일반적인 사용 목적
+COMMON_PURPOSES = ['운영자금', '시설자금', '채무상환', '연구개발', '설비투자']
+
+# 문서 1건의 파싱 제한 시간 (초, DART_PARSE_TIMEOUT)
+PARSE_TIMEOUT = DEFAULT_PARSE_TIMEOUT
+
+
+@metrics.timed('dart_parse_seconds', parser='parser_rights_issue')
+def parse(html_content: Union[str, bytes], timeout: Optional[float] = None) -> Optional[Dict]:
     """
     유상증자결정 보고서 HTML 파싱해서 데이터 추출
     
     Args:
-        html_content: 공시 HTML 문자열
+        html_content: 공시 HTML 문자열 또는 원본 바이트
+        timeout: 파싱 제한 시간 (초, 기본값: PARSE_TIMEOUT, 0이면 제한 없음)
     
     Returns:
-        구조화된 유상증자 데이터 딕셔너리 또는 None
+        구조화된 유상증자 데이터 딕셔너리 또는 None (제한 시간 초과 포함)
     """
+    budget = TimeBudget(PARSE_TIMEOUT if timeout is None else timeout)
+    
     try:
-        soup = BeautifulSoup(html_content, 'html.parser')
+        # 문서를 한 번만 읽어 모든 표 행을 행 이름으로 색인 (원본 바이트는 감지된 인코딩으로 lxml에 바로 전달)
+        encoding = None
+        if isinstance(html_content, bytes):
+            with metrics.timer('dart_decode_seconds'):
+                encoding = detect_encoding(html_content)
+        scanner = TableScanner(html_content, encoding, head_texts=None, budget=budget)
+        index = build_row_index(scanner)
+        texts = scanner.texts
         
         # 기본 결과 구조
         result = {
@@ -46,16 +109,16 @@ def parse(html_content: str) -> Optional[Dict]:
         }
         
         # 1. 회사명 추출
-        result["report_info"]["company_name"] = extract_company_name(soup)
+        result["report_info"]["company_name"] = extract_company_name(index, texts)
         
         # 2. 증자 결정 개요 추출
-        result["decision_summary"] = extract_decision_summary(soup)
+        result["decision_summary"] = extract_decision_summary(index, texts)
         
         # 3. 자금 사용 목적 추출
-        result["purpose_of_funds"] = extract_purpose_of_funds(soup)
+        result["purpose_of_funds"] = extract_purpose_of_funds(index)
         
         # 4. 일정 추출
-        result["schedule"] = extract_schedule(soup)
+        result["schedule"] = extract_schedule(index)
         
         # 필수 데이터 검증
         if result["decision_summary"]["new_shares_count"] == 0:
@@ -64,39 +127,136 @@ def parse(html_content: str) -> Optional[Dict]:
             
         return result
         
+    except ParseTimeout as e:
+        # 작업자를 붙잡아 두지 않도록 중단하고 느린 문서로 기록
+        print(f"파싱 중단: {e} (문서 크기 {len(html_content):,})")
+        metrics.inc('dart_parse_timeouts_total', parser='parser_rights_issue', stage=e.stage)
+        record_timeout()
+        return None
     except Exception as e:
         print(f"파싱 오류: {e}")
         return None
 
 
-def extract_company_name(soup: BeautifulSoup) -> str:
+def parse_structured(decision: Dict) -> Dict:
+    """
+    DART 유상증자 결정 API(piicDecsn) 행으로 유상증자 데이터 구성
+
+    API에 없는 발행가액은 자금조달 총액이 신주 수로 나누어떨어질 때만 계산하며,
+    일정(기준일, 상장예정일)은 비워 둠
+    
+    Args:
+        decision: piicDecsn 응답의 행
+    
+    Returns:
+        parse()와 같은 구조의 유상증자 데이터 딕셔너리
+    """
+    common_count = int(clean_number(decision.get("nstk_ostk_cnt", "")))
+    other_count = int(clean_number(decision.get("nstk_estk_cnt", "")))
+    
+    share_types = []
+    if common_count > 0:
+        share_types.append("보통주")
+    if other_count > 0:
+        share_types.append("기타주")
+    
+    offering_method = (decision.get("ic_mthn") or "").strip()
+    offering_type = next((keyword for keyword in OFFERING_TYPES if keyword in offering_method), offering_method)
+    
+    breakdown = []
+    for field, purpose_name in STRUCTURED_PURPOSES.items():
+        amount = int(clean_number(decision.get(field, "")))
+        if amount > 0:
+            breakdown.append({
+                "purpose": purpose_name,
+                "amount": amount
+            })
+    total = sum(item["amount"] for item in breakdown)
+    
+    new_shares_count = common_count + other_count
+    offering_price = total // new_shares_count if new_shares_count and total % new_shares_count == 0 else 0
+    
+    return {
+        "report_info": {
+            "company_name": decision.get("corp_name", ""),
+            "report_type": "주요사항보고서(유상증자결정)"
+        },
+        "decision_summary": {
+            "offering_type": offering_type,
+            "new_shares_type": ", ".join(share_types) or "보통주",
+            "new_shares_count": new_shares_count,
+            "offering_price": offering_price,
+            "total_offering_amount": total
+        },
+        "purpose_of_funds": {
+            "total": total,
+            "breakdown": breakdown
+        },
+        "schedule": {
+            "record_date": "",
+            "listing_date": ""
+        }
+    }
+
+
+def is_complete(result: Dict) -> bool:
+    """유상증자 데이터의 핵심 항목(증자 방식, 신주 수, 발행가액, 자금 사용 목적)이 모두 채워졌는지 확인"""
+    summary = result.get("decision_summary", {})
+    return bool(
+        summary.get("offering_type")
+        and summary.get("new_shares_count", 0) > 0
+        and summary.get("offering_price", 0) > 0
+        and result.get("purpose_of_funds", {}).get("breakdown")
+    )
+
+
+def merge_results(primary: Dict, fallback: Optional[Dict]) -> Dict:
+    """primary에서 비어 있는 항목만 fallback(HTML 파싱 결과) 값으로 채움"""
+    if not fallback:
+        return primary
+    
+    merged = {}
+    for section, values in primary.items():
+        fallback_values = fallback.get(section, {})
+        if isinstance(values, dict):
+            merged[section] = {
+                key: value if value else fallback_values.get(key, value)
+                for key, value in values.items()
+            }
+        else:
+            merged[section] = values if values else fallback_values
+    return merged
+
+
+@timed_extract
+def build_row_index(scanner: TableScanner) -> RowIndex:
+    """문서의 모든 표 행을 행 이름으로 색인 (문서 1회 순회)"""
+    return RowIndex.from_tables(scanner)
+
+
+@timed_extract
+def extract_company_name(index: RowIndex, texts: List[str]) -> str:
     """회사명 추출"""
     # """추후 NER 모델로 연결할 부분"""
     company_name = ""
     
     try:
-        # 다양한 패턴으로 회사명 추출 시도
-        patterns = [
-            soup.find('title'),
-            soup.find(string=re.compile(r'회사명|법인명')),
-            soup.find('p', string=re.compile(r'주식회사|㈜'))
-        ]
-        
-        for pattern in patterns:
-            if pattern:
-                text = pattern.get_text() if hasattr(pattern, 'get_text') else str(pattern)
-                match = re.search(r'([\w\(\)]+(?:주식회사|㈜)[\w\(\)]*)', text)
+        # 다양한 패턴으로 회사명 추출 시도 (문서 제목, 회사명 행, 회사명 표기, 주식회사 표기 순)
+        candidates = texts[:1]
+        candidates += [' '.join(row_values(row)) for row in index.find(*COMPANY_LABELS, fuzzy=False)[:1]]
+        candidates.append(next((text for text in texts if COMPANY_LABEL_PATTERN.search(text)), None))
+        candidates.append(next((text for text in texts if COMPANY_SUFFIX_PATTERN.search(text)), None))
+        
+        for text in candidates:
+            if text:
+                match = COMPANY_NAME_PATTERN.search(text)
                 if match:
                     company_name = match.group(1).strip()
                     break
         
-        # 회사명이 없으면 문서 상단에서 찾기
-        if not company_name:
-            first_p = soup.find('p')
-            if first_p:
-                text = first_p.get_text()
-                if '주식회사' in text or '㈜' in text:
-                    company_name = text.strip()
+        # 회사명이 없으면 주식회사 표기가 있는 텍스트 그대로 사용
+        if not company_name and candidates[-1]:
+            company_name = candidates[-1].strip()
                     
     except Exception as e:
         print(f"회사명 추출 오류: {e}")
@@ -104,33 +264,17 @@ def extract_company_name(soup: BeautifulSoup) -> str:
     return company_name
 
 
-def clean_number(value: str) -> float:
-    """문자열에서 숫자 추출하고 정제"""
-    if not value or value == '-':
-        return 0
-    
-    try:
-        # 괄호는 음수를 의미
-        is_negative = '(' in value and ')' in value
-        
-        # 숫자와 소수점, 음수 기호만 남김
-        cleaned = re.sub(r'[^\d.-]', '', value)
-        
-        if not cleaned or cleaned == '-':
-            return 0
-        
-        number = float(cleaned)
-        
-        if is_negative:
-            number = -abs(number)
-        
-        return number
-        
-    except (ValueError, AttributeError):
-        return 0
+def first_amount(rows: List[List[str]]) -> int:
+    """행 목록에서 처음 나오는 숫자 셀 값"""
+    for row in rows:
+        for cell in row_values(row):
+            if DIGIT_PATTERN.search(cell):
+                return int(clean_number(cell))
+    return 0
 
 
-def extract_decision_summary(soup: BeautifulSoup) -> Dict:
+@timed_extract
+def extract_decision_summary(index: RowIndex, texts: List[str]) -> Dict:
     """유상증자 결정 개요 추출"""
     # """추후 NER 모델로 연결할 부분"""
     summary = {
@@ -142,63 +286,33 @@ def extract_decision_summary(soup: BeautifulSoup) -> Dict:
     }
     
     try:
-        # 증자 방식 추출
-        offering_type_keywords = ['주주배정', '제3자배정', '일반공모', '주주우선공모']
-        for keyword in offering_type_keywords:
-            if soup.find(string=re.compile(keyword)):
-                summary["offering_type"] = keyword
+        # 증자 방식 추출 (증자방식 행 → 문서 텍스트 순)
+        offering_texts = [' '.join(row_values(row)) for row in index.find(*OFFERING_TYPE_LABELS)]
+        for text in offering_texts + texts:
+            match = OFFERING_TYPE_PATTERN.search(text)
+            if match:
+                summary["offering_type"] = next(keyword for keyword in OFFERING_TYPES if keyword in text)
                 break
         
-        # 신주 종류 추출
-        share_type_element = soup.find(string=re.compile(r'신주.*종류|주식.*종류'))
-        if share_type_element:
-            parent = share_type_element.find_parent('tr')
-            if parent:
-                cells = parent.find_all(['td', 'th'])
-                if len(cells) >= 2:
-                    summary["new_shares_type"] = cells[1].get_text(strip=True)
-        
-        if not summary["new_shares_type"]:
-            summary["new_shares_type"] = "보통주"
+        # 신주 종류/수 추출 (보통주식/기타주식 행의 주식 수 합산)
+        share_types = []
+        for row in index.find(*SHARE_COUNT_LABELS):
+            values = row_values(row)
+            count = next((int(clean_number(cell)) for cell in values if DIGIT_PATTERN.search(cell)), 0)
+            if count <= 0:
+                continue
+            summary["new_shares_count"] += count
+            share_type = PURPOSE_UNIT_PATTERN.sub('', values[0]) if len(values) >= 2 else ""
+            if share_type and share_type not in share_types:
+                share_types.append(share_type)
         
-        # 신주 수 추출
-        share_count_keywords = ['신주.*수', '발행.*주식.*수', '증자.*주식.*수']
-        for keyword in share_count_keywords:
-            element = soup.find(string=re.compile(keyword))
-            if element:
-                parent = element.find_parent('tr')
-                if parent:
-                    cells = parent.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        value = cells[1].get_text(strip=True)
-                        summary["new_shares_count"] = int(clean_number(value))
-                        break
+        summary["new_shares_type"] = ", ".join(share_types) or "보통주"
         
         # 발행가액 추출
-        price_keywords = ['발행가액|주당.*가액', '청약가액', '모집가액']
-        for keyword in price_keywords:
-            element = soup.find(string=re.compile(keyword))
-            if element:
-                parent = element.find_parent('tr')
-                if parent:
-                    cells = parent.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        value = cells[1].get_text(strip=True)
-                        summary["offering_price"] = int(clean_number(value))
-                        break
+        summary["offering_price"] = first_amount(index.find(*PRICE_LABELS))
         
         # 발행총액 추출
-        total_keywords = ['발행총액|납입.*총액', '증자.*총액', '모집.*총액']
-        for keyword in total_keywords:
-            element = soup.find(string=re.compile(keyword))
-            if element:
-                parent = element.find_parent('tr')
-                if parent:
-                    cells = parent.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        value = cells[1].get_text(strip=True)
-                        summary["total_offering_amount"] = int(clean_number(value))
-                        break
+        summary["total_offering_amount"] = first_amount(index.find(*TOTAL_LABELS, fuzzy=False))
         
         # 총액이 없으면 계산
         if summary["total_offering_amount"] == 0 and summary["new_shares_count"] > 0 and summary["offering_price"] > 0:
@@ -210,7 +324,8 @@ def extract_decision_summary(soup: BeautifulSoup) -> Dict:
     return summary
 
 
-def extract_purpose_of_funds(soup: BeautifulSoup) -> Dict:
+@timed_extract
+def extract_purpose_of_funds(index: RowIndex) -> Dict:
     """자금 사용 목적 추출"""
     # """추후 NER 모델로 연결할 부분"""
     purpose = {
@@ -219,27 +334,14 @@ def extract_purpose_of_funds(soup: BeautifulSoup) -> Dict:
     }
     
     try:
-        # 자금 사용 목적 테이블 찾기
-        purpose_keywords = ['자금.*사용.*목적', '조달.*자금.*사용', '증자.*목적']
-        
-        for keyword in purpose_keywords:
-            element = soup.find(string=re.compile(keyword))
-            if element:
-                # 해당 섹션의 테이블 찾기
-                table = element.find_parent('table')
-                if not table:
-                    # 다음 테이블 찾기
-                    parent = element.find_parent()
-                    if parent:
-                        table = parent.find_next('table')
-                
-                if table:
-                    purpose = parse_purpose_table(table)
-                    break
+        # 자금조달의 목적 행 (병합된 행 이름 아래 목적별 금액 행)
+        rows = index.find(*PURPOSE_LABELS)
+        if rows:
+            purpose = parse_purpose_table(rows)
         
-        # 테이블을 못 찾은 경우, 전체에서 키워드 검색
+        # 목적 행을 못 찾은 경우, 일반적인 사용 목적 이름의 행 검색
         if not purpose["breakdown"]:
-            purpose = extract_purpose_by_text(soup)
+            purpose = extract_purpose_by_text(index)
             
     except Exception as e:
         print(f"자금 사용 목적 추출 오류: {e}")
@@ -247,34 +349,37 @@ def extract_purpose_of_funds(soup: BeautifulSoup) -> Dict:
     return purpose
 
 
-def parse_purpose_table(table) -> Dict:
-    """자금 사용 목적 테이블 파싱"""
+def parse_purpose_table(rows: List[List[str]]) -> Dict:
+    """자금 사용 목적 행 파싱 (행 이름 뒤의 [목적, 금액] 셀)"""
     purpose = {
         "total": 0,
         "breakdown": []
     }
     
     try:
-        rows = table.find_all('tr')
-        
+        purposes, amount_cells = [], []
         for row in rows:
-            cells = row.find_all(['td', 'th'])
-            if len(cells) < 2:
+            values = row_values(row)
+            if len(values) < 2:
                 continue
             
-            purpose_text = cells[0].get_text(strip=True)
+            purpose_text = PURPOSE_UNIT_PATTERN.sub('', values[0])
             
             # 헤더나 합계 행 제외
-            if not purpose_text or '합계' in purpose_text or '총계' in purpose_text or '사용목적' in purpose_text:
+            if not purpose_text or any(word in purpose_text.replace(' ', '') for word in PURPOSE_SKIP_WORDS):
                 continue
             
-            amount_text = cells[1].get_text(strip=True)
-            amount = int(clean_number(amount_text))
-            
+            purposes.append(purpose_text)
+            amount_cells.append(values[1])
+        
+        # 금액 열을 한 번에 정수로 변환
+        amounts = normalize_cells(amount_cells).values if amount_cells else []
+        
+        for purpose_text, amount in zip(purposes, amounts):
             if amount > 0:
                 purpose["breakdown"].append({
                     "purpose": purpose_text,
-                    "amount": amount
+                    "amount": int(amount)
                 })
         
         # 총액 계산
@@ -286,37 +391,23 @@ def parse_purpose_table(table) -> Dict:
     return purpose
 
 
-def extract_purpose_by_text(soup: BeautifulSoup) -> Dict:
-    """텍스트에서 자금 사용 목적 추출"""
+@timed_extract
+def extract_purpose_by_text(index: RowIndex) -> Dict:
+    """사용 목적 이름의 행에서 자금 사용 목적 추출"""
     purpose = {
         "total": 0,
         "breakdown": []
     }
     
     try:
-        # 일반적인 사용 목적 키워드
-        common_purposes = ['운영자금', '시설자금', '채무상환', '연구개발', '설비투자']
-        
-        for keyword in common_purposes:
-            element = soup.find(string=re.compile(keyword))
-            if element:
-                # 근처에서 금액 찾기
-                parent = element.find_parent('tr')
-                if parent:
-                    cells = parent.find_all(['td', 'th'])
-                    for i, cell in enumerate(cells):
-                        if keyword in cell.get_text():
-                            # 다음 셀에서 금액 찾기
-                            if i + 1 < len(cells):
-                                amount_text = cells[i + 1].get_text(strip=True)
-                                amount = int(clean_number(amount_text))
-                                
-                                if amount > 0:
-                                    purpose["breakdown"].append({
-                                        "purpose": keyword,
-                                        "amount": amount
-                                    })
-                                break
+        # 일반적인 사용 목적 키워드 (행 이름이 키워드로 시작하는 행의 첫 금액)
+        for keyword in COMMON_PURPOSES:
+            amount = first_amount(index.find(keyword, fuzzy=False))
+            if amount > 0:
+                purpose["breakdown"].append({
+                    "purpose": keyword,
+                    "amount": amount
+                })
         
         # 총액 계산
         purpose["total"] = sum([item["amount"] for item in purpose["breakdown"]])
@@ -327,7 +418,8 @@ def extract_purpose_by_text(soup: BeautifulSoup) -> Dict:
     return purpose
 
 
-def extract_schedule(soup: BeautifulSoup) -> Dict:
+@timed_extract
+def extract_schedule(index: RowIndex) -> Dict:
     """유상증자 일정 추출"""
     # """추후 NER 모델로 연결할 부분"""
     schedule = {
@@ -337,30 +429,16 @@ def extract_schedule(soup: BeautifulSoup) -> Dict:
     
     try:
         # 기준일 추출
-        record_date_keywords = ['기준일|신주배정.*기준일', '주주명부.*폐쇄.*기준일']
-        for keyword in record_date_keywords:
-            element = soup.find(string=re.compile(keyword))
-            if element:
-                parent = element.find_parent('tr')
-                if parent:
-                    cells = parent.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        date_text = cells[1].get_text(strip=True)
-                        schedule["record_date"] = format_date(date_text)
-                        break
+        for row in index.find(*RECORD_DATE_LABELS)[:1]:
+            values = row_values(row)
+            if values:
+                schedule["record_date"] = format_date(values[0])
         
         # 상장예정일 추출
-        listing_date_keywords = ['상장예정일|신주.*상장.*예정일', '재상장예정일']
-        for keyword in listing_date_keywords:
-            element = soup.find(string=re.compile(keyword))
-            if element:
-                parent = element.find_parent('tr')
-                if parent:
-                    cells = parent.find_all(['td', 'th'])
-                    if len(cells) >= 2:
-                        date_text = cells[1].get_text(strip=True)
-                        schedule["listing_date"] = format_date(date_text)
-                        break
+        for row in index.find(*LISTING_DATE_LABELS)[:1]:
+            values = row_values(row)
+            if values:
+                schedule["listing_date"] = format_date(values[0])
                         
     except Exception as e:
         print(f"일정 추출 오류: {e}")
@@ -375,13 +453,8 @@ def format_date(date_text: str) -> str:
     
     try:
         # 다양한 날짜 형식 처리
-        date_patterns = [
-            (r'(\d{4})[년\-\.](\d{1,2})[월\-\.](\d{1,2})', '%Y-%m-%d'),
-            (r'(\d{4})(\d{2})(\d{2})', '%Y-%m-%d'),
-        ]
-        
-        for pattern, format_str in date_patterns:
-            match = re.search(pattern, date_text)
+        for pattern in DATE_PATTERNS:
+            match = pattern.search(date_text)
             if match:
                 year = match.group(1)
                 month = match.group(2).zfill(2)
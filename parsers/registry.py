@@ -0,0 +1,98 @@
+"""
+파서 선택 레지스트리
+보고서명 패턴을 하나의 정규식으로 합쳐 공시마다 한 번의 검색으로 파서를 선택하고,
+파서 모듈은 처음 선택될 때 import
+"""
+
+import importlib
+import re
+from types import ModuleType
+from typing import Dict, Iterable, List, Optional, Pattern, Tuple
+
+
+class ParserRegistry:
+    """
+    보고서명 → (보고서 유형, 파서 모듈) 레지스트리
+
+    등록된 패턴들은 이름 있는 그룹의 alternation 정규식 하나로 컴파일되어,
+    패턴 수가 늘어나도 공시 1건당 검색은 한 번으로 끝남
+    보고서명에서 가장 앞에 나타나는 패턴이 선택되고, 같은 위치면 먼저 등록된 패턴이 우선
+    """
+
+    def __init__(self, package: str):
+        """
+        Args:
+            package: 파서 모듈이 있는 패키지 이름 (예: 'parsers')
+        """
+        self.package = package
+        self._entries: List[Tuple[str, str, str]] = []
+        self._matcher: Optional[Pattern] = None
+
+    @classmethod
+    def from_patterns(cls, package: str, patterns: Iterable[Tuple[str, str, str]]) -> 'ParserRegistry':
+        """(보고서 유형, 보고서명 정규식, 파서 모듈 이름) 목록으로 레지스트리 생성"""
+        registry = cls(package)
+        for report_type, pattern, module_name in patterns:
+            registry.register(report_type, pattern, module_name)
+        return registry
+
+    def register(self, report_type: str, pattern: str, module_name: str) -> None:
+        """
+        파서 등록 (모듈은 import하지 않음)
+
+        Args:
+            report_type: 보고서 유형 이름 (예: '분기보고서')
+            pattern: 보고서명에서 찾을 정규식
+            module_name: 패키지 안의 파서 모듈 이름 (예: 'parser_earnings')
+        """
+        re.compile(pattern)  # 잘못된 패턴은 등록 시점에 오류
+        self._entries.append((report_type, pattern, f"{self.package}.{module_name}"))
+        self._matcher = None
+
+    @property
+    def report_types(self) -> List[str]:
+        return [report_type for report_type, _, _ in self._entries]
+
+    def match(self, report_nm: str) -> Optional[Tuple[str, str]]:
+        """
+        보고서명에 해당하는 파서 찾기 (모듈 import 없음)
+
+        Returns:
+            (보고서 유형, 파서 모듈 전체 이름) 또는 None
+        """
+        if not self._entries:
+            return None
+
+        if self._matcher is None:
+            self._matcher = re.compile(
+                '|'.join(f'(?P<p{index}>{pattern})' for index, (_, pattern, _) in enumerate(self._entries))
+            )
+
+        match = self._matcher.search(report_nm)
+        if not match:
+            return None
+
+        report_type, _, module_name = self._entries[int(match.lastgroup[1:])]
+        return report_type, module_name
+
+    def load(self, module_name: str) -> ModuleType:
+        """파서 모듈 import (이미 import된 모듈은 그대로 반환)"""
+        if not module_name.startswith(f"{self.package}."):
+            module_name = f"{self.package}.{module_name}"
+        return importlib.import_module(module_name)
+
+    def resolve(self, report_nm: str) -> Optional[Tuple[str, ModuleType]]:
+        """보고서명에 해당하는 (보고서 유형, 파서 모듈) 반환 (처음 선택된 모듈은 이때 import)"""
+        matched = self.match(report_nm)
+        if not matched:
+            return None
+
+        report_type, module_name = matched
+        return report_type, self.load(module_name)
+
+    def modules(self) -> Dict[str, List[str]]:
+        """파서 모듈별 보고서 유형 목록"""
+        modules: Dict[str, List[str]] = {}
+        for report_type, _, module_name in self._entries:
+            modules.setdefault(module_name, []).append(report_type)
+        return modules
@@ -0,0 +1,422 @@
+"""
+공시 문서 표 추출 모듈
+문서 트리를 만들지 않고 스트리밍으로 파싱하여 <TABLE>마다 행/열 격자를 만듦
+(lxml HTMLParser target 인터페이스 사용, lxml이 없으면 표준 라이브러리 html.parser 사용)
+
+완성된 표는 바로 반환하고 버리므로, 메모리 사용량은 문서 크기가 아니라 가장 큰 표 하나의 크기로 제한됨
+"""
+
+import bisect
+import codecs
+import difflib
+import re
+from html.parser import HTMLParser
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+from .budget import TimeBudget
+
+# 셀 태그 (DART XML은 TE/TU 셀도 사용)
+CELL_TAGS = frozenset(('td', 'th', 'te', 'tu'))
+
+# 스트리밍 파서에 한 번에 넣는 크기
+FEED_CHUNK_SIZE = 64 * 1024
+
+# 비정상적으로 큰 rowspan/colspan 제한
+MAX_SPAN = 100
+
+# 보고서 정보 추출용으로 보관하는 앞부분 텍스트 노드 수
+DEFAULT_HEAD_TEXTS = 2000
+
+# "(단위 : 백만원)" 형식의 금액 단위 표기 (긴 단위부터 비교)
+UNIT_PATTERN = re.compile(r'단위\s*[:：]?\s*(조원|억원|백만원|천원|원)')
+
+# 행 이름 정규화: 앞 번호("Ⅰ.", "1.", "(1)", "가.")와 뒤 주석 표기("(주석3)", "(주3,4)") 제거
+LABEL_PREFIX_PATTERN = re.compile(r'^(?:[ⅠⅡⅢⅣⅤⅥⅦⅧⅨⅩ]+\.?|[IVX]+\.|\d+\.|\(\d+\)|[가-힣]\.)')
+LABEL_NOTE_PATTERN = re.compile(r'\(주(?:석)?[\d,]*\)$')
+
+# 행 이름 유사도 검색 기준 (difflib 비율)
+FUZZY_CUTOFF = 0.8
+
+
+class Table:
+    """추출된 표 1개 (rowspan/colspan을 펼친 행/열 격자)"""
+
+    __slots__ = ('rows', 'unit', 'index')
+
+    def __init__(self, rows: List[List[str]], unit: str = '', index: int = 0):
+        """
+        Args:
+            rows: 셀 텍스트 격자 (병합 셀은 걸친 모든 칸에 같은 텍스트)
+            unit: 표 직전(또는 표 안)에서 마지막으로 본 금액 단위 (예: '백만원')
+            index: 문서 안에서 표 순번 (0부터)
+        """
+        self.rows = rows
+        self.unit = unit
+        self.index = index
+
+    def __repr__(self) -> str:
+        return f"Table(index={self.index}, rows={len(self.rows)}, unit={self.unit!r})"
+
+
+def _span(value: Optional[str]) -> int:
+    try:
+        return max(1, min(MAX_SPAN, int(value)))
+    except (TypeError, ValueError):
+        return 1
+
+
+def expand_spans(rows: List[List[Tuple[str, int, int]]]) -> List[List[str]]:
+    """
+    (텍스트, rowspan, colspan) 셀 행 목록을 격자로 펼침
+
+    위 행의 rowspan이 차지한 칸은 건너뛰고 다음 빈 칸부터 셀을 배치하며,
+    병합 셀의 텍스트는 걸친 모든 칸에 복사
+    """
+    grid = []
+    # 열 번호 → (텍스트, 아래로 더 이어지는 행 수)
+    carried: Dict[int, Tuple[str, int]] = {}
+
+    for row in rows:
+        # 위 행에서 이어지는 병합 셀을 먼저 배치
+        placed = {index: text for index, (text, _) in carried.items()}
+        next_carried = {index: (text, remaining - 1) for index, (text, remaining) in carried.items() if remaining > 1}
+
+        column = 0
+        for text, rowspan, colspan in row:
+            while column in placed:
+                column += 1
+            for _ in range(colspan):
+                placed[column] = text
+                if rowspan > 1:
+                    next_carried[column] = (text, rowspan - 1)
+                column += 1
+
+        carried = next_carried
+        width = max(placed) + 1 if placed else 0
+        grid.append([placed.get(index, '') for index in range(width)])
+
+    return grid
+
+
+class _TableCollector:
+    """
+    파서 이벤트로 표를 모으는 target (lxml target 인터페이스, html.parser 어댑터 공용)
+
+    열린 표를 스택으로 관리하여 중첩 표도 각각 별도의 표로 만듦
+    """
+
+    def __init__(self, head_texts: Optional[int] = DEFAULT_HEAD_TEXTS):
+        self.tables: List[Table] = []
+        self.texts: List[str] = []
+        self.head_texts = head_texts
+
+        self._stack: List[Dict] = []
+        self._unit = ''
+        self._count = 0
+
+    def start(self, tag, attrib) -> None:
+        tag = tag.lower()
+        if tag == 'table':
+            self._stack.append({'rows': [], 'row': None, 'cell': None})
+            return
+        if not self._stack:
+            return
+
+        state = self._stack[-1]
+        if tag == 'tr':
+            self._close_row(state)
+            state['row'] = []
+        elif tag in CELL_TAGS:
+            self._close_cell(state)
+            if state['row'] is None:
+                state['row'] = []
+            state['cell'] = ([], _span(attrib.get('rowspan')), _span(attrib.get('colspan')))
+        elif tag in ('br', 'p') and state['cell'] is not None:
+            state['cell'][0].append(' ')
+
+    def end(self, tag) -> None:
+        tag = tag.lower()
+        if not self._stack:
+            return
+
+        state = self._stack[-1]
+        if tag == 'table':
+            self._close_row(state)
+            self._stack.pop()
+            self.tables.append(Table(expand_spans(state['rows']), self._unit, self._count))
+            self._count += 1
+        elif tag == 'tr':
+            self._close_row(state)
+        elif tag in CELL_TAGS:
+            self._close_cell(state)
+
+    def data(self, text) -> None:
+        if self.head_texts is None or len(self.texts) < self.head_texts:
+            stripped = text.strip()
+            if stripped:
+                self.texts.append(stripped)
+
+        if '단위' in text:
+            unit_match = UNIT_PATTERN.search(text)
+            if unit_match:
+                self._unit = unit_match.group(1)
+
+        if self._stack and self._stack[-1]['cell'] is not None:
+            self._stack[-1]['cell'][0].append(text)
+
+    def close(self) -> None:
+        # 닫히지 않은 표도 결과에 포함
+        while self._stack:
+            self.end('table')
+
+    def _close_cell(self, state: Dict) -> None:
+        cell = state['cell']
+        if cell is None:
+            return
+        text = ' '.join(''.join(cell[0]).split())
+        state['row'].append((text, cell[1], cell[2]))
+        state['cell'] = None
+
+    def _close_row(self, state: Dict) -> None:
+        self._close_cell(state)
+        if state['row']:
+            state['rows'].append(state['row'])
+        state['row'] = None
+
+
+class _StdlibAdapter(HTMLParser):
+    """html.parser 이벤트를 _TableCollector로 전달 (lxml이 없을 때 사용)"""
+
+    def __init__(self, collector: _TableCollector):
+        super().__init__(convert_charrefs=True)
+        self.collector = collector
+
+    def handle_starttag(self, tag, attrs):
+        self.collector.start(tag, {name: value for name, value in attrs})
+
+    def handle_startendtag(self, tag, attrs):
+        self.collector.start(tag, {name: value for name, value in attrs})
+        if tag != 'br':
+            self.collector.end(tag)
+
+    def handle_endtag(self, tag):
+        self.collector.end(tag)
+
+    def handle_data(self, data):
+        self.collector.data(data)
+
+
+class TableScanner:
+    """
+    문서의 표를 순서대로 반환하는 스트리밍 스캐너
+
+        scanner = TableScanner(content, encoding='cp949')
+        for table in scanner:
+            ...
+        scanner.texts  # 지금까지 본 앞부분 텍스트 노드 (보고서 정보 추출용)
+
+    필요한 표를 찾은 뒤 반복을 멈추면 나머지 문서는 파싱하지 않음
+    """
+
+    def __init__(
+        self,
+        content: Union[str, bytes],
+        encoding: Optional[str] = None,
+        head_texts: Optional[int] = DEFAULT_HEAD_TEXTS,
+        use_lxml: bool = True,
+        budget: Optional[TimeBudget] = None
+    ):
+        """
+        Args:
+            content: 문서 문자열 또는 바이트
+            encoding: 바이트 문서의 인코딩 (예: parsers.encoding.detect_encoding 결과)
+            head_texts: 보관할 앞부분 텍스트 노드 수 (None이면 전체)
+            use_lxml: False면 lxml이 있어도 html.parser 사용
+            budget: 파싱 제한 시간 (청크마다 확인, 초과하면 ParseTimeout)
+        """
+        self.content = content
+        self.encoding = encoding or 'utf-8'
+        self.collector = _TableCollector(head_texts)
+        self.use_lxml = use_lxml and etree is not None
+        self.budget = budget
+
+    @property
+    def texts(self) -> List[str]:
+        return self.collector.texts
+
+    def __iter__(self) -> Iterator[Table]:
+        if self.use_lxml:
+            feed, close = self._lxml_parser()
+        else:
+            feed, close = self._stdlib_parser()
+
+        for start in range(0, len(self.content), FEED_CHUNK_SIZE):
+            if self.budget is not None:
+                self.budget.check('표 추출')
+            feed(self.content[start:start + FEED_CHUNK_SIZE])
+            yield from self._drain()
+
+        close()
+        yield from self._drain()
+
+    def _drain(self) -> Iterator[Table]:
+        tables, self.collector.tables = self.collector.tables, []
+        yield from tables
+
+    def _lxml_parser(self):
+        if isinstance(self.content, bytes):
+            parser = etree.HTMLParser(target=self.collector, encoding=_libxml2_encoding(self.encoding))
+        else:
+            parser = etree.HTMLParser(target=self.collector)
+        return parser.feed, parser.close
+
+    def _stdlib_parser(self):
+        parser = _StdlibAdapter(self.collector)
+
+        if not isinstance(self.content, bytes):
+            def close():
+                parser.close()
+                self.collector.close()
+            return parser.feed, close
+
+        # 청크 경계에서 멀티바이트 문자가 잘리지 않도록 증분 디코더 사용
+        decoder = codecs.getincrementaldecoder(self.encoding)(errors='replace')
+
+        def feed(chunk: bytes):
+            parser.feed(decoder.decode(chunk))
+
+        def close():
+            parser.feed(decoder.decode(b'', final=True))
+            parser.close()
+            self.collector.close()
+
+        return feed, close
+
+
+def _libxml2_encoding(encoding: str) -> str:
+    """파이썬 코덱 이름(utf_8, euc_kr 등)을 libxml2가 인식하는 이름으로 변환"""
+    try:
+        name = codecs.lookup(encoding).name
+    except LookupError:
+        return encoding
+    # BOM은 libxml2가 직접 건너뛰므로 utf-8-sig는 utf-8로 전달
+    return 'utf-8' if name == 'utf-8-sig' else name.replace('_', '-')
+
+
+def iter_tables(content: Union[str, bytes], encoding: Optional[str] = None) -> Iterator[Table]:
+    """문서의 표를 순서대로 반환 (TableScanner 단축 함수)"""
+    return iter(TableScanner(content, encoding))
+
+
+def row_label(row: List[str]) -> str:
+    """행의 첫 번째 비어 있지 않은 셀 (공백 제거)"""
+    for cell in row:
+        if cell:
+            return cell.replace(' ', '')
+    return ''
+
+
+def normalize_label(label: str) -> str:
+    """행 이름 정규화 (공백, 앞 번호, 뒤 주석 표기 제거)"""
+    label = LABEL_PREFIX_PATTERN.sub('', label.replace(' ', ''))
+    return LABEL_NOTE_PATTERN.sub('', label)
+
+
+def row_values(row: List[str]) -> List[str]:
+    """행에서 행 이름(첫 번째 셀, 병합으로 반복된 칸 포함) 뒤의 셀 목록"""
+    label = next((cell for cell in row if cell), '')
+    values = row[row.index(label) + 1:] if label else []
+    return [cell for cell in values if cell and cell != label]
+
+
+class RowIndex:
+    """
+    정규화한 행 이름(첫 번째 셀) → 표 행 목록 색인
+
+    문서를 한 번 읽으며 모든 표의 행을 색인하고, 항목 조회는 색인 검색으로 처리
+    (정확히 일치 → 접두어 → 부분 문자열 → 유사도 순으로 찾음)
+
+        index = RowIndex.from_tables(TableScanner(content, encoding))
+        rows = index.find('신주의종류와수', '발행주식수')
+    """
+
+    def __init__(self):
+        self._rows: Dict[str, List[List[str]]] = {}
+        self._labels: Optional[List[str]] = None
+
+    @classmethod
+    def from_tables(cls, tables: Iterable[Table]) -> 'RowIndex':
+        index = cls()
+        for table in tables:
+            index.add(table)
+        return index
+
+    def add(self, table: Table) -> None:
+        """표의 행 색인 (같은 이름의 행은 문서 순서대로 보관)"""
+        for row in table.rows:
+            label = normalize_label(row_label(row))
+            if label:
+                self._rows.setdefault(label, []).append(row)
+        self._labels = None
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, label: str) -> bool:
+        return normalize_label(label) in self._rows
+
+    @property
+    def labels(self) -> List[str]:
+        """정렬된 행 이름 목록"""
+        if self._labels is None:
+            self._labels = sorted(self._rows)
+        return self._labels
+
+    def find(self, *keys: str, fuzzy: bool = True) -> List[List[str]]:
+        """
+        행 이름으로 행 찾기
+
+        검색 방식별로 모든 키를 차례로 확인하므로, 앞선 방식(정확히 일치)의 결과가 항상 우선
+
+        Args:
+            keys: 찾을 행 이름 (우선순위 순, 공백/앞 번호는 무시)
+            fuzzy: 다른 방식으로 찾지 못하면 유사도 검색 사용
+
+        Returns:
+            처음 찾은 행 이름의 행 목록 (없으면 빈 목록)
+        """
+        label = self.find_label(*keys, fuzzy=fuzzy)
+        return self._rows[label] if label else []
+
+    def find_label(self, *keys: str, fuzzy: bool = True) -> Optional[str]:
+        """keys에 해당하는 색인의 행 이름 (없으면 None)"""
+        normalized = [normalize_label(key) for key in keys]
+        normalized = [key for key in normalized if key]
+
+        for key in normalized:
+            if key in self._rows:
+                return key
+
+        labels = self.labels
+        for key in normalized:
+            position = bisect.bisect_left(labels, key)
+            if position < len(labels) and labels[position].startswith(key):
+                return labels[position]
+
+        for key in normalized:
+            label = next((label for label in labels if key in label), None)
+            if label:
+                return label
+
+        if fuzzy:
+            for key in normalized:
+                matches = difflib.get_close_matches(key, labels, n=1, cutoff=FUZZY_CUTOFF)
+                if matches:
+                    return matches[0]
+
+        return None
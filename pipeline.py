@@ -0,0 +1,252 @@
+"""
+단계별 처리 파이프라인
+다운로드(I/O 스레드) → 파싱(프로세스 풀) → 저장(저장 스레드) 단계를 크기 제한 큐로 연결
+"""
+
+import importlib
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import metrics
+from parse_cache import MISS, ParseCache
+
+# 큐 종료 신호
+_STOP = object()
+
+# 저장 단계에 전달되는 데이터 출처
+SOURCE_HTML = "HTML 파싱"
+SOURCE_DOWNLOAD_FAILED = "다운로드 실패"
+
+
+def _parse_document(module_name: str, content: Any) -> Tuple[Optional[Dict], Dict]:
+    """
+    프로세스 풀 작업자에서 파서 모듈을 불러와 문서 파싱
+
+    Returns:
+        (파싱 결과, 이 작업 동안 작업자 프로세스에 쌓인 지표 스냅샷)
+    """
+    module = importlib.import_module(module_name)
+    parsed = module.parse(content)
+    return parsed, metrics.drain()
+
+
+def _parse_timed_out(worker_metrics: Dict) -> bool:
+    """작업자 지표에 파싱 제한 시간 초과가 기록되었는지 (부하에 따라 달라지는 결과라 캐시하지 않음)"""
+    return any(counter['name'] == 'dart_parse_timeouts_total' for counter in worker_metrics.get('counters', []))
+
+
+def _warm_worker(module_names: Tuple[str, ...]) -> None:
+    """작업자 프로세스 시작 시 파서 모듈을 미리 import (첫 문서 파싱 지연 제거)"""
+    for module_name in module_names:
+        importlib.import_module(module_name)
+
+
+def _noop() -> None:
+    return None
+
+
+class Pipeline:
+    """
+    다운로드 → 파싱 → 저장 파이프라인
+
+    - 다운로드 단계(호출 측 스레드)는 submit_document()로 문서를 파싱 큐에 넣음
+      파싱 큐가 가득 차면 호출 스레드가 대기하므로 다운로드가 파싱보다 앞서 나가지 않음 (backpressure)
+    - 파싱 단계는 ProcessPoolExecutor에서 parser_module.parse를 실행하여 CPU 코어 수만큼 병렬 처리
+      동시에 처리 중인 문서 수도 제한하여 메모리 사용량을 일정하게 유지
+    - 저장 단계는 단일 스레드에서 write_fn을 호출하므로 저장/통계 갱신에 별도 동기화가 필요 없음
+    - 그룹(기업) 단위로 모든 항목이 저장되면 seal()에 등록한 콜백 호출
+    - parse_cache를 지정하면 원문/파서 버전이 같은 문서는 파싱 단계를 건너뛰고 캐시된 결과를 저장 단계로 전달
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Any, Optional[Dict], str], bool],
+        parse_workers: Optional[int] = None,
+        queue_size: Optional[int] = None,
+        warm_modules: Tuple[str, ...] = (),
+        parse_cache: Optional[ParseCache] = None
+    ):
+        """
+        Args:
+            write_fn: (항목, 파싱 결과 또는 None, 데이터 출처) → 저장 성공 여부
+            parse_workers: 파싱 프로세스 수 (기본값: CPU 코어 수)
+            queue_size: 단계 사이 큐 크기 (기본값: 파싱 프로세스 수의 2배)
+            warm_modules: 지정하면 시작할 때 작업자 프로세스를 모두 띄우고 이 파서 모듈들을 미리 import
+            parse_cache: 파싱 결과 캐시 (None이면 항상 파싱)
+        """
+        self.write_fn = write_fn
+        self.parse_cache = parse_cache
+        self.warm_modules = tuple(warm_modules)
+        self.parse_workers = parse_workers or os.cpu_count() or 1
+        queue_size = queue_size or self.parse_workers * 2
+
+        self._parse_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._write_queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._in_flight = threading.Semaphore(queue_size)
+
+        # 그룹별 진행 상황 (저장 스레드에서만 갱신)
+        self._groups: Dict[Hashable, Dict] = {}
+        self._groups_lock = threading.Lock()
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._feeder: Optional[threading.Thread] = None
+        self._writer: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'Pipeline':
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """파싱/저장 단계 시작"""
+        # 다운로드 스레드가 실행 중일 때 fork하지 않도록 spawn 방식으로 작업자 프로세스 생성
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context('spawn'),
+            initializer=_warm_worker,
+            initargs=(self.warm_modules,)
+        )
+        if self.warm_modules:
+            # 빈 작업을 작업자 수만큼 제출하여 프로세스를 미리 띄움
+            for future in [self._executor.submit(_noop) for _ in range(self.parse_workers)]:
+                future.result()
+        self._feeder = threading.Thread(target=self._feed_parsers, name='pipeline-parse', daemon=True)
+        self._writer = threading.Thread(target=self._write_results, name='pipeline-write', daemon=True)
+        self._feeder.start()
+        self._writer.start()
+
+    def submit_document(self, group: Hashable, item: Any, module_name: str, content: Any) -> None:
+        """
+        다운로드된 문서를 파싱 단계로 전달 (파싱 큐가 가득 차면 대기)
+
+        Args:
+            group: 항목이 속한 그룹 (예: 기업 고유번호)
+            item: 저장 단계에 그대로 전달할 항목 정보
+            module_name: 파서 모듈 이름 (예: 'parsers.parser_earnings')
+            content: 문서 바이트 또는 문자열
+        """
+        cache_key = None
+        if self.parse_cache is not None:
+            cache_key = self.parse_cache.key(content, module_name)
+            parsed = self.parse_cache.get(cache_key)
+            if parsed is not MISS:
+                self.submit_result(group, item, parsed, SOURCE_HTML)
+                return
+
+        self._count(group)
+        self._parse_queue.put((group, item, module_name, content, cache_key))
+
+    def submit_result(self, group: Hashable, item: Any, parsed: Optional[Dict], source: str) -> None:
+        """파싱이 필요 없는 결과(구조화 API 결과, 다운로드 실패 등)를 저장 단계로 바로 전달"""
+        self._count(group)
+        self._write_queue.put((group, item, parsed, source))
+
+    def seal(self, group: Hashable, on_done: Callable[[Hashable, Dict], None]) -> None:
+        """
+        그룹에 더 이상 항목이 추가되지 않음을 알림
+
+        그룹의 모든 항목이 저장되면 on_done(group, {'submitted', 'success', 'failed'}) 호출
+        (저장 스레드에서 호출됨)
+        """
+        with self._groups_lock:
+            progress = self._groups.setdefault(group, {'submitted': 0, 'success': 0, 'failed': 0})
+            progress['on_done'] = on_done
+            finished = progress['success'] + progress['failed'] == progress['submitted']
+
+        if finished:
+            self._finish_group(group)
+
+    def close(self) -> None:
+        """남은 항목을 모두 처리한 뒤 파이프라인 종료"""
+        if self._feeder is None:
+            return
+
+        self._parse_queue.put(_STOP)
+        self._feeder.join()
+        self._write_queue.put(_STOP)
+        self._writer.join()
+        self._feeder = None
+
+    def _count(self, group: Hashable) -> None:
+        with self._groups_lock:
+            progress = self._groups.setdefault(group, {'submitted': 0, 'success': 0, 'failed': 0})
+            progress['submitted'] += 1
+
+    def _feed_parsers(self) -> None:
+        """파싱 큐에서 문서를 꺼내 프로세스 풀에 제출 (처리 중인 문서 수 제한)"""
+        while True:
+            task = self._parse_queue.get()
+            if task is _STOP:
+                break
+
+            group, item, module_name, content, cache_key = task
+            self._in_flight.acquire()
+
+            try:
+                future = self._executor.submit(_parse_document, module_name, content)
+            except RuntimeError as e:
+                print(f"파싱 작업 제출 오류: {e}")
+                self._in_flight.release()
+                self._write_queue.put((group, item, None, SOURCE_HTML))
+                continue
+
+            future.add_done_callback(
+                lambda done, group=group, item=item, cache_key=cache_key: self._on_parsed(group, item, cache_key, done)
+            )
+
+        # 제출된 파싱 작업이 모두 끝날 때까지 대기
+        self._executor.shutdown(wait=True)
+
+    def _on_parsed(self, group: Hashable, item: Any, cache_key: Optional[str], future) -> None:
+        try:
+            parsed, worker_metrics = future.result()
+            metrics.merge(worker_metrics)
+        except Exception as e:
+            print(f"파싱 작업 오류: {e}")
+            parsed = None
+        else:
+            # 작업자 오류(프로세스 종료 등)나 제한 시간 초과가 아닌 결과만 캐시
+            if cache_key is not None and not _parse_timed_out(worker_metrics):
+                self.parse_cache.put(cache_key, parsed)
+
+        self._write_queue.put((group, item, parsed, SOURCE_HTML))
+        self._in_flight.release()
+
+    def _write_results(self) -> None:
+        """저장 큐의 결과를 순서대로 저장하고 그룹 진행 상황 갱신"""
+        while True:
+            task = self._write_queue.get()
+            if task is _STOP:
+                break
+
+            group, item, parsed, source = task
+            try:
+                success = self.write_fn(item, parsed, source)
+            except Exception as e:
+                print(f"저장 오류: {e}")
+                success = False
+
+            with self._groups_lock:
+                progress = self._groups[group]
+                progress['success' if success else 'failed'] += 1
+                finished = (
+                    'on_done' in progress
+                    and progress['success'] + progress['failed'] == progress['submitted']
+                )
+
+            if finished:
+                self._finish_group(group)
+
+    def _finish_group(self, group: Hashable) -> None:
+        with self._groups_lock:
+            progress = self._groups.pop(group, None)
+
+        if progress and progress.get('on_done'):
+            on_done = progress.pop('on_done')
+            on_done(group, progress)
@@ -0,0 +1,188 @@
+"""
+실행 매니페스트 모듈
+공시별 처리 단계(fetched → parsed → written)와 파서 버전 해시를 SQLite에 기록하여
+중단된 실행을 이어서 진행하고 이미 같은 결과가 저장된 공시는 건너뜀
+"""
+
+import glob
+import hashlib
+import importlib.util
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+
+# 처리 단계
+STATE_FETCHED = 'fetched'
+STATE_PARSED = 'parsed'
+STATE_WRITTEN = 'written'
+STATE_FAILED = 'failed'
+
+# 이 건수마다 커밋 (중단 시 마지막 커밋 이후 공시만 다시 처리)
+COMMIT_EVERY = 50
+
+_PARSER_PACKAGE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'parsers')
+
+_parser_versions: Dict[str, str] = {}
+_parser_versions_lock = threading.Lock()
+
+
+def content_hash(content: bytes) -> str:
+    """원문/입력 데이터 해시 (sha256)"""
+    return hashlib.sha256(content).hexdigest()
+
+
+def parser_version(module_name: str) -> str:
+    """
+    파서 버전 해시
+
+    파서 모듈 소스와 parsers 패키지의 공용 모듈(parser_*가 아닌 파일) 소스를 합쳐 해시하므로,
+    파서나 공용 헬퍼가 바뀌면 버전이 달라져 기존 결과를 다시 만듦
+
+    Args:
+        module_name: 파서 모듈 전체 이름 (예: 'parsers.parser_earnings')
+    """
+    with _parser_versions_lock:
+        if module_name in _parser_versions:
+            return _parser_versions[module_name]
+
+    spec = importlib.util.find_spec(module_name)
+    paths = [spec.origin] if spec and spec.origin else []
+    paths += sorted(
+        path for path in glob.glob(os.path.join(_PARSER_PACKAGE_DIR, '*.py'))
+        if not os.path.basename(path).startswith('parser_')
+    )
+
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(os.path.basename(path).encode('utf-8'))
+            digest.update(f.read())
+
+    version = digest.hexdigest()[:16]
+    with _parser_versions_lock:
+        _parser_versions[module_name] = version
+    return version
+
+
+def remove_stray_documents(output_dir: str) -> int:
+    """이전 버전이 출력 디렉토리에 남긴 임시 원문 파일({rcept_no}.xml) 삭제 (삭제한 파일 수 반환)"""
+    removed = 0
+    for path in glob.glob(os.path.join(output_dir, '*.xml')):
+        if os.path.basename(path)[:-4].isdigit():
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError as e:
+                print(f"임시 파일 삭제 오류 ({path}): {e}")
+    return removed
+
+
+class RunManifest:
+    """
+    공시별 처리 상태 저장소 (SQLite)
+
+    같은 공시를 다시 처리해도 같은 행을 덮어쓰므로(멱등) 중단 후 재실행해도 안전하며,
+    written 상태이고 파서 버전과 출력 형식이 같은 공시만 건너뜀
+    """
+
+    def __init__(self, path: str = '.dart_state/manifest.db'):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.executescript("""
+            CREATE TABLE IF NOT EXISTS filings (
+                rcept_no TEXT PRIMARY KEY,
+                corp_code TEXT NOT NULL DEFAULT '',
+                state TEXT NOT NULL,
+                parser TEXT NOT NULL DEFAULT '',
+                parser_version TEXT NOT NULL DEFAULT '',
+                sink TEXT NOT NULL DEFAULT '',
+                source TEXT NOT NULL DEFAULT '',
+                updated_at REAL NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS idx_filings_state ON filings(state);
+        """)
+
+    def __enter__(self) -> 'RunManifest':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def commit(self) -> None:
+        """쌓인 변경 사항 커밋"""
+        with self._lock:
+            self._conn.commit()
+            self._pending = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.commit()
+            self._conn.close()
+
+    def get(self, rcept_no: str) -> Optional[Dict]:
+        """공시의 처리 상태 조회"""
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM filings WHERE rcept_no = ?', (rcept_no,)).fetchone()
+        return dict(row) if row else None
+
+    def is_done(self, rcept_no: str, parser: str, sink: str) -> bool:
+        """
+        현재 파서 버전과 출력 형식으로 이미 저장된 공시인지 확인
+
+        원문을 받기 전에 확인하므로 원문 해시는 비교하지 않음
+        (같은 접수번호로 원문이 바뀐 공시를 다시 처리하려면 --no-resume)
+        """
+        entry = self.get(rcept_no)
+        return bool(
+            entry
+            and entry['state'] == STATE_WRITTEN
+            and entry['parser'] == parser
+            and entry['parser_version'] == parser_version(parser)
+            and entry['sink'] == sink
+        )
+
+    def mark_fetched(self, rcept_no: str, corp_code: str, parser: str) -> None:
+        """원문(또는 구조화 API 응답)을 받은 상태로 기록"""
+        self._upsert(rcept_no, STATE_FETCHED, corp_code=corp_code, parser=parser)
+
+    def mark_parsed(self, rcept_no: str, source: str) -> None:
+        self._upsert(rcept_no, STATE_PARSED, source=source)
+
+    def mark_written(self, rcept_no: str, sink: str) -> None:
+        """출력 저장 완료 (현재 파서 버전 기록)"""
+        entry = self.get(rcept_no)
+        parser = entry['parser'] if entry else ''
+        self._upsert(rcept_no, STATE_WRITTEN, sink=sink, parser_version=parser_version(parser) if parser else '')
+
+    def mark_failed(self, rcept_no: str) -> None:
+        self._upsert(rcept_no, STATE_FAILED)
+
+    def counts(self) -> Dict[str, int]:
+        """단계별 공시 수"""
+        with self._lock:
+            rows = self._conn.execute('SELECT state, COUNT(*) AS count FROM filings GROUP BY state').fetchall()
+        return {row['state']: row['count'] for row in rows}
+
+    def _upsert(self, rcept_no: str, state: str, **fields) -> None:
+        columns = ['state', 'updated_at'] + list(fields)
+        values = [state, time.time()] + list(fields.values())
+
+        with self._lock:
+            self._conn.execute(
+                f"INSERT INTO filings (rcept_no, {', '.join(columns)}) VALUES (?, {', '.join('?' * len(columns))}) "
+                f"ON CONFLICT(rcept_no) DO UPDATE SET {', '.join(f'{column} = excluded.{column}' for column in columns)}",
+                [rcept_no] + values
+            )
+            self._pending += 1
+            if self._pending >= COMMIT_EVERY:
+                self._conn.commit()
+                self._pending = 0
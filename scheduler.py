@@ -0,0 +1,110 @@
+"""
+다중 기업 작업 스케줄러
+기업별 작업 큐를 라운드로빈으로 번갈아 실행하여 공시가 많은 기업이 다른 기업을 굶기지 않도록 함
+"""
+
+from collections import OrderedDict, deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+# 작업 종류
+_LIST = 'list'
+_ITEM = 'item'
+
+
+class FairScheduler:
+    """
+    기업 단위 공정(round-robin) 스케줄러
+
+    각 기업의 첫 작업은 목록 조회(list_job)이며, 그 결과로 받은 항목들이 해당 기업의 큐에 쌓임
+    빈 작업 슬롯이 생길 때마다 큐가 비어 있지 않은 기업을 차례로 돌며 한 건씩 꺼내 실행하므로,
+    동시에 실행되는 작업 수는 workers 개로 제한되고 모든 기업이 고르게 진행됨
+    DART 호출 한도는 모든 작업이 공유하는 DartClient가 전역으로 관리
+    """
+
+    def __init__(
+        self,
+        workers: int = 8,
+        on_company_done: Optional[Callable[[str, Dict], None]] = None
+    ):
+        self.workers = max(1, workers)
+        self.on_company_done = on_company_done
+
+        self.progress: Dict[str, Dict] = {}
+
+    def run(
+        self,
+        companies: Iterable[str],
+        list_job: Callable[[str], Optional[List[Any]]],
+        item_job: Callable[[str, Any], bool]
+    ) -> Dict[str, Dict]:
+        """
+        모든 기업의 작업 실행
+
+        Args:
+            companies: 기업 고유번호 목록
+            list_job: 기업의 처리 대상 항목 목록을 반환하는 함수 (실패 시 None)
+            item_job: 항목 1건을 처리하고 성공 여부를 반환하는 함수
+
+        Returns:
+            기업별 진행 상황 {'total', 'done', 'success', 'failed', 'list_failed'}
+        """
+        # 기업별 대기 작업 큐 (삽입 순서를 라운드로빈 순서로 사용)
+        queues: 'OrderedDict[str, deque]' = OrderedDict()
+        for corp_code in companies:
+            queues[corp_code] = deque([(_LIST, None)])
+            self.progress[corp_code] = {
+                'total': 0,
+                'done': 0,
+                'success': 0,
+                'failed': 0,
+                'list_failed': False
+            }
+
+        in_flight: Dict[Future, tuple] = {}
+        running: Dict[str, int] = {corp_code: 0 for corp_code in queues}
+
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='dart-worker') as executor:
+            while queues or in_flight:
+                # 빈 슬롯을 기업별로 한 건씩 번갈아 채움
+                while len(in_flight) < self.workers and queues:
+                    corp_code, queue = next(iter(queues.items()))
+                    kind, item = queue.popleft()
+                    queues.move_to_end(corp_code)
+                    if not queue:
+                        del queues[corp_code]
+
+                    if kind == _LIST:
+                        future = executor.submit(list_job, corp_code)
+                    else:
+                        future = executor.submit(item_job, corp_code, item)
+                    in_flight[future] = (corp_code, kind)
+                    running[corp_code] += 1
+
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    corp_code, kind = in_flight.pop(future)
+                    running[corp_code] -= 1
+                    progress = self.progress[corp_code]
+
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        print(f"작업 오류 ({corp_code}): {e}")
+                        result = None if kind == _LIST else False
+
+                    if kind == _LIST:
+                        if result is None:
+                            progress['list_failed'] = True
+                        elif result:
+                            progress['total'] = len(result)
+                            queues.setdefault(corp_code, deque()).extend((_ITEM, item) for item in result)
+                    else:
+                        progress['done'] += 1
+                        progress['success' if result else 'failed'] += 1
+
+                    if running[corp_code] == 0 and corp_code not in queues and self.on_company_done:
+                        self.on_company_done(corp_code, dict(progress))
+
+        return self.progress
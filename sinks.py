@@ -0,0 +1,407 @@
+"""
+파싱 결과 출력 모듈
+공시별 JSON 파일(기본값), JSON Lines, SQLite, Parquet, MessagePack 중 하나로 결과를 저장
+
+파싱 결과는 딕셔너리 또는 to_dict()가 있는 결과 모델(parsers.models)이며,
+결과 모델은 직렬화 시점에만 저장용 딕셔너리로 변환
+"""
+
+import glob
+import json
+import os
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, Set
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet as pyarrow_parquet
+except ImportError:
+    pyarrow = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+# 선택 의존성 설치 명령 (requirements-optional.txt)
+OPTIONAL_INSTALL = "pip install -r requirements-optional.txt"
+
+# 묶음 저장 기본 크기 (건)
+DEFAULT_BATCH_SIZE = 500
+
+# 결과 행의 공시 메타데이터 컬럼
+RECORD_FIELDS = ('rcept_no', 'corp_code', 'corp_name', 'stock_code', 'report_nm', 'rcept_dt')
+
+
+def _default(obj):
+    """결과 모델 직렬화 (to_dict()로 저장용 딕셔너리 변환)"""
+    if hasattr(obj, 'to_dict'):
+        return obj.to_dict()
+    raise TypeError(f"직렬화할 수 없는 타입입니다: {type(obj).__name__}")
+
+
+def dumps(obj) -> bytes:
+    """한 줄 JSON 직렬화 (orjson이 있으면 사용, 없으면 json)"""
+    if orjson is not None:
+        # 데이터클래스를 필드 그대로 내보내지 않고 to_dict() 형식으로 직렬화
+        return orjson.dumps(obj, default=_default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':'), default=_default).encode('utf-8')
+
+
+def packb(obj) -> bytes:
+    """MessagePack 직렬화 (msgpack 필요)"""
+    return msgpack.packb(obj, default=_default, use_bin_type=True)
+
+
+def make_record(report: Dict, parsed_data: Dict, source: str) -> Dict:
+    """공시 목록 행과 파싱 결과를 저장용 레코드로 구성"""
+    record = {field: report.get(field, '') for field in RECORD_FIELDS}
+    record['source'] = source
+    record['data'] = parsed_data
+    return record
+
+
+class OutputSink(ABC):
+    """
+    출력 싱크 기본 클래스
+
+    write()로 받은 레코드를 batch_size 건마다 한 번에 기록하고, close()에서 남은 레코드를 기록
+    (하위 클래스는 exists/location/_write_batch 구현)
+    """
+
+    name = ''
+    # 필요한 선택 의존성 패키지 이름 (설치되지 않았으면 생성 시 ImportError)
+    requires: Optional[str] = None
+    # flush() 후 중단되어도 기록한 레코드를 읽을 수 있는지 (False면 close()까지 끝나야 보존됨)
+    durable_flush = True
+
+    def __init__(self, output_dir: str = 'output', batch_size: int = DEFAULT_BATCH_SIZE):
+        self.output_dir = output_dir
+        self.batch_size = max(1, batch_size)
+        os.makedirs(output_dir, exist_ok=True)
+
+        self._buffer: List[Dict] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> 'OutputSink':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, report: Dict, parsed_data: Dict, source: str) -> bool:
+        """결과 1건 추가 (묶음이 차면 기록)"""
+        with self._lock:
+            self._buffer.append(make_record(report, parsed_data, source))
+            if len(self._buffer) >= self.batch_size:
+                self._flush_locked()
+        return True
+
+    def flush(self) -> None:
+        """버퍼에 남은 레코드 기록"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        self.flush()
+
+    @abstractmethod
+    def exists(self, rcept_no: str) -> bool:
+        """이미 저장된 공시인지 확인 (증분 모드 건너뛰기용)"""
+
+    @abstractmethod
+    def location(self, rcept_no: str) -> str:
+        """저장 위치 표시 문자열"""
+
+    def _flush_locked(self) -> None:
+        if self._buffer:
+            self._write_batch(self._buffer)
+            self._buffer = []
+
+    @abstractmethod
+    def _write_batch(self, records: List[Dict]) -> None:
+        """레코드 묶음 기록 (락을 잡은 상태에서 호출됨)"""
+
+
+class JsonFileSink(OutputSink):
+    """공시별 JSON 파일 (output/{rcept_no}.json, indent=4)"""
+
+    name = 'json'
+
+    def __init__(self, output_dir: str = 'output', batch_size: int = 1):
+        super().__init__(output_dir, batch_size=1)
+
+    def write(self, report: Dict, parsed_data: Dict, source: str) -> bool:
+        # 버퍼 없이 바로 파일로 기록
+        self._write_batch([make_record(report, parsed_data, source)])
+        return True
+
+    def _write_batch(self, records: List[Dict]) -> None:
+        for record in records:
+            with open(self.location(record['rcept_no']), 'w', encoding='utf-8') as f:
+                json.dump(record['data'], f, ensure_ascii=False, indent=4, default=_default)
+
+    def exists(self, rcept_no: str) -> bool:
+        return os.path.exists(self.location(rcept_no))
+
+    def location(self, rcept_no: str) -> str:
+        return os.path.join(self.output_dir, f"{rcept_no}.json")
+
+
+class JsonLinesSink(OutputSink):
+    """추가 전용 JSON Lines 파일 (output/filings.jsonl, 한 줄에 공시 1건)"""
+
+    name = 'jsonl'
+
+    def __init__(self, output_dir: str = 'output', batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__(output_dir, batch_size)
+        self.path = os.path.join(output_dir, 'filings.jsonl')
+        self._saved: Optional[Set[str]] = None
+
+    def exists(self, rcept_no: str) -> bool:
+        with self._lock:
+            if self._saved is None:
+                self._saved = self._scan_saved()
+            return rcept_no in self._saved
+
+    def location(self, rcept_no: str) -> str:
+        return self.path
+
+    def _scan_saved(self) -> Set[str]:
+        saved = set()
+        if not os.path.exists(self.path):
+            return saved
+
+        with open(self.path, 'rb') as f:
+            for line in f:
+                try:
+                    saved.add(json.loads(line).get('rcept_no', ''))
+                except ValueError:
+                    continue
+        return saved
+
+    def _write_batch(self, records: List[Dict]) -> None:
+        with open(self.path, 'ab') as f:
+            f.write(b''.join(dumps(record) + b'\n' for record in records))
+
+        if self._saved is not None:
+            self._saved.update(record['rcept_no'] for record in records)
+
+
+class SQLiteSink(OutputSink):
+    """SQLite 테이블 (output/filings.db, 접수번호 기준 upsert)"""
+
+    name = 'sqlite'
+
+    def __init__(self, output_dir: str = 'output', batch_size: int = DEFAULT_BATCH_SIZE):
+        super().__init__(output_dir, batch_size)
+        self.path = os.path.join(output_dir, 'filings.db')
+
+        # 저장은 파이프라인 저장 스레드에서 수행되므로 스레드 검사 해제 (락으로 직렬화)
+        self.conn = sqlite3.connect(self.path, check_same_thread=False)
+        self.conn.execute('PRAGMA journal_mode=WAL')
+        self.conn.execute('PRAGMA synchronous=NORMAL')
+        self.conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS filings (
+                rcept_no TEXT PRIMARY KEY,
+                corp_code TEXT,
+                corp_name TEXT,
+                stock_code TEXT,
+                report_nm TEXT,
+                rcept_dt TEXT,
+                source TEXT,
+                data TEXT
+            )
+            """
+        )
+        self.conn.commit()
+
+    def close(self) -> None:
+        super().close()
+        with self._lock:
+            self.conn.close()
+
+    def exists(self, rcept_no: str) -> bool:
+        with self._lock:
+            row = self.conn.execute('SELECT 1 FROM filings WHERE rcept_no = ?', (rcept_no,)).fetchone()
+        return row is not None
+
+    def location(self, rcept_no: str) -> str:
+        return f"{self.path}#{rcept_no}"
+
+    def _write_batch(self, records: List[Dict]) -> None:
+        columns = RECORD_FIELDS + ('source', 'data')
+        rows = [
+            tuple(record[field] for field in RECORD_FIELDS) + (record['source'], dumps(record['data']).decode('utf-8'))
+            for record in records
+        ]
+
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT OR REPLACE INTO filings ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})",
+                rows
+            )
+
+
+class ParquetSink(OutputSink):
+    """
+    Parquet 파일 (output/filings-{실행시각}.parquet, 묶음마다 row group 1개)
+
+    파싱 결과는 보고서 유형마다 구조가 달라 data 컬럼에 JSON 문자열로 저장
+    pyarrow 필요 (pip install pyarrow)
+    """
+
+    name = 'parquet'
+    requires = 'pyarrow'
+    # row group을 기록해도 파일 끝 메타데이터는 close()에서 기록됨
+    durable_flush = False
+
+    def __init__(self, output_dir: str = 'output', batch_size: int = DEFAULT_BATCH_SIZE):
+        if pyarrow is None:
+            raise ImportError(f"Parquet 출력에는 pyarrow가 필요합니다. (pip install pyarrow 또는 {OPTIONAL_INSTALL})")
+
+        super().__init__(output_dir, batch_size)
+        self.path = os.path.join(output_dir, f"filings-{datetime.now().strftime('%Y%m%d%H%M%S')}.parquet")
+        self.schema = pyarrow.schema(
+            [(field, pyarrow.string()) for field in RECORD_FIELDS + ('source', 'data')]
+        )
+        self._writer = None
+        self._saved: Optional[Set[str]] = None
+
+    def close(self) -> None:
+        super().close()
+        with self._lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def exists(self, rcept_no: str) -> bool:
+        with self._lock:
+            if self._saved is None:
+                self._saved = set()
+                for path in glob.glob(os.path.join(self.output_dir, 'filings-*.parquet')):
+                    if path == self.path:
+                        continue
+                    try:
+                        table = pyarrow_parquet.read_table(path, columns=['rcept_no'])
+                    except Exception as e:
+                        print(f"Parquet 파일 읽기 오류 ({path}): {e}")
+                        continue
+                    self._saved.update(table.column('rcept_no').to_pylist())
+            return rcept_no in self._saved
+
+    def location(self, rcept_no: str) -> str:
+        return self.path
+
+    def _write_batch(self, records: List[Dict]) -> None:
+        columns = {field: [record[field] for record in records] for field in RECORD_FIELDS}
+        columns['source'] = [record['source'] for record in records]
+        columns['data'] = [dumps(record['data']).decode('utf-8') for record in records]
+
+        if self._writer is None:
+            self._writer = pyarrow_parquet.ParquetWriter(self.path, self.schema)
+        self._writer.write_table(pyarrow.table(columns, schema=self.schema))
+
+        if self._saved is not None:
+            self._saved.update(columns['rcept_no'])
+
+
+class MsgpackSink(OutputSink):
+    """
+    추가 전용 MessagePack 파일 (output/filings.msgpack, 레코드를 이어 붙인 스트림)
+
+    msgpack 필요 (pip install msgpack)
+    """
+
+    name = 'msgpack'
+    requires = 'msgpack'
+
+    def __init__(self, output_dir: str = 'output', batch_size: int = DEFAULT_BATCH_SIZE):
+        if msgpack is None:
+            raise ImportError(f"MessagePack 출력에는 msgpack이 필요합니다. (pip install msgpack 또는 {OPTIONAL_INSTALL})")
+
+        super().__init__(output_dir, batch_size)
+        self.path = os.path.join(output_dir, 'filings.msgpack')
+        self._saved: Optional[Set[str]] = None
+
+    def exists(self, rcept_no: str) -> bool:
+        with self._lock:
+            if self._saved is None:
+                self._saved = self._scan_saved()
+            return rcept_no in self._saved
+
+    def location(self, rcept_no: str) -> str:
+        return self.path
+
+    def _scan_saved(self) -> Set[str]:
+        saved = set()
+        if not os.path.exists(self.path):
+            return saved
+
+        with open(self.path, 'rb') as f:
+            try:
+                for record in msgpack.Unpacker(f, raw=False):
+                    saved.add(record.get('rcept_no', ''))
+            except (ValueError, msgpack.UnpackException) as e:
+                print(f"MessagePack 파일 읽기 오류 ({self.path}): {e}")
+        return saved
+
+    def _write_batch(self, records: List[Dict]) -> None:
+        with open(self.path, 'ab') as f:
+            f.write(b''.join(packb(record) for record in records))
+
+        if self._saved is not None:
+            self._saved.update(record['rcept_no'] for record in records)
+
+
+SINKS = {
+    sink.name: sink
+    for sink in (JsonFileSink, JsonLinesSink, SQLiteSink, ParquetSink, MsgpackSink)
+}
+
+
+def missing_dependency(name: str) -> Optional[str]:
+    """출력 형식에 필요한데 설치되지 않은 패키지 이름 (없으면 None)"""
+    sink_class = SINKS.get(name)
+    if sink_class is None or not sink_class.requires:
+        return None
+    installed = {'pyarrow': pyarrow is not None, 'msgpack': msgpack is not None}
+    return None if installed.get(sink_class.requires, True) else sink_class.requires
+
+
+def make_sink(name: str = 'json', output_dir: str = 'output', batch_size: int = DEFAULT_BATCH_SIZE) -> Optional[OutputSink]:
+    """
+    이름으로 출력 싱크 생성
+
+    Args:
+        name: 'json', 'jsonl', 'sqlite', 'parquet', 'msgpack'
+        output_dir: 출력 디렉토리
+        batch_size: 묶음 저장 크기 (json은 항상 1건씩 저장)
+
+    Returns:
+        OutputSink 또는 None (알 수 없는 이름, 선택 의존성 없음)
+    """
+    sink_class = SINKS.get(name)
+    if sink_class is None:
+        print(f"알 수 없는 출력 형식입니다: {name} (사용 가능: {', '.join(SINKS)})")
+        return None
+
+    missing = missing_dependency(name)
+    if missing:
+        print(f"출력 형식 '{name}'에는 {missing} 패키지가 필요합니다. (pip install {missing} 또는 {OPTIONAL_INSTALL})")
+        return None
+
+    try:
+        return sink_class(output_dir, batch_size)
+    except ImportError as e:
+        print(f"출력 싱크 생성 오류: {e}")
+        return None
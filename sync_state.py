@@ -0,0 +1,71 @@
+"""
+증분 동기화 상태 저장 모듈
+기업(corp_code)별로 마지막으로 처리한 공시의 접수일자/접수번호(워터마크)를 기록
+"""
+
+import json
+import os
+import tempfile
+import threading
+from typing import Dict, Optional
+
+
+class WatermarkStore:
+    """
+    기업별 워터마크 저장소 (JSON 파일)
+
+    접수번호는 접수일자(YYYYMMDD)로 시작하는 14자리 숫자이므로 문자열 비교로 선후를 판단
+    """
+
+    def __init__(self, path: str = '.dart_state/watermarks.json'):
+        self.path = path
+        self._lock = threading.Lock()
+        self._data: Dict[str, Dict] = {}
+
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+            except (OSError, ValueError) as e:
+                print(f"워터마크 로드 오류: {e}")
+
+    def get(self, corp_code: str) -> Optional[Dict]:
+        """
+        기업의 워터마크 조회
+
+        Returns:
+            {'rcept_dt': 'YYYYMMDD', 'rcept_no': '...'} 또는 None
+        """
+        with self._lock:
+            watermark = self._data.get(corp_code)
+            return dict(watermark) if watermark else None
+
+    def is_new(self, corp_code: str, rcept_no: str) -> bool:
+        """워터마크 이후에 접수된 공시인지 확인"""
+        watermark = self.get(corp_code)
+        return watermark is None or rcept_no > watermark['rcept_no']
+
+    def advance(self, corp_code: str, rcept_dt: str, rcept_no: str) -> None:
+        """워터마크를 앞으로만 이동 (이전 접수번호로는 되돌리지 않음)"""
+        with self._lock:
+            current = self._data.get(corp_code)
+            if current is None or rcept_no > current['rcept_no']:
+                self._data[corp_code] = {'rcept_dt': rcept_dt, 'rcept_no': rcept_no}
+
+    def save(self) -> None:
+        """상태 파일을 원자적으로 저장"""
+        with self._lock:
+            data = json.dumps(self._data, ensure_ascii=False, indent=2, sort_keys=True)
+
+        directory = os.path.dirname(self.path) or '.'
+        os.makedirs(directory, exist_ok=True)
+
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(data)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"워터마크 저장 오류: {e}")
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
@@ -0,0 +1,283 @@
+"""
+공시 감시 모듈
+list.json을 짧은 주기로 조회하여 새로 접수된 대상 공시를 바로 다운로드 → 파싱 → 저장하고
+접수일자/감지 시점부터 저장까지의 지연 시간을 기록
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+import dart_api
+import metrics
+from parse_cache import ParseCache
+from parsers import REPORT_PATTERNS, match_report
+from pipeline import SOURCE_DOWNLOAD_FAILED, Pipeline
+from run_manifest import RunManifest
+from sync_state import WatermarkStore
+
+# 조회 주기 기본값 (초)
+DEFAULT_POLL_INTERVAL = 30
+
+# 워터마크가 오래되었어도 이 기간(일) 이전 공시는 조회하지 않음
+WATCH_LOOKBACK_DAYS = 3
+
+# 이미 본 공시가 이만큼 연속되면 더 오래된 페이지는 조회하지 않음 (목록은 최신순)
+SEEN_RUN_TO_STOP = 100
+
+# 다운로드 실패 공시 재시도 횟수
+MAX_DOWNLOAD_ATTEMPTS = 3
+
+# 워터마크 저장 키 (기업별 워터마크와 같은 파일 사용)
+WATERMARK_KEY = '__watch__'
+
+# 지연 시간 히스토그램 구간 (초)
+LATENCY_BUCKETS = (1, 5, 15, 30, 60, 120, 300, 600, 1800, 3600, 3 * 3600, 6 * 3600, 12 * 3600, 24 * 3600)
+
+# DART 접수일자 기준 시간대
+KST = timezone(timedelta(hours=9))
+
+
+def rcept_dt_timestamp(rcept_dt: str) -> Optional[float]:
+    """접수일자(YYYYMMDD, 한국 시간) 0시의 epoch 초 (형식이 다르면 None)"""
+    try:
+        return datetime.strptime(rcept_dt, '%Y%m%d').replace(tzinfo=KST).timestamp()
+    except ValueError:
+        return None
+
+
+class FilingWatcher:
+    """
+    신규 공시 감시기
+
+    - 매 주기마다 워터마크 접수일자부터 오늘까지 전체 회사 공시 목록을 최신순으로 조회하고,
+      이미 본 공시가 한 페이지 분량 연속되면 조회를 멈춤
+      (다음 페이지를 미리 조회하지 않으므로 새 공시가 한 페이지를 넘지 않으면 주기당 list.json 1회 호출)
+    - 재시작하면 워터마크 접수일자의 목록을 한 번 다시 훑고, 매니페스트에 저장 완료로 기록되지 않은
+      대상 공시(중단 직전 처리 중이던 공시 포함)만 다시 처리
+    - 보고서명 패턴에 해당하는 처음 보는 공시만 다운로드 스레드로 보내고,
+      파싱은 미리 띄워 둔 프로세스 풀에서 바로 실행
+    - 저장 시점에 접수일자 기준 지연(dart_watch_publish_to_write_seconds)과
+      감지 시점 기준 지연(dart_watch_detect_to_write_seconds)을 기록
+      (DART 목록은 접수 시각을 제공하지 않으므로 접수일자 기준 지연은 당일 0시부터 계산)
+
+    새 공시는 재무제표 API에 아직 반영되지 않은 경우가 많아 감시 모드는 항상 HTML 파싱을 사용
+    """
+
+    def __init__(
+        self,
+        write_fn: Callable[[Dict, str, Optional[Dict], str], bool],
+        sink_name: str,
+        manifest: RunManifest,
+        watermarks: WatermarkStore,
+        companies: Optional[Iterable[str]] = None,
+        workers: int = 8,
+        parse_workers: Optional[int] = None,
+        metrics_path: Optional[str] = None,
+        parse_cache: Optional[ParseCache] = None
+    ):
+        """
+        Args:
+            write_fn: (공시, 보고서 유형, 파싱 결과 또는 None, 데이터 출처) → 저장 성공 여부
+            sink_name: 출력 싱크 이름 (매니페스트 기록용)
+            manifest: 실행 매니페스트
+            watermarks: 워터마크 저장소
+            companies: 지정하면 해당 고유번호의 공시만 처리
+            workers: 동시 다운로드 수
+            parse_workers: 파싱 프로세스 수
+            metrics_path: 지정하면 매 주기 지표 파일 갱신
+            parse_cache: 파싱 결과 캐시
+        """
+        self.write_fn = write_fn
+        self.sink_name = sink_name
+        self.manifest = manifest
+        self.watermarks = watermarks
+        self.companies: Optional[Set[str]] = set(companies) if companies else None
+        self.workers = workers
+        self.metrics_path = metrics_path
+
+        self.pipeline = Pipeline(
+            self._write,
+            parse_workers=parse_workers,
+            warm_modules=tuple(sorted({f"parsers.{module_name}" for _, _, module_name in REPORT_PATTERNS})),
+            parse_cache=parse_cache
+        )
+        self._downloads: Optional[ThreadPoolExecutor] = None
+
+        # 이번 실행에서 이미 본 접수번호, 다운로드 재시도 대기 공시
+        self._seen: Set[str] = set()
+        self._retry: Dict[str, Dict] = {}
+        # 지난 주기 목록이 중간에 끊겼으면 이미 본 공시가 이어져도 멈추지 않고 끝까지 조회
+        self._list_truncated = False
+
+        self.stats = {'polls': 0, 'dispatched': 0, 'success': 0, 'failed': 0}
+
+    def run(self, interval: float = DEFAULT_POLL_INTERVAL, max_polls: Optional[int] = None) -> Dict:
+        """
+        감시 시작 (Ctrl+C 또는 max_polls 회 조회 후 종료)
+
+        Returns:
+            처리 통계
+        """
+        self._downloads = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='dart-watch')
+        self.pipeline.start()
+
+        try:
+            while max_polls is None or self.stats['polls'] < max_polls:
+                started = time.monotonic()
+                self.poll()
+
+                if self.metrics_path:
+                    metrics.write(self.metrics_path)
+
+                if max_polls is not None and self.stats['polls'] >= max_polls:
+                    break
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            print("\n감시 중지 요청 - 진행 중인 공시를 마무리합니다.")
+        finally:
+            self._downloads.shutdown(wait=True)
+            self.pipeline.close()
+            self.watermarks.save()
+            if self.metrics_path:
+                metrics.write(self.metrics_path)
+
+        return self.stats
+
+    def poll(self) -> List[Dict]:
+        """
+        목록을 한 번 조회하여 새 대상 공시를 처리 단계로 보냄
+
+        Returns:
+            이번 주기에 보낸 공시 목록
+        """
+        self.stats['polls'] += 1
+        detected_at = time.time()
+
+        today = datetime.now(KST)
+        end_de = today.strftime('%Y%m%d')
+        begin_de = (today - timedelta(days=WATCH_LOOKBACK_DAYS - 1)).strftime('%Y%m%d')
+
+        watermark = self.watermarks.get(WATERMARK_KEY)
+        if watermark:
+            begin_de = min(end_de, max(begin_de, watermark['rcept_dt']))
+
+        # 조회 기간을 벗어난 접수번호는 잊음 (접수번호는 접수일자로 시작)
+        self._seen = {rcept_no for rcept_no in self._seen if rcept_no[:8] >= begin_de}
+
+        dispatched = []
+        newest = None
+        seen_run = 0
+
+        list_complete = True
+        with metrics.timer('dart_watch_poll_seconds'):
+            try:
+                for report in dart_api.iter_disclosures(None, begin_de, end_de, pblntf_ty=None, prefetch=False):
+                    rcept_no = report.get('rcept_no', '')
+                    if newest is None or rcept_no > newest.get('rcept_no', ''):
+                        newest = report
+
+                    if rcept_no in self._seen:
+                        seen_run += 1
+                        if seen_run >= SEEN_RUN_TO_STOP and not self._list_truncated:
+                            break
+                        continue
+
+                    seen_run = 0
+                    self._seen.add(rcept_no)
+
+                    if self.companies is not None and report.get('corp_code') not in self.companies:
+                        continue
+
+                    matched = match_report(report.get('report_nm', ''))
+                    if not matched or self.manifest.is_done(rcept_no, matched[1], self.sink_name):
+                        continue
+
+                    self.stats['dispatched'] += 1
+                    self._dispatch(report, matched[0], matched[1], detected_at)
+                    dispatched.append(report)
+            except dart_api.DisclosureListError as e:
+                # 목록 일부만 받았으므로 이번 주기에는 워터마크를 옮기지 않음 (다음 주기에 같은 구간을 다시 조회)
+                print(f"{e} - 이번 주기는 워터마크를 갱신하지 않습니다.")
+                list_complete = False
+
+        self._list_truncated = not list_complete
+
+        # 다운로드에 실패했던 공시 재시도
+        for rcept_no, retry in list(self._retry.items()):
+            del self._retry[rcept_no]
+            self._dispatch(retry['report'], retry['report_type'], retry['parser_name'], retry['detected_at'], retry['attempt'])
+
+        if newest and list_complete:
+            self.watermarks.advance(WATERMARK_KEY, newest.get('rcept_dt', ''), newest.get('rcept_no', ''))
+            self.watermarks.save()
+        self.manifest.commit()
+
+        metrics.inc('dart_watch_polls_total')
+        metrics.inc('dart_watch_dispatched_total', len(dispatched))
+        if dispatched:
+            print(f"[{datetime.now(KST).strftime('%H:%M:%S')}] 새 공시 {len(dispatched)}건 처리 시작")
+        return dispatched
+
+    def _dispatch(self, report: Dict, report_type: str, parser_name: str, detected_at: float, attempt: int = 1) -> None:
+        """다운로드 스레드로 보냄 (처리 통계의 dispatched는 공시당 한 번만 세므로 재시도는 세지 않음)"""
+        self._downloads.submit(self._fetch, report, report_type, parser_name, detected_at, attempt)
+
+    def _fetch(self, report: Dict, report_type: str, parser_name: str, detected_at: float, attempt: int) -> None:
+        """다운로드 단계: 공시 원문을 받아 파싱 단계로 전달"""
+        rcept_no = report.get('rcept_no', '')
+        target = (report, report_type, parser_name)
+
+        content = dart_api.get_disclosure_detail(rcept_no, raw=True)
+        if not content and attempt < MAX_DOWNLOAD_ATTEMPTS:
+            # 접수 직후에는 원문이 아직 준비되지 않았을 수 있으므로 다음 주기에 다시 시도
+            self._retry[rcept_no] = {
+                'report': report,
+                'report_type': report_type,
+                'parser_name': parser_name,
+                'detected_at': detected_at,
+                'attempt': attempt + 1
+            }
+            return
+
+        if content:
+            self.manifest.mark_fetched(rcept_no, report.get('corp_code', ''), parser_name)
+            self.pipeline.submit_document(rcept_no, target, parser_name, content)
+        else:
+            self.manifest.mark_failed(rcept_no)
+            self.pipeline.submit_result(rcept_no, target, None, SOURCE_DOWNLOAD_FAILED)
+
+        self.pipeline.seal(rcept_no, lambda _, progress: self._on_written(report, detected_at, progress))
+
+    def _write(self, target, parsed_data: Optional[Dict], source: str) -> bool:
+        """저장 단계: 결과 저장 및 매니페스트 기록"""
+        report, report_type, _ = target
+        rcept_no = report.get('rcept_no', '')
+        if parsed_data:
+            self.manifest.mark_parsed(rcept_no, source)
+
+        success = self.write_fn(report, report_type, parsed_data, source)
+        if success:
+            self.manifest.mark_written(rcept_no, self.sink_name)
+        else:
+            self.manifest.mark_failed(rcept_no)
+        return success
+
+    def _on_written(self, report: Dict, detected_at: float, progress: Dict) -> None:
+        """공시 1건 저장 완료 시 지연 시간 기록"""
+        if not progress['success']:
+            self.stats['failed'] += 1
+            return
+
+        self.stats['success'] += 1
+        now = time.time()
+
+        detect_latency = now - detected_at
+        metrics.observe('dart_watch_detect_to_write_seconds', detect_latency, buckets=LATENCY_BUCKETS)
+
+        published_at = rcept_dt_timestamp(report.get('rcept_dt', ''))
+        if published_at is not None:
+            metrics.observe('dart_watch_publish_to_write_seconds', max(0.0, now - published_at), buckets=LATENCY_BUCKETS)
+
+        print(f"    지연: 감지 후 {detect_latency:.1f}초 ({report.get('rcept_no', '')})")